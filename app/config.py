@@ -49,6 +49,7 @@ class CopilotSdkConfig:
     reasoning_effort: str = "medium"
     max_context_tokens: int = 100_000
     sdk_timeout: int = 120
+    license_cache_hours: int = 24  # 起動時のライセンス確認結果を再利用する時間（0 で毎回確認）
 
 
 @dataclass
@@ -176,6 +177,7 @@ def _dict_to_copilot_sdk_config(d: dict[str, Any]) -> CopilotSdkConfig:
         reasoning_effort=str(d.get("reasoning_effort", "medium")),
         max_context_tokens=int(d.get("max_context_tokens", 100_000)),
         sdk_timeout=int(d.get("sdk_timeout", 120)),
+        license_cache_hours=int(d.get("license_cache_hours", 24)),
     )
 
 
@@ -302,6 +304,7 @@ def _app_config_to_dict(config: AppConfig) -> dict[str, Any]:
             "reasoning_effort": config.copilot_sdk.reasoning_effort,
             "max_context_tokens": config.copilot_sdk.max_context_tokens,
             "sdk_timeout": config.copilot_sdk.sdk_timeout,
+            "license_cache_hours": config.copilot_sdk.license_cache_hours,
         },
         "workiq_mcp": {
             "enabled": config.workiq_mcp.enabled,
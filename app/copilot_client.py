@@ -10,6 +10,7 @@ import asyncio
 import json
 import logging
 import platform
+import re
 import shutil
 import subprocess
 import time
@@ -21,6 +22,12 @@ from copilot.session import SessionEventType
 from app.config import CopilotSdkConfig, WorkIQMcpConfig
 from app.i18n import get_language
 
+# orjson はインストールされていれば JSON パースに使用する（任意依存）
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # リトライ設定
@@ -85,6 +92,57 @@ def _diagnose_workiq_failure() -> None:
         )
 
 
+def _json_loads(data: str) -> Any:
+    """JSON をパースする。orjson があれば使用し、なければ標準 json を使う。
+
+    orjson.JSONDecodeError は json.JSONDecodeError のサブクラスのため、
+    呼び出し側は json.JSONDecodeError を捕捉すればよい。
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_json_response(raw_response: str, open_char: str, close_char: str) -> Any:
+    """LLM レスポンスから JSON を取り出してパースする。
+
+    レスポンスに余計なテキストが含まれる可能性を考慮し、
+    全体 → ```json``` ブロック → open_char〜close_char の最大範囲の順に試す。
+
+    Args:
+        raw_response: LLM の生レスポンス。
+        open_char: JSON の開始文字（"{" または "["）。
+        close_char: JSON の終了文字（"}" または "]"）。
+
+    Returns:
+        パース結果。いずれの方法でもパースできない場合は None。
+    """
+    # まず全体をパースしてみる
+    try:
+        return _json_loads(raw_response)
+    except json.JSONDecodeError:
+        pass
+
+    # JSON ブロックを抽出（```json ... ``` 形式）
+    json_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", raw_response, re.DOTALL)
+    if json_match:
+        try:
+            return _json_loads(json_match.group(1))
+        except json.JSONDecodeError:
+            pass
+
+    # 開始文字から終了文字までの最大範囲を抽出
+    start = raw_response.find(open_char)
+    end = raw_response.rfind(close_char)
+    if start != -1 and end > start:
+        try:
+            return _json_loads(raw_response[start : end + 1])
+        except json.JSONDecodeError:
+            pass
+
+    return None
+
+
 class CopilotClientWrapper:
     """Copilot SDK 呼び出しを集約するラッパークラス。
 
@@ -552,32 +610,54 @@ class CopilotClientWrapper:
             operation_name="クイズ採点",
         )
 
-        # JSON パース（レスポンスに余計なテキストが含まれる可能性を考慮）
-        try:
-            # まず全体をパースしてみる
-            return json.loads(raw_response)
-        except json.JSONDecodeError:
-            pass
+        result = _parse_json_response(raw_response, "{", "}")
+        if not isinstance(result, dict):
+            logger.error("採点レスポンスの JSON パースに失敗: %s", raw_response[:200])
+            raise ValueError(f"採点レスポンスの JSON パースに失敗しました: {raw_response[:200]}")
+        return result
 
-        # JSON ブロックを抽出（```json ... ``` 形式）
-        import re
-        json_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", raw_response, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
+    async def score_quiz_batch(self, scoring_prompt: str) -> list[dict[str, Any]]:
+        """複数トピックのクイズを 1 回の呼び出しで採点する。
 
-        # { から } までの最大範囲を抽出
-        brace_match = re.search(r"\{.*\}", raw_response, re.DOTALL)
-        if brace_match:
-            try:
-                return json.loads(brace_match.group(0))
-            except json.JSONDecodeError:
-                pass
+        採点プロンプトを送信し、JSON 配列レスポンスをパースして返す。
 
-        logger.error("採点レスポンスの JSON パースに失敗: %s", raw_response[:200])
-        raise ValueError(f"採点レスポンスの JSON パースに失敗しました: {raw_response[:200]}")
+        Args:
+            scoring_prompt: 複数トピック分の採点用プロンプト。
+
+        Returns:
+            トピックごとの採点結果辞書のリスト。各要素は score_quiz() の
+            戻り値のキーに加えて topic_key (str) を持つ。
+
+        Raises:
+            ValueError: JSON パースに失敗した場合。
+        """
+        if get_language() == "en":
+            system_prompt = (
+                "You are a quiz scoring system. "
+                "Output only a JSON array in the specified format. "
+                "Do not output any extra text."
+            )
+        else:
+            system_prompt = (
+                "あなたはクイズ採点システムです。"
+                "指定された形式の JSON 配列のみを出力してください。"
+                "余計なテキストは一切出力しないでください。"
+            )
+
+        raw_response = await self._send_prompt(
+            system_prompt,
+            scoring_prompt,
+            timeout=self._sdk_config.sdk_timeout,
+            operation_name="クイズ一括採点",
+        )
+
+        result = _parse_json_response(raw_response, "[", "]")
+        if not isinstance(result, list):
+            logger.error("一括採点レスポンスの JSON パースに失敗: %s", raw_response[:200])
+            raise ValueError(
+                f"一括採点レスポンスの JSON パースに失敗しました: {raw_response[:200]}"
+            )
+        return [item for item in result if isinstance(item, dict)]
 
     async def check_license(self) -> bool:
         """Copilot ライセンスの接続テストを行う。
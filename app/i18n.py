@@ -95,6 +95,7 @@ _STRINGS: dict[str, dict[str, str]] = {
         "wizard.gh_auth_timeout": "認証確認がタイムアウトしました",
         "wizard.gh_auth_check_failed": "認証確認に失敗: {error}",
         "wizard.copilot_license_ok": "Copilot ライセンス確認済み",
+        "wizard.copilot_license_ok_cached": "Copilot ライセンス確認済み（{checked_at} に確認）",
         "wizard.copilot_license_not_assigned": "Copilot ライセンスが割り当てられていません",
         "wizard.copilot_license_check_failed": "Copilot ライセンス確認に失敗: {error}",
         "wizard.folders_configured": "読み込み対象フォルダ: {count} 件設定済み",
@@ -161,7 +162,7 @@ _STRINGS: dict[str, dict[str, str]] = {
         "viewer.score_all": "まとめて採点する",
         "viewer.scoring": "採点中…",
         "viewer.scored": "採点済み",
-        "viewer.querying_sdk": "Copilot SDK に問い合わせ中…",
+        "viewer.scoring_batch": "採点中… {total} トピック",
         "viewer.scoring_progress": "採点中… トピック {idx}/{total}",
         "viewer.scoring_complete": "採点完了 ✅",
         "viewer.scoring_failed": "⚠️ 採点失敗: {err}",
@@ -226,9 +227,13 @@ _STRINGS: dict[str, dict[str, str]] = {
         "scorer.source_not_found": "（ソース資料が見つかりませんでした）",
         # クイズサーバー (quiz_server)
         "server.error_empty_body": "リクエストボディが空です",
+        "server.error_body_too_large": "リクエストボディが大きすぎます",
+        "server.error_length_required": "Content-Length ヘッダーが必要です",
+        "server.error_unsupported_media_type": "Content-Type は application/json を指定してください",
         "server.error_topic_key_required": "topic_key が必要です",
         "server.error_scorer_not_init": "採点機能が初期化されていません",
         "server.error_json_parse": "JSON パースエラー",
+        "server.error_invalid_request": "リクエストの形式が正しくありません",
         "server.error_scoring_failed": "採点に失敗しました: {error}",
         "server.error_retry_later": "あとで再度お試しください。",
         # Restart
@@ -316,6 +321,7 @@ _STRINGS: dict[str, dict[str, str]] = {
         "wizard.gh_auth_timeout": "Authentication check timed out",
         "wizard.gh_auth_check_failed": "Authentication check failed: {error}",
         "wizard.copilot_license_ok": "Copilot license verified",
+        "wizard.copilot_license_ok_cached": "Copilot license verified (checked at {checked_at})",
         "wizard.copilot_license_not_assigned": "Copilot license is not assigned",
         "wizard.copilot_license_check_failed": "Failed to check Copilot license: {error}",
         "wizard.folders_configured": "Target folders: {count} configured",
@@ -382,7 +388,7 @@ _STRINGS: dict[str, dict[str, str]] = {
         "viewer.score_all": "Score All",
         "viewer.scoring": "Scoring...",
         "viewer.scored": "Scored",
-        "viewer.querying_sdk": "Querying Copilot SDK...",
+        "viewer.scoring_batch": "Scoring {total} topics...",
         "viewer.scoring_progress": "Scoring... Topic {idx}/{total}",
         "viewer.scoring_complete": "Scoring complete ✅",
         "viewer.scoring_failed": "⚠️ Scoring failed: {err}",
@@ -447,9 +453,13 @@ _STRINGS: dict[str, dict[str, str]] = {
         "scorer.source_not_found": "(Source material not found)",
         # Quiz server
         "server.error_empty_body": "Request body is empty",
+        "server.error_body_too_large": "Request body is too large",
+        "server.error_length_required": "Content-Length header is required",
+        "server.error_unsupported_media_type": "Content-Type must be application/json",
         "server.error_topic_key_required": "topic_key is required",
         "server.error_scorer_not_init": "Scoring function is not initialized",
         "server.error_json_parse": "JSON parse error",
+        "server.error_invalid_request": "Invalid request format",
         "server.error_scoring_failed": "Scoring failed: {error}",
         "server.error_retry_later": "Please try again later.",
         # Restart
@@ -3,12 +3,15 @@
 Python 標準 logging + RotatingFileHandler を使用したログ出力設定。
 出力先は logs/app.log（自動作成）、5MB×5世代ローテーション。
 コンソール出力なし（GUI アプリのため）。
+ログ呼び出し元はキューに積むだけで、ファイル書き込みは専用スレッドが行う。
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 # ログ出力先ディレクトリ（アプリディレクトリ直下の logs/）
@@ -22,11 +25,16 @@ _BACKUP_COUNT = 5  # 5世代
 # ログフォーマット
 _LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
 
+# ファイル書き込みを担当するキューリスナー（setup_logging で開始）
+_listener: QueueListener | None = None
+
 
 def setup_logging(log_level: str = "INFO") -> None:
     """アプリケーション全体のログ設定を行う。
 
     RotatingFileHandler を使用し、logs/app.log に出力する。
+    ルートロガーには QueueHandler を設定し、ファイルへの書き込みは
+    QueueListener のスレッドで行う（スケジューラのワーカー等がディスク I/O で止まらない）。
     logs/ ディレクトリは自動作成される。
     コンソール（stdout）への出力は行わない。
 
@@ -43,7 +51,8 @@ def setup_logging(log_level: str = "INFO") -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # 既存のハンドラをクリア（多重登録防止）
+    # 既存のハンドラ・リスナーを停止してクリア（多重登録防止）
+    stop_logging()
     root_logger.handlers.clear()
 
     # RotatingFileHandler の設定
@@ -59,14 +68,36 @@ def setup_logging(log_level: str = "INFO") -> None:
     formatter = logging.Formatter(_LOG_FORMAT)
     file_handler.setFormatter(formatter)
 
-    # ルートロガーにハンドラを追加
-    root_logger.addHandler(file_handler)
+    # ルートロガーにはキューへ積むハンドラだけを追加し、
+    # ファイルへの書き込みはリスナーのスレッドに任せる
+    global _listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
 
     logging.getLogger(__name__).info(
         "ログ設定完了: level=%s, file=%s", log_level, _LOG_FILE
     )
 
 
+def stop_logging() -> None:
+    """キューリスナーを停止し、未書き込みのログをファイルへ出力する。
+
+    setup_logging 済みでなければ何もしない。プロセス終了時にも自動で呼ばれる。
+    """
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_logging)
+
+
 def get_log_file_path() -> str:
     """ログファイルのパスを返す。
 
@@ -23,7 +23,7 @@ from app import autostart
 from app import config as config_module
 from app.config import AppConfig
 from app.i18n import get_language, set_language, t
-from app.logger import get_log_file_path, setup_logging
+from app.logger import get_log_file_path, setup_logging, stop_logging
 from app.scheduler import Scheduler
 from app.settings_ui import open_settings
 from app.setup_wizard import run_wizard
@@ -317,8 +317,8 @@ def main() -> None:
     起動フロー:
     1. logger.setup_logging()
     2. config.load()
-    3. setup_wizard 呼び出し（TODO）
-    4. state_manager.load()
+    3. state_manager.load()
+    4. setup_wizard 呼び出し
     5. scheduler.start()
     6. pystray でシステムトレイ常駐
     """
@@ -341,15 +341,15 @@ def main() -> None:
         # 2.5. スタートアップ自動起動の状態を config に合わせる（best-effort）
         autostart.sync(_app_config.run_at_startup)
 
-        # 3. setup_wizard 呼び出し
-        if not run_wizard(_app_config):
-            logger.info("セットアップウィザードが中断されました。終了します。")
-            return
-
-        # 4. state_manager.load()
+        # 3. state_manager.load()（ウィザードがライセンス確認日時を参照する）
         _state_manager = StateManager()
         _state_manager.load()
 
+        # 4. setup_wizard 呼び出し
+        if not run_wizard(_app_config, state_manager=_state_manager):
+            logger.info("セットアップウィザードが中断されました。終了します。")
+            return
+
         # 5. scheduler.start()
         _scheduler = Scheduler()
         _scheduler.start(
@@ -402,6 +402,7 @@ def main() -> None:
         if _scheduler:
             _scheduler.stop()
         logger.info("アプリケーションを終了しました")
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -8,14 +8,45 @@
 from __future__ import annotations
 
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
 from app.i18n import t
-from app.utils import atomic_write
+from app.utils import append_text, atomic_write, atomic_write_bytes
 
 logger = logging.getLogger(__name__)
 
+# 追記のみで済ませるクイズ結果セクションの上限サイズ（文字数）
+# これを超える場合は全体をアトミックに書き直す
+_APPEND_FAST_PATH_MAX_CHARS = 64 * 1024
+
+# 解決済み絶対パスのキャッシュ（パス文字列 → resolve() 結果）
+# 解決結果自身もキーとして登録し、再解決を不要にする
+_resolved_cache: dict[str, Path] = {}
+
+
+def _resolve_cached(path: str | Path) -> Path:
+    """Path.resolve() の結果をキャッシュして返す。
+
+    相対パスはカレントディレクトリに依存するためキャッシュしない。
+
+    Args:
+        path: 解決するパス。
+
+    Returns:
+        解決済みの絶対パス。
+    """
+    key = str(path)
+    resolved = _resolved_cache.get(key)
+    if resolved is None:
+        p = Path(path)
+        resolved = p.resolve()
+        if p.is_absolute():
+            _resolved_cache[key] = resolved
+        _resolved_cache[str(resolved)] = resolved
+    return resolved
+
 
 def _determine_output_folder(
     input_folders: list[str],
@@ -41,11 +72,11 @@ def _determine_output_folder(
     """
     # 既存パスが有効かつ、現在の input_folders 配下であればそのまま使用
     if existing_output_path:
-        existing = Path(existing_output_path).resolve()
+        existing = _resolve_cached(existing_output_path)
         if existing.exists() and existing.is_dir():
             # input_folders が変更されていないか確認
             if input_folders:
-                current_base = Path(input_folders[0]).resolve()
+                current_base = _resolve_cached(input_folders[0])
                 if existing.parent == current_base:
                     logger.debug("既存の出力フォルダを使用: %s", existing)
                     return existing
@@ -69,16 +100,24 @@ def _determine_output_folder(
         base_dir.mkdir(parents=True, exist_ok=True)
 
     # 名前衝突チェック + 連番付与
-    candidate = base_dir / output_folder_name
-    if not candidate.exists():
+    # 既存の子エントリ名を 1 回の scandir で取得し、候補名の判定はメモリ上で行う
+    try:
+        with os.scandir(base_dir) as it:
+            existing_names = {entry.name for entry in it}
+    except FileNotFoundError:
+        existing_names = set()
+
+    if output_folder_name not in existing_names:
+        candidate = base_dir / output_folder_name
         candidate.mkdir(parents=True, exist_ok=True)
         logger.info("出力フォルダを作成: %s", candidate)
         return candidate
 
     # 衝突時: 連番を試行
     for i in range(2, 100):
-        candidate = base_dir / f"{output_folder_name}_{i}"
-        if not candidate.exists():
+        name = f"{output_folder_name}_{i}"
+        if name not in existing_names:
+            candidate = base_dir / name
             candidate.mkdir(parents=True, exist_ok=True)
             logger.info("出力フォルダを作成（連番）: %s", candidate)
             return candidate
@@ -107,23 +146,29 @@ def get_output_folder(
     folder = _determine_output_folder(
         input_folders, output_folder_name, existing_output_path
     )
-    return str(folder.resolve())
+    return str(_resolve_cached(folder))
 
 
-def _generate_filename(feature: str, now: datetime | None = None) -> str:
+def _generate_filename(
+    feature: str,
+    timestamp: str | None = None,
+    now: datetime | None = None,
+) -> str:
     """ブリーフィングのファイル名を生成する。
 
     Args:
         feature: "a" (最新情報) または "b" (復習・クイズ)。
-        now: 現在時刻。None の場合は datetime.now() を使用。
+        timestamp: 整形済みのタイムスタンプ（"%Y-%m-%d_%H%M%S"）。
+            連続して書き込む場合に呼び出し側で 1 回だけ整形して再利用する。
+        now: 現在時刻。timestamp と now がともに None の場合は datetime.now() を使用。
 
     Returns:
         ファイル名文字列。
     """
-    if now is None:
-        now = datetime.now()
-
-    timestamp = now.strftime("%Y-%m-%d_%H%M%S")
+    if timestamp is None:
+        if now is None:
+            now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d_%H%M%S")
 
     if feature == "a":
         return f"briefing_news_{timestamp}.md"
@@ -143,6 +188,7 @@ def write_briefing(
     output_folder: str,
     *,
     now: datetime | None = None,
+    timestamp: str | None = None,
 ) -> str:
     """ブリーフィング MD ファイルを出力フォルダに書き込む。
 
@@ -154,32 +200,39 @@ def write_briefing(
         feature: "a" (最新情報) または "b" (復習・クイズ)。
         output_folder: 出力フォルダのパス。
         now: 現在時刻（テスト用）。
+        timestamp: 整形済みのファイル名タイムスタンプ。指定時は now より優先する。
 
     Returns:
         書き込んだファイルの絶対パス。
     """
-    filename = _generate_filename(feature, now)
-    file_path = Path(output_folder) / filename
+    filename = _generate_filename(feature, timestamp, now)
+    # get_output_folder() の戻り値であれば解決済みのためキャッシュから取得される
+    file_path = _resolve_cached(output_folder) / filename
 
     # 出力フォルダが存在しない場合は作成
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
     atomic_write(file_path, content, create_backup=False)
     logger.info("ブリーフィング出力: %s", file_path)
-    return str(file_path.resolve())
+    return str(file_path)
 
 
 def append_quiz_result(
     briefing_file: str,
     result_section: str,
+    *,
+    create_backup: bool = False,
 ) -> None:
     """既存のブリーフィング MD ファイル末尾にクイズ結果セクションを追記する。
 
-    アトミック書き込みを使用する。
+    通常は末尾への追記のみを行う（追記分だけを書き込む）。
+    バックアップが必要な場合や追記内容が大きい場合は、
+    全体を読み込んでアトミック書き込みで書き直す。
 
     Args:
         briefing_file: 追記先のブリーフィング MD ファイルパス。
         result_section: 追記するクイズ結果セクションの MD テキスト。
+        create_backup: True の場合、書き直し前に .bak を作成する。
     """
     file_path = Path(briefing_file)
 
@@ -187,16 +240,32 @@ def append_quiz_result(
         logger.warning("追記先ファイルが存在しません: %s", file_path)
         return
 
+    if not create_backup and len(result_section) < _APPEND_FAST_PATH_MAX_CHARS:
+        try:
+            append_text(file_path, result_section)
+        except OSError as e:
+            logger.error("ファイル追記失敗: %s — %s", file_path, e)
+            return
+        logger.info("クイズ結果を追記: %s", file_path)
+        return
+
+    # バイト列のまま末尾改行を除去して連結する（デコード/エンコードを省く）
     try:
-        existing = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError) as e:
+        existing = file_path.read_bytes()
+    except OSError as e:
         logger.error("ファイル読み込み失敗: %s — %s", file_path, e)
         return
 
-    # 末尾に結果セクションを追加
-    updated = existing.rstrip("\n") + "\n\n" + result_section.strip() + "\n"
+    tail_end = len(existing)
+    while tail_end > 0 and existing[tail_end - 1] in b"\r\n":
+        tail_end -= 1
+    suffix = ("\n\n" + result_section.strip() + "\n").replace("\n", os.linesep)
 
-    atomic_write(file_path, updated, create_backup=False)
+    atomic_write_bytes(
+        file_path,
+        existing[:tail_end] + suffix.encode("utf-8"),
+        create_backup=create_backup,
+    )
     logger.info("クイズ結果を追記: %s", file_path)
 
 
@@ -234,19 +303,27 @@ def format_quiz_result_section(
     else:
         lines = [t("output.quiz_result_header", timestamp=timestamp)]
 
+    # トピックによらず一定の文言はループ前に 1 回だけ解決する
+    unknown_topic = t("output.unknown_topic")
+    if is_auto:
+        q1_unanswered = t("output.q1_unanswered")
+        q2_unanswered = t("output.q2_unanswered")
+    else:
+        q1_correct_msg = t("output.q1_correct")
+
     for r in results:
         pattern_emoji = r.get("pattern_emoji", "📘")
-        topic_title = r.get("topic_title", t("output.unknown_topic"))
+        topic_title = r.get("topic_title", unknown_topic)
         lines.append(f"### {pattern_emoji} {topic_title}")
 
         if is_auto:
-            lines.append(t("output.q1_unanswered"))
-            lines.append(t("output.q2_unanswered"))
+            lines.append(q1_unanswered)
+            lines.append(q2_unanswered)
         else:
             # Q1 結果
             q1_correct = r.get("q1_correct", False)
             if q1_correct:
-                lines.append(t("output.q1_correct"))
+                lines.append(q1_correct_msg)
             else:
                 q1_answer = r.get("q1_correct_answer", "")
                 lines.append(t("output.q1_incorrect", answer=q1_answer))
@@ -8,7 +8,7 @@ prompts/ フォルダ配下の .md ファイルからプロンプトテンプレ
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import date, datetime
 from functools import lru_cache
 from pathlib import Path
 
@@ -226,27 +226,36 @@ def build_quiz_schedule_info(state_manager: StateManager) -> str:
     Returns:
         クイズスケジュール情報テキスト。
     """
-    today = datetime.now().strftime("%Y-%m-%d")
-    due_topics: list[str] = []
-
-    for topic_key, entry in state_manager.state.quiz_history.items():
-        if entry.next_quiz_at and entry.next_quiz_at <= today:
-            last_result = ""
-            if entry.results:
-                last = entry.results[-1]
-                q1 = (
-                    t("main.q1_result_correct")
-                    if last.q1_correct
-                    else t("main.q1_result_incorrect")
-                )
-                last_result = t("main.last_result", q1=q1, q2=last.q2_evaluation)
-
-            due_topics.append(
-                f"- **{topic_key}** — Level {entry.level}, "
-                f"{t('main.interval', days=entry.interval_days)}, {last_result}"
+    today = date.today().isoformat()
+    due_keys = state_manager.get_due_quiz_keys(today)
+    if not due_keys:
+        return t("main.no_topics_due")
+
+    # 翻訳テンプレートはトピックごとに引かず、ループの前に1回だけ解決する
+    history = state_manager.state.quiz_history
+    interval_tmpl = t("main.interval")
+    last_result_tmpl = t("main.last_result")
+    correct, incorrect = t("main.q1_result_correct"), t("main.q1_result_incorrect")
+
+    lines = [t("main.topics_due_header")]
+    for topic_key in due_keys:
+        # quiz_history が StateManager を経由せずに変更された場合に備える
+        entry = history.get(topic_key)
+        if entry is None:
+            continue
+        last_result = ""
+        if entry.results:
+            last = entry.results[-1]
+            last_result = last_result_tmpl.format(
+                q1=correct if last.q1_correct else incorrect,
+                q2=last.q2_evaluation,
             )
 
-    if due_topics:
-        return t("main.topics_due_header") + "\n" + "\n".join(due_topics)
-    else:
+        lines.append(
+            f"- **{topic_key}** — Level {entry.level}, "
+            f"{interval_tmpl.format(days=entry.interval_days)}, {last_result}"
+        )
+
+    if len(lines) == 1:
         return t("main.no_topics_due")
+    return "\n".join(lines)
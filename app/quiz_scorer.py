@@ -8,11 +8,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import mmap
+import os
 import re
-from dataclasses import dataclass
+import string
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from app.config import AppConfig
 from app.copilot_client import CopilotClientWrapper
@@ -23,6 +28,25 @@ from app.state_manager import PendingQuiz, QuizResult, StateManager
 
 logger = logging.getLogger(__name__)
 
+# ブリーフィング MD 解析用の正規表現
+# topic_key マーカー / Quiz Results 見出し / Q1・Q2 見出し行頭を 1 パスで拾う
+_BRIEFING_TOKEN_PATTERN = (
+    r"(?P<marker><!--\s*topic_key:\s*(?P<key>.+?)\s*-->)"
+    r"|(?P<results>^## 📝 Quiz Results)"
+    r"|(?P<q1>^[ \t]*(?:#{1,4}\s+)?(?:\*\*)?(?i:q1)(?=[^\n]*\n))"
+    r"|(?P<q2>^[ \t]*(?:#{1,4}\s+)?(?:\*\*)?(?i:q2)(?P<q2_sep>(?![a-zA-Z0-9]))?)"
+)
+_QUESTION_HEADING_PATTERN = r"\s*\n\s*###\s*(Q[12]\b)"
+_BRIEFING_TOKEN_RE = re.compile(_BRIEFING_TOKEN_PATTERN, re.MULTILINE)
+_QUESTION_HEADING_RE = re.compile(_QUESTION_HEADING_PATTERN)
+
+# 大きなブリーフィングは mmap 上でバイト列パターンを使って解析する
+_BRIEFING_TOKEN_RE_BYTES = re.compile(
+    _BRIEFING_TOKEN_PATTERN.encode("utf-8"), re.MULTILINE
+)
+_QUESTION_HEADING_RE_BYTES = re.compile(_QUESTION_HEADING_PATTERN.encode("utf-8"))
+_MMAP_THRESHOLD_BYTES = 256 * 1024
+
 # 採点プロンプトテンプレート（仕様書 3.11 準拠）
 _SCORING_PROMPT_TEMPLATE = """\
 以下のクイズの採点を行ってください。
@@ -96,8 +120,140 @@ Evaluate the user's answers based on the source material and questions.
 }}
 """
 
+# 一括採点プロンプトテンプレート（トピックごとのブロック + 全体）
+_BATCH_SCORING_TOPIC_TEMPLATE = """\
+# トピック {index}: {topic_key}
 
-@dataclass
+## ソース資料
+{source_content}
+
+## Q1（4択）
+### 問題
+{q1_question_text}
+### ユーザーの選択
+{q1_user_choice}
+
+## Q2（記述）
+### 問題
+{q2_question_text}
+### ユーザーの回答
+{q2_user_answer}
+"""
+
+_BATCH_SCORING_PROMPT_TEMPLATE = """\
+以下の {count} 件のクイズの採点をまとめて行ってください。
+トピックごとに、ソース資料と問題文に基づいてユーザーの回答を評価してください。
+
+{topics}
+# 採点基準
+- Q1: 正解/不正解を判定し、正解の選択肢と解説を付けてください。
+- Q2:
+  - good: 核心的なポイントを正しく説明できている
+  - partial: 方向性は合っているが重要な要素が欠けている
+  - poor: 根本的に誤っている、または回答になっていない
+
+# 出力形式（JSON 配列のみ出力）
+トピックごとに 1 要素を、上記と同じ順序で出力してください。
+[
+  {{
+    "topic_key": "トピックの topic_key",
+    "q1_correct": true,
+    "q1_correct_answer": "B",
+    "q1_explanation": "解説文…",
+    "q2_evaluation": "good|partial|poor",
+    "q2_feedback": "フィードバックコメント"
+  }}
+]
+"""
+
+_BATCH_SCORING_TOPIC_TEMPLATE_EN = """\
+# Topic {index}: {topic_key}
+
+## Source Material
+{source_content}
+
+## Q1 (Multiple Choice)
+### Question
+{q1_question_text}
+### User's Choice
+{q1_user_choice}
+
+## Q2 (Free-form)
+### Question
+{q2_question_text}
+### User's Answer
+{q2_user_answer}
+"""
+
+_BATCH_SCORING_PROMPT_TEMPLATE_EN = """\
+Please score the following {count} quizzes together.
+For each topic, evaluate the user's answers based on its source material and questions.
+
+{topics}
+# Scoring Criteria
+- Q1: Determine correct/incorrect, and provide the correct choice with an explanation.
+- Q2:
+  - good: Correctly explains the core points
+  - partial: On the right track but missing important elements
+  - poor: Fundamentally wrong or not an answer
+
+# Output Format (JSON array only)
+Output one element per topic, in the same order as above.
+[
+  {{
+    "topic_key": "the topic's topic_key",
+    "q1_correct": true,
+    "q1_correct_answer": "B",
+    "q1_explanation": "Explanation text...",
+    "q2_evaluation": "good|partial|poor",
+    "q2_feedback": "Feedback comment"
+  }}
+]
+"""
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """str.format 形式のテンプレートを事前に解析し、埋め込み関数を返す。
+
+    プレースホルダの解析はここで 1 回だけ行い、呼び出しごとには
+    リテラル部分と値を連結するだけにする。``{{`` / ``}}`` のエスケープは
+    解析時に展開される。書式指定・変換指定には対応しない。
+
+    Args:
+        template: 名前付きプレースホルダのみを含むテンプレート文字列。
+
+    Returns:
+        キーワード引数で値を受け取り、埋め込み済み文字列を返す関数。
+
+    Raises:
+        ValueError: 位置引数・書式指定・変換指定を含む場合。
+    """
+    parts: list[tuple[str, str | None]] = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (not field_name or format_spec or conversion):
+            raise ValueError(f"未対応のプレースホルダです: {{{field_name}}}")
+        parts.append((literal, field_name))
+
+    def render(**kwargs: object) -> str:
+        out: list[str] = []
+        for literal, field_name in parts:
+            out.append(literal)
+            if field_name is not None:
+                out.append(str(kwargs[field_name]))
+        return "".join(out)
+
+    return render
+
+
+_render_scoring_prompt = _compile_template(_SCORING_PROMPT_TEMPLATE)
+_render_scoring_prompt_en = _compile_template(_SCORING_PROMPT_TEMPLATE_EN)
+_render_batch_topic = _compile_template(_BATCH_SCORING_TOPIC_TEMPLATE)
+_render_batch_topic_en = _compile_template(_BATCH_SCORING_TOPIC_TEMPLATE_EN)
+_render_batch_prompt = _compile_template(_BATCH_SCORING_PROMPT_TEMPLATE)
+_render_batch_prompt_en = _compile_template(_BATCH_SCORING_PROMPT_TEMPLATE_EN)
+
+
+@dataclass(slots=True)
 class QuizScoreResult:
     """1トピック分の採点結果。"""
 
@@ -113,7 +269,53 @@ class QuizScoreResult:
     level_change: str  # "upgrade" | "downgrade" | "same"
 
 
-def _read_source_content(topic_key: str, input_folders: list[str]) -> str:
+@dataclass
+class SourceFileIndex:
+    """入力フォルダ配下のファイルの索引（相対パス → 実ファイルパス）。
+
+    複数トピックを採点する際、トピックごとに全入力フォルダを
+    exists() で探索する代わりに、1 回の走査で作った索引を引く。
+    同じ相対パスが複数フォルダにある場合は input_folders の先頭側を優先する。
+    """
+
+    mapping: dict[str, Path] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, input_folders: list[str]) -> SourceFileIndex:
+        """input_folders を走査して索引を作成する。
+
+        Args:
+            input_folders: 入力フォルダパスのリスト。
+
+        Returns:
+            SourceFileIndex。
+        """
+        mapping: dict[str, Path] = {}
+        for folder in input_folders:
+            base = Path(folder)
+            for root, _dirs, files in os.walk(base):
+                root_path = Path(root)
+                for filename in files:
+                    file_path = root_path / filename
+                    rel_path = file_path.relative_to(base).as_posix()
+                    mapping.setdefault(rel_path, file_path)
+        return cls(mapping)
+
+    def get(self, file_relative: str) -> Path | None:
+        """相対パスに対応するファイルパスを返す。見つからなければ None。"""
+        return self.mapping.get(file_relative.replace("\\", "/"))
+
+
+def _source_relative_path(topic_key: str) -> str:
+    """topic_key からソース MD ファイルの相対パス部分を取り出す。"""
+    return topic_key.split("#")[0] if "#" in topic_key else topic_key
+
+
+def _read_source_content(
+    topic_key: str,
+    input_folders: list[str],
+    source_index: SourceFileIndex | None = None,
+) -> str:
     """topic_key からソース MD ファイルを読み込む。
 
     topic_key は "{ファイルの相対パス}#{セクション識別子}" 形式。
@@ -122,29 +324,173 @@ def _read_source_content(topic_key: str, input_folders: list[str]) -> str:
     Args:
         topic_key: トピックキー。
         input_folders: 入力フォルダパスのリスト。
+        source_index: 入力フォルダの索引。指定時はフォルダ探索の代わりに使用する。
 
     Returns:
         ソース MD ファイルの内容。読み込み失敗時は空文字列。
     """
     # topic_key からファイルパスを抽出
-    file_relative = topic_key.split("#")[0] if "#" in topic_key else topic_key
-
-    # input_folders 配下でファイルを探索
-    for folder in input_folders:
-        candidate = Path(folder) / file_relative
-        if candidate.exists() and candidate.is_file():
-            try:
-                content = candidate.read_text(encoding="utf-8")
-                logger.debug("ソース MD 読み込み: %s", candidate)
-                return content
-            except (OSError, UnicodeDecodeError) as e:
-                logger.warning("ソース MD 読み込み失敗: %s — %s", candidate, e)
-                return ""
+    file_relative = _source_relative_path(topic_key)
+
+    # 索引があれば探索せずに特定し、なければ input_folders 配下を探索
+    if source_index is not None:
+        candidate = source_index.get(file_relative)
+    else:
+        candidate = next(
+            (
+                c
+                for c in (Path(folder) / file_relative for folder in input_folders)
+                if c.is_file()
+            ),
+            None,
+        )
+
+    if candidate is not None:
+        try:
+            content = candidate.read_text(encoding="utf-8")
+            logger.debug("ソース MD 読み込み: %s", candidate)
+            return content
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("ソース MD 読み込み失敗: %s — %s", candidate, e)
+            return ""
 
     logger.warning("ソース MD が見つかりません: %s", file_relative)
     return ""
 
 
+@dataclass(frozen=True)
+class _TopicSpans:
+    """ブリーフィング MD 内の 1 トピック分の位置情報（文字またはバイトオフセット）。"""
+
+    section: tuple[int, int]
+    q1: tuple[int, int] | None
+    q2: tuple[int, int] | None
+
+
+def _first_at_or_after(positions: list[int], start: int, end: int) -> int | None:
+    """ソート済み positions のうち [start, end) に入る最初の値を返す。"""
+    i = bisect_left(positions, start)
+    if i < len(positions) and positions[i] < end:
+        return positions[i]
+    return None
+
+
+@lru_cache(maxsize=8)
+def _index_briefing(content: str) -> dict[str, _TopicSpans]:
+    """ブリーフィング MD 内のトピックと Q1/Q2 の位置を一括で索引化する。
+
+    マーカー・Quiz Results 見出し・Q1/Q2 見出しを 1 回の走査で収集し、
+    トピックごとの設問範囲と Q1/Q2 の範囲を求める。設問範囲はマーカー
+    直後から、次のトピックマーカー（Q1/Q2 見出し直前のマーカーは除く）
+    または Quiz Results セクションの手前までとする。同じ topic_key が
+    複数回出現する場合は最初のマーカーを採用する。
+
+    Q1 は範囲内で最初の Q1 見出しから次の Q2 見出しの手前まで、
+    Q2 は範囲内で最初の Q2 見出しから範囲の終わりまでとする。
+
+    同一ブリーフィングに対する複数トピックの抽出で再走査しないよう、
+    内容文字列をキーにキャッシュする。戻り値は変更しないこと。
+
+    Args:
+        content: ブリーフィング MD テキスト。
+
+    Returns:
+        topic_key → _TopicSpans の辞書。
+    """
+    return _build_briefing_index(content, _BRIEFING_TOKEN_RE, _QUESTION_HEADING_RE)
+
+
+@lru_cache(maxsize=8)
+def _index_briefing_file(path: str, mtime_ns: int, size: int) -> dict[str, _TopicSpans]:
+    """大きなブリーフィング MD を mmap してバイトオフセットで索引化する。
+
+    mtime_ns / size はキャッシュキーとしてのみ使用し、ファイル更新時に
+    索引を作り直す。
+
+    Args:
+        path: ブリーフィング MD ファイルパス。
+        mtime_ns: ファイルの更新時刻（ナノ秒）。
+        size: ファイルサイズ（バイト）。
+
+    Returns:
+        topic_key → _TopicSpans（バイトオフセット）の辞書。
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _build_briefing_index(
+            mm, _BRIEFING_TOKEN_RE_BYTES, _QUESTION_HEADING_RE_BYTES
+        )
+
+
+def _build_briefing_index(
+    content: Any,
+    token_re: re.Pattern[Any],
+    heading_re: re.Pattern[Any],
+) -> dict[str, _TopicSpans]:
+    """_index_briefing() / _index_briefing_file() の共通実装。
+
+    content は str、またはバイト列として読める bytes / mmap を受け付ける。
+    オフセットは content の単位（文字またはバイト）で返す。
+    """
+    newline = "\n" if isinstance(content, str) else b"\n"
+
+    markers: list[re.Match[Any]] = []
+    results_starts: list[int] = []
+    q1_starts: list[int] = []
+    q2_starts: list[int] = []  # Q2 見出し（行末に改行があるもの）
+    q1_stops: list[int] = []  # Q1 の終端となる Q2（直後が英数字でないもの）
+    for m in token_re.finditer(content):
+        kind = m.lastgroup
+        if kind == "marker":
+            markers.append(m)
+        elif kind == "results":
+            results_starts.append(m.start())
+        elif kind == "q1":
+            q1_starts.append(m.start())
+        else:
+            if content.find(newline, m.end()) != -1:
+                q2_starts.append(m.start())
+            if m.group("q2_sep") is not None:
+                q1_stops.append(m.start())
+
+    # トピック境界となるマーカー（Q1/Q2 見出し直前のものを除く）の開始位置
+    # （LLM が Q1/Q2 に個別マーカーを付ける場合がある）
+    boundaries = [
+        m.start()
+        for m in markers
+        if not heading_re.match(content, m.end())
+    ]
+
+    index: dict[str, _TopicSpans] = {}
+    for m in markers:
+        key = m.group("key")
+        if not isinstance(key, str):
+            key = key.decode("utf-8", errors="replace")
+        if key in index:
+            continue
+        start = m.end()
+        end = len(content)
+        boundary = _first_at_or_after(boundaries, start, end)
+        if boundary is not None:
+            end = boundary
+        results_start = _first_at_or_after(results_starts, start, end)
+        if results_start is not None:
+            end = results_start
+
+        q1: tuple[int, int] | None = None
+        q1_start = _first_at_or_after(q1_starts, start, end)
+        if q1_start is not None:
+            q1_end = _first_at_or_after(q1_stops, q1_start, end)
+            q1 = (q1_start, end if q1_end is None else q1_end)
+
+        q2: tuple[int, int] | None = None
+        q2_start = _first_at_or_after(q2_starts, start, end)
+        if q2_start is not None:
+            q2 = (q2_start, end)
+
+        index[key] = _TopicSpans(section=(start, end), q1=q1, q2=q2)
+    return index
+
+
 def _extract_quiz_questions(
     briefing_content: str,
     topic_key: str,
@@ -158,107 +504,96 @@ def _extract_quiz_questions(
     Returns:
         (Q1 問題文+選択肢, Q2 問題文) のタプル。
     """
-    # topic_key コメントの位置を特定
-    topic_pattern = re.escape(topic_key)
-    marker = re.search(
-        rf"<!--\s*topic_key:\s*{topic_pattern}\s*-->",
-        briefing_content,
-    )
-
-    if not marker:
+    spans = _index_briefing(briefing_content).get(topic_key)
+    if spans is None:
         logger.warning("topic_key が見つかりません: %s", topic_key)
         return ("", "")
 
-    # マーカー以降のテキストを取得
-    section_text = briefing_content[marker.end() :]
+    q1_text = ""
+    q2_text = ""
+    if spans.q1 is not None:
+        q1_text = briefing_content[spans.q1[0] : spans.q1[1]].strip()
+    if spans.q2 is not None:
+        q2_text = briefing_content[spans.q2[0] : spans.q2[1]].strip()
 
-    # Quiz Results セクションがあればそこで区切る
-    results_marker = re.search(r"^## 📝 Quiz Results", section_text, re.MULTILINE)
-    if results_marker:
-        section_text = section_text[: results_marker.start()]
+    return (q1_text, q2_text)
 
-    # 次の topic_key マーカーまでを対象範囲とするが、
-    # Q1/Q2 見出し直前のマーカーはスキップして範囲に含める
-    # （LLM が Q1/Q2 に個別マーカーを付ける場合がある）
-    search_pos = 0
-    while True:
-        next_marker = re.search(
-            r"<!--\s*topic_key:\s*(.+?)\s*-->",
-            section_text[search_pos:],
-        )
-        if not next_marker:
-            break
-        # マーカー直後の ### 行を確認
-        after_marker = section_text[search_pos + next_marker.end():]
-        heading_match = re.match(r"\s*\n\s*###\s*(Q[12]\b)", after_marker)
-        if heading_match:
-            # Q1/Q2 見出しなのでスキップして続行
-            search_pos += next_marker.end()
-            continue
-        # 別トピックのマーカー → ここで区切る
-        section_text = section_text[: search_pos + next_marker.start()]
-        break
 
-    # Q1 と Q2 を分割
-    q1_text = ""
-    q2_text = ""
+def _load_quiz_questions(briefing_file: str, topic_key: str) -> tuple[str, str]:
+    """ブリーフィング MD ファイルからトピックの Q1/Q2 問題文を抽出する。
 
-    # Q1 を探す（「Q1」「**Q1**」「## Q1」「### Q1」等のパターン）
-    q1_match = re.search(
-        r"(?:^|\n)\s*(?:#{1,4}\s+)?(?:\*\*)?Q1[^\n]*\n(.*?)(?=(?:\n\s*(?:#{1,4}\s+)?(?:\*\*)?Q2[^a-zA-Z0-9])|$)",
-        section_text,
-        re.DOTALL | re.IGNORECASE,
-    )
-    if q1_match:
-        q1_text = q1_match.group(0).strip()
-
-    # Q2 を探す
-    q2_match = re.search(
-        r"(?:^|\n)\s*(?:#{1,4}\s+)?(?:\*\*)?Q2[^\n]*\n(.*?)$",
-        section_text,
-        re.DOTALL | re.IGNORECASE,
-    )
-    if q2_match:
-        q2_text = q2_match.group(0).strip()
+    _MMAP_THRESHOLD_BYTES 以上のファイルは全体を str に読み込まず、
+    mmap 上で索引化して該当トピックの Q1/Q2 部分だけをデコードする。
 
-    return (q1_text, q2_text)
+    Args:
+        briefing_file: ブリーフィング MD ファイルパス。
+        topic_key: トピックキー。
 
+    Returns:
+        (Q1 問題文+選択肢, Q2 問題文) のタプル。読み込み失敗時は ("", "")。
+    """
+    try:
+        st = os.stat(briefing_file)
+        if st.st_size < _MMAP_THRESHOLD_BYTES:
+            content = Path(briefing_file).read_text(encoding="utf-8")
+            return _extract_quiz_questions(content, topic_key)
 
-async def _score_topic(
-    copilot_client: CopilotClientWrapper,
+        spans = _index_briefing_file(briefing_file, st.st_mtime_ns, st.st_size).get(
+            topic_key
+        )
+        if spans is None:
+            logger.warning("topic_key が見つかりません: %s", topic_key)
+            return ("", "")
+
+        with open(briefing_file, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            texts = [
+                ""
+                if span is None
+                else mm[span[0] : span[1]]
+                .decode("utf-8")
+                .replace("\r\n", "\n")
+                .strip()
+                for span in (spans.q1, spans.q2)
+            ]
+        return (texts[0], texts[1])
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        logger.warning("ブリーフィング MD 読み込み失敗: %s — %s", briefing_file, e)
+        return ("", "")
+
+
+def _prepare_scoring_fields(
     topic_key: str,
     q1_choice: str,
     q2_answer: str,
     briefing_file: str,
     input_folders: list[str],
-) -> dict[str, Any]:
-    """1トピックの採点を Copilot SDK 経由で行う。
+    *,
+    source_content: str | None = None,
+) -> dict[str, str]:
+    """採点プロンプトに埋め込む 1 トピック分の値を組み立てる。
 
     Args:
-        copilot_client: Copilot クライアントラッパー。
         topic_key: トピックキー。
         q1_choice: ユーザーの Q1 選択（A/B/C/D）。
         q2_answer: ユーザーの Q2 回答テキスト。
         briefing_file: ブリーフィング MD ファイルパス。
         input_folders: 入力フォルダリスト。
+        source_content: 先読み済みのソース MD 内容。None の場合はここで読み込む。
 
     Returns:
-        採点結果辞書。
+        採点プロンプトテンプレートの埋め込み値の辞書。
     """
     # ソース MD 読み込み
-    source_content = _read_source_content(topic_key, input_folders)
+    if source_content is None:
+        source_content = _read_source_content(topic_key, input_folders)
     if not source_content:
         source_content = t("scorer.source_not_found")
 
     # ブリーフィング MD から問題文を抽出
-    briefing_content = ""
-    try:
-        briefing_content = Path(briefing_file).read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError) as e:
-        logger.warning("ブリーフィング MD 読み込み失敗: %s — %s", briefing_file, e)
-
-    q1_question_text, q2_question_text = _extract_quiz_questions(
-        briefing_content, topic_key
+    q1_question_text, q2_question_text = _load_quiz_questions(
+        briefing_file, topic_key
     )
 
     if not q1_question_text:
@@ -266,19 +601,55 @@ async def _score_topic(
     if not q2_question_text:
         q2_question_text = t("scorer.question_extraction_failed")
 
-    # 採点プロンプト構築
-    template = (
-        _SCORING_PROMPT_TEMPLATE_EN if get_language() == "en"
-        else _SCORING_PROMPT_TEMPLATE
-    )
-    scoring_prompt = template.format(
+    return {
+        "source_content": source_content,
+        "q1_question_text": q1_question_text,
+        "q1_user_choice": q1_choice,
+        "q2_question_text": q2_question_text,
+        "q2_user_answer": q2_answer,
+    }
+
+
+async def _score_topic(
+    copilot_client: CopilotClientWrapper,
+    topic_key: str,
+    q1_choice: str,
+    q2_answer: str,
+    briefing_file: str,
+    input_folders: list[str],
+    *,
+    source_content: str | None = None,
+) -> dict[str, Any]:
+    """1トピックの採点を Copilot SDK 経由で行う。
+
+    Args:
+        copilot_client: Copilot クライアントラッパー。
+        topic_key: トピックキー。
+        q1_choice: ユーザーの Q1 選択（A/B/C/D）。
+        q2_answer: ユーザーの Q2 回答テキスト。
+        briefing_file: ブリーフィング MD ファイルパス。
+        input_folders: 入力フォルダリスト。
+        source_content: 先読み済みのソース MD 内容。None の場合はここで読み込む。
+
+    Returns:
+        採点結果辞書。
+    """
+    fields = _prepare_scoring_fields(
+        topic_key,
+        q1_choice,
+        q2_answer,
+        briefing_file,
+        input_folders,
         source_content=source_content,
-        q1_question_text=q1_question_text,
-        q1_user_choice=q1_choice,
-        q2_question_text=q2_question_text,
-        q2_user_answer=q2_answer,
     )
 
+    # 採点プロンプト構築
+    render = (
+        _render_scoring_prompt_en if get_language() == "en"
+        else _render_scoring_prompt
+    )
+    scoring_prompt = render(**fields)
+
     # Copilot SDK で採点
     result = await copilot_client.score_quiz(scoring_prompt)
     return result
@@ -293,6 +664,7 @@ def score(
     copilot_client: CopilotClientWrapper,
     state_manager: StateManager,
     app_config: AppConfig,
+    now: datetime | None = None,
 ) -> QuizScoreResult:
     """1トピックの Q1+Q2 を一括採点し、結果を反映する。
 
@@ -306,6 +678,7 @@ def score(
         copilot_client: Copilot クライアントラッパー。
         state_manager: 状態マネージャ。
         app_config: アプリケーション設定。
+        now: 基準日時。None の場合は datetime.now() を使用。
 
     Returns:
         QuizScoreResult。
@@ -313,83 +686,203 @@ def score(
     Raises:
         Exception: 採点に失敗した場合。
     """
-    logger.info("採点開始: %s", topic_key)
-
-    # 非同期で採点を実行
-    scoring_result = asyncio.run(
-        _score_topic(
-            copilot_client,
+    return asyncio.run(
+        score_async(
             topic_key,
             q1_choice,
             q2_answer,
             briefing_file,
-            app_config.input_folders,
+            copilot_client=copilot_client,
+            state_manager=state_manager,
+            app_config=app_config,
+            now=now,
         )
     )
 
-    q1_correct = bool(scoring_result.get("q1_correct", False))
-    q1_correct_answer = str(scoring_result.get("q1_correct_answer", ""))
-    q1_explanation = str(scoring_result.get("q1_explanation", ""))
-    q2_evaluation = str(scoring_result.get("q2_evaluation", "poor"))
-    q2_feedback = str(scoring_result.get("q2_feedback", ""))
 
-    # 間隔反復の更新
-    sr_config = app_config.quiz.spaced_repetition
-    now = datetime.now()
+async def score_async(
+    topic_key: str,
+    q1_choice: str,
+    q2_answer: str,
+    briefing_file: str,
+    *,
+    copilot_client: CopilotClientWrapper,
+    state_manager: StateManager,
+    app_config: AppConfig,
+    now: datetime | None = None,
+) -> QuizScoreResult:
+    """score() の非同期版。既存のイベントループ内で使用する。
 
-    sr_update = update_after_scoring(
-        state_manager, topic_key, q1_correct, q2_evaluation, sr_config, now=now
-    )
+    複数トピックをまとめて採点する場合は score_many_async() を使用する。
 
-    new_level = int(sr_update["new_level"])
-    new_interval_days = int(sr_update["new_interval_days"])
-    next_quiz_at = str(sr_update["next_quiz_at"])
-    level_change = str(sr_update["level_change"])
+    Args:
+        topic_key: トピックキー。
+        q1_choice: ユーザーの Q1 選択。
+        q2_answer: ユーザーの Q2 回答テキスト。
+        briefing_file: ブリーフィング MD ファイルパス。
+        copilot_client: Copilot クライアントラッパー。
+        state_manager: 状態マネージャ。
+        app_config: アプリケーション設定。
+        now: 基準日時。None の場合は datetime.now() を使用。
 
-    # pending_quizzes を取得して pattern を特定
-    pending = state_manager.remove_pending_quiz(topic_key)
-    pattern = pending.pattern if pending else "learning"
+    Returns:
+        QuizScoreResult。
+    """
+    if now is None:
+        now = datetime.now()
 
-    # quiz_history に結果を記録
-    quiz_result = QuizResult(
-        date=now.strftime("%Y-%m-%d"),
-        q1_correct=q1_correct,
-        q2_evaluation=q2_evaluation,
-        pattern=pattern,
+    return await _score_and_record(
+        topic_key,
+        q1_choice,
+        q2_answer,
+        briefing_file,
+        copilot_client=copilot_client,
+        state_manager=state_manager,
+        app_config=app_config,
+        now=now,
+        today_str=now.strftime("%Y-%m-%d"),
     )
-    state_manager.update_quiz_history(
-        topic_key=topic_key,
-        result=quiz_result,
-        new_level=new_level,
-        new_interval_days=new_interval_days,
-        next_quiz_at=next_quiz_at,
+
+
+async def score_many_async(
+    answers: list[dict[str, str]],
+    briefing_file: str,
+    *,
+    copilot_client: CopilotClientWrapper,
+    state_manager: StateManager,
+    app_config: AppConfig,
+    now: datetime | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> list[QuizScoreResult]:
+    """同じブリーフィングの複数トピックを 1 回の Copilot 呼び出しで採点する。
+
+    全トピック分の問題と回答を 1 つのプロンプトにまとめて送信し、
+    JSON 配列の採点結果をトピックごとに反映する。state.json の保存は
+    最後に 1 回だけ行う。応答に含まれなかったトピックは個別に採点する。
+
+    Args:
+        answers: トピックごとの回答リスト。各要素は
+            {"topic_key": ..., "q1_choice": ..., "q2_answer": ...}。
+        briefing_file: ブリーフィング MD ファイルパス。
+        copilot_client: Copilot クライアントラッパー。
+        state_manager: 状態マネージャ。
+        app_config: アプリケーション設定。
+        now: 基準日時。None の場合は datetime.now() を使用。
+        on_progress: 個別採点に切り替えたトピックの採点開始前に
+            (index, total) で呼ばれるコールバック。
+
+    Returns:
+        answers と同じ順序の QuizScoreResult リスト。
+    """
+    if not answers:
+        return []
+
+    if now is None:
+        now = datetime.now()
+    today_str = now.strftime("%Y-%m-%d")
+
+    sources = await _prefetch_sources(answers, app_config.input_folders)
+    fields_list = [
+        _prepare_scoring_fields(
+            a["topic_key"],
+            a.get("q1_choice", ""),
+            a.get("q2_answer", ""),
+            briefing_file,
+            app_config.input_folders,
+            source_content=sources[_source_relative_path(a["topic_key"])],
+        )
+        for a in answers
+    ]
+
+    # 一括採点プロンプト構築
+    is_en = get_language() == "en"
+    render_topic = _render_batch_topic_en if is_en else _render_batch_topic
+    render_batch = _render_batch_prompt_en if is_en else _render_batch_prompt
+    topics_text = "\n".join(
+        render_topic(index=i + 1, topic_key=a["topic_key"], **fields)
+        for i, (a, fields) in enumerate(zip(answers, fields_list))
     )
+    scoring_prompt = render_batch(count=len(answers), topics=topics_text)
+
+    logger.info("一括採点開始: %d トピック", len(answers))
+    batch_results = await copilot_client.score_quiz_batch(scoring_prompt)
+
+    # topic_key で突き合わせる（欠けている場合は順序で対応付ける）
+    by_key = {
+        str(r.get("topic_key", "")): r for r in batch_results if r.get("topic_key")
+    }
+
+    results: list[QuizScoreResult] = []
+    for i, a in enumerate(answers):
+        topic_key = a["topic_key"]
+        scoring_result = by_key.get(topic_key)
+        if scoring_result is None and not by_key and i < len(batch_results):
+            scoring_result = batch_results[i]
+        if scoring_result is None:
+            logger.warning("一括採点の結果にトピックがないため個別採点します: %s", topic_key)
+            if on_progress is not None:
+                on_progress(i, len(answers))
+            scoring_result = await _score_topic(
+                copilot_client,
+                topic_key,
+                a.get("q1_choice", ""),
+                a.get("q2_answer", ""),
+                briefing_file,
+                app_config.input_folders,
+                source_content=sources[_source_relative_path(topic_key)],
+            )
+        results.append(
+            _record_scoring_result(
+                topic_key,
+                scoring_result,
+                state_manager=state_manager,
+                app_config=app_config,
+                now=now,
+                today_str=today_str,
+                save=False,
+            )
+        )
+
     state_manager.save()
+    return results
 
-    logger.info(
-        "採点完了: %s — Q1=%s, Q2=%s, Level→%d (%s)",
-        topic_key,
-        q1_correct,
-        q2_evaluation,
-        new_level,
-        level_change,
-    )
 
-    return QuizScoreResult(
-        topic_key=topic_key,
-        q1_correct=q1_correct,
-        q1_correct_answer=q1_correct_answer,
-        q1_explanation=q1_explanation,
-        q2_evaluation=q2_evaluation,
-        q2_feedback=q2_feedback,
-        new_level=new_level,
-        new_interval_days=new_interval_days,
-        next_quiz_at=next_quiz_at,
-        level_change=level_change,
+async def _prefetch_sources(
+    answers: list[dict[str, str]],
+    input_folders: list[str],
+) -> dict[str, str]:
+    """回答対象トピックのソース MD をスレッドで並行して先読みする。
+
+    同じファイルを参照する複数トピックがあっても 1 回だけ読み込む。
+
+    Args:
+        answers: トピックごとの回答リスト（topic_key を含む）。
+        input_folders: 入力フォルダリスト。
+
+    Returns:
+        ソース MD の相対パス → 内容の辞書。
+    """
+    source_paths = list(
+        dict.fromkeys(_source_relative_path(a["topic_key"]) for a in answers)
     )
+    # 複数ファイルを探す場合は入力フォルダを 1 回だけ走査して索引を引く
+    source_index = (
+        await asyncio.to_thread(SourceFileIndex.build, input_folders)
+        if len(source_paths) > 1
+        else None
+    )
+    source_contents = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                _read_source_content, path, input_folders, source_index
+            )
+            for path in source_paths
+        )
+    )
+    return dict(zip(source_paths, source_contents))
 
 
-async def score_async(
+async def _score_and_record(
     topic_key: str,
     q1_choice: str,
     q2_answer: str,
@@ -398,11 +891,11 @@ async def score_async(
     copilot_client: CopilotClientWrapper,
     state_manager: StateManager,
     app_config: AppConfig,
+    now: datetime,
+    today_str: str,
+    source_content: str | None = None,
 ) -> QuizScoreResult:
-    """score() の非同期版。既存のイベントループ内で使用する。
-
-    複数トピックをまとめて採点する際、ひとつの asyncio.run() 内で
-    繰り返し呼び出すために使用する。
+    """1トピックを採点し、間隔反復と quiz_history に反映する。
 
     Args:
         topic_key: トピックキー。
@@ -412,11 +905,14 @@ async def score_async(
         copilot_client: Copilot クライアントラッパー。
         state_manager: 状態マネージャ。
         app_config: アプリケーション設定。
+        now: 基準日時。
+        today_str: now の日付文字列（YYYY-MM-DD）。
+        source_content: 先読み済みのソース MD 内容。
 
     Returns:
         QuizScoreResult。
     """
-    logger.info("採点開始 (async): %s", topic_key)
+    logger.info("採点開始: %s", topic_key)
 
     scoring_result = await _score_topic(
         copilot_client,
@@ -425,8 +921,43 @@ async def score_async(
         q2_answer,
         briefing_file,
         app_config.input_folders,
+        source_content=source_content,
     )
 
+    return _record_scoring_result(
+        topic_key,
+        scoring_result,
+        state_manager=state_manager,
+        app_config=app_config,
+        now=now,
+        today_str=today_str,
+    )
+
+
+def _record_scoring_result(
+    topic_key: str,
+    scoring_result: dict[str, Any],
+    *,
+    state_manager: StateManager,
+    app_config: AppConfig,
+    now: datetime,
+    today_str: str,
+    save: bool = True,
+) -> QuizScoreResult:
+    """採点結果を間隔反復と quiz_history に反映する。
+
+    Args:
+        topic_key: トピックキー。
+        scoring_result: Copilot SDK から返された採点結果辞書。
+        state_manager: 状態マネージャ。
+        app_config: アプリケーション設定。
+        now: 基準日時。
+        today_str: now の日付文字列（YYYY-MM-DD）。
+        save: True の場合、反映後に state.json を保存する。
+
+    Returns:
+        QuizScoreResult。
+    """
     q1_correct = bool(scoring_result.get("q1_correct", False))
     q1_correct_answer = str(scoring_result.get("q1_correct_answer", ""))
     q1_explanation = str(scoring_result.get("q1_explanation", ""))
@@ -435,7 +966,6 @@ async def score_async(
 
     # 間隔反復の更新
     sr_config = app_config.quiz.spaced_repetition
-    now = datetime.now()
 
     sr_update = update_after_scoring(
         state_manager, topic_key, q1_correct, q2_evaluation, sr_config, now=now
@@ -452,7 +982,7 @@ async def score_async(
 
     # quiz_history に結果を記録
     quiz_result = QuizResult(
-        date=now.strftime("%Y-%m-%d"),
+        date=today_str,
         q1_correct=q1_correct,
         q2_evaluation=q2_evaluation,
         pattern=pattern,
@@ -464,10 +994,11 @@ async def score_async(
         new_interval_days=new_interval_days,
         next_quiz_at=next_quiz_at,
     )
-    state_manager.save()
+    if save:
+        state_manager.save()
 
     logger.info(
-        "採点完了 (async): %s — Q1=%s, Q2=%s, Level→%d (%s)",
+        "採点完了: %s — Q1=%s, Q2=%s, Level→%d (%s)",
         topic_key,
         q1_correct,
         q2_evaluation,
@@ -489,6 +1020,29 @@ async def score_async(
     )
 
 
+_PATTERN_EMOJI: dict[str, str] = {"learning": "📘"}
+
+
+def _title_from_key(topic_key: str) -> str:
+    """topic_key から短いタイトル（最後の ``#`` 以降）を取り出す。
+
+    ``rpartition`` は区切りが無い場合も末尾要素に元の文字列を返すため、
+    分岐せず 1 回の走査で済む。
+
+    Args:
+        topic_key: トピックキー。
+
+    Returns:
+        タイトル文字列。
+    """
+    return topic_key.rpartition("#")[2]
+
+
+def _pattern_emoji(pattern: str) -> str:
+    """出題パターンに対応する絵文字を返す（learning 以外は 📗）。"""
+    return _PATTERN_EMOJI.get(pattern, "📗")
+
+
 def build_result_item(
     result: QuizScoreResult,
     pending: PendingQuiz | None = None,
@@ -502,11 +1056,8 @@ def build_result_item(
     Returns:
         結果辞書。
     """
-    pattern = pending.pattern if pending else "learning"
-    pattern_emoji = "📘" if pattern == "learning" else "📗"
-
-    # topic_key から短いタイトルを生成
-    topic_title = result.topic_key.split("#")[-1] if "#" in result.topic_key else result.topic_key
+    pattern_emoji = _pattern_emoji(pending.pattern if pending else "learning")
+    topic_title = _title_from_key(result.topic_key)
 
     # レベル変動テキスト
     if result.level_change == "upgrade":
@@ -598,12 +1149,8 @@ def process_unanswered(
             result_items.append(
                 {
                     "topic_key": pq.topic_key,
-                    "topic_title": (
-                        pq.topic_key.split("#")[-1]
-                        if "#" in pq.topic_key
-                        else pq.topic_key
-                    ),
-                    "pattern_emoji": "📘" if pq.pattern == "learning" else "📗",
+                    "topic_title": _title_from_key(pq.topic_key),
+                    "pattern_emoji": _pattern_emoji(pq.pattern),
                     "next_quiz_info": t("scorer.next_quiz_info", date=next_quiz_at, detail=t("scorer.level_downgrade", level=new_level)),
                 }
             )
@@ -2,6 +2,7 @@
 
 127.0.0.1 のランダムポートで HTTP サーバーをデーモンスレッドで起動し、
 POST /quiz/submit でクイズ回答を受け付けて quiz_scorer で採点する。
+リクエストは接続ごとのスレッドで処理するため、採点中でも他の回答を受け付けられる。
 """
 
 from __future__ import annotations
@@ -9,10 +10,14 @@ from __future__ import annotations
 import json
 import logging
 import threading
-
-from app.i18n import t
-from functools import partial
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import time
+
+from app.i18n import get_language, t
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
+from functools import lru_cache, partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
@@ -20,112 +25,379 @@ if TYPE_CHECKING:
     from app.copilot_client import CopilotClientWrapper
     from app.state_manager import StateManager
 
+# orjson はインストールされていれば JSON の読み書きに使用する（任意依存）
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# リクエストボディの上限（これを超える Content-Length は読み込む前に 413 で拒否する）。
+# 回答 JSON は topic_key・選択肢・記述回答・ファイルパス程度なので 64 KiB で十分。
+_MAX_BODY_BYTES = 64 * 1024
+
+# keep-alive 接続をアイドル状態で保持する秒数（超えるとスレッドごと解放する）
+_KEEP_ALIVE_TIMEOUT = 30.0
+
+# 同時に実行する採点（Copilot 呼び出し）の上限
+_MAX_CONCURRENT_SCORING = 4
+
+# 同一内容の再送（ブラウザのリトライ等）に採点結果を使い回す期間と保持件数
+_REPLAY_TTL_SECONDS = 60.0
+_REPLAY_CACHE_SIZE = 256
+
+
+def _json_loads(body: bytes | bytearray) -> Any:
+    """リクエストボディ（UTF-8 バイト列）を JSON としてパースする。
+
+    orjson はバイト列を直接受け取れるため、decode を挟まない。
+    orjson.JSONDecodeError は json.JSONDecodeError のサブクラスなので、
+    呼び出し側は json.JSONDecodeError を捕捉すればよい。
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """辞書またはデータクラスを UTF-8 の JSON バイト列にシリアライズする。
+
+    orjson はデータクラスのフィールドを直接シリアライズできるため、
+    中間の辞書を作らない。標準 json の場合のみ asdict() で変換する。
+    標準 json では非 ASCII 文字を ``\\uXXXX`` にエスケープした ASCII のみの
+    文字列を生成し、コードポイントごとの UTF-8 エンコードを避ける。
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    if is_dataclass(data):
+        data = asdict(data)
+    return json.dumps(data, separators=(",", ":")).encode("ascii")
+
+
+def _has_failed(future: Future[Any]) -> bool:
+    """Future が例外終了または取り消し済みかどうかを返す。"""
+    return future.done() and (future.cancelled() or future.exception() is not None)
+
+
+@lru_cache(maxsize=None)
+def _error_body(key: str, language: str) -> bytes:
+    """固定文言のエラーレスポンス本文（JSON バイト列）を返す。
+
+    言語コードをキャッシュキーに含めるため、言語切り替え後は
+    新しい言語の文言で作り直される。
+
+    Args:
+        key: i18n キー。
+        language: 呼び出し時点の言語コード（get_language() の値）。
+
+    Returns:
+        ``{"error": ...}`` をシリアライズしたバイト列。
+    """
+    return _json_dumps({"error": t(key)})
+
+
+# 全レスポンス共通のヘッダーはモジュール読み込み時にバイト列として組み立てておく
+_CORS_HEADERS = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+)
+_PREFLIGHT_HEADERS = _CORS_HEADERS + b"Content-Length: 0\r\n"
+_JSON_HEADERS = b"Content-Type: application/json; charset=utf-8\r\n" + _CORS_HEADERS
+
+
+@dataclass(frozen=True, slots=True)
+class _QuizSubmitRequest:
+    """POST /quiz/submit のリクエストボディ。"""
+
+    topic_key: str = ""
+    q1_choice: str = ""
+    q2_answer: str = ""
+    briefing_file: str = ""
+
+    @classmethod
+    def from_json(cls, data: Any) -> _QuizSubmitRequest | None:
+        """パース済み JSON から生成する。
+
+        Args:
+            data: JSON をパースした値。
+
+        Returns:
+            生成したリクエスト。オブジェクトでない場合や、
+            いずれかのフィールドが文字列でない場合は None。
+        """
+        if not isinstance(data, dict):
+            return None
+        topic_key = data.get("topic_key", "")
+        q1_choice = data.get("q1_choice", "")
+        q2_answer = data.get("q2_answer", "")
+        briefing_file = data.get("briefing_file", "")
+        if not (
+            isinstance(topic_key, str)
+            and isinstance(q1_choice, str)
+            and isinstance(q2_answer, str)
+            and isinstance(briefing_file, str)
+        ):
+            return None
+        return cls(topic_key, q1_choice, q2_answer, briefing_file)
+
+
+# POST のパス → ハンドラメソッド名
+_POST_ROUTES: dict[str, str] = {
+    "/quiz/submit": "_handle_quiz_submit",
+}
+
 
 class _QuizRequestHandler(BaseHTTPRequestHandler):
     """クイズ回答を受け付ける HTTP リクエストハンドラ。"""
 
-    # score_func はサーバー生成時に注入される
-    score_func: Callable[..., Any] | None = None
-    copilot_client: CopilotClientWrapper | None = None
-    state_manager: StateManager | None = None
-    app_config: AppConfig | None = None
+    # プリフライトと POST を同じ接続で送れるよう keep-alive を有効にする。
+    # 全レスポンスで Content-Length を明示しているため HTTP/1.1 で応答できる。
+    protocol_version = "HTTP/1.1"
+    timeout = _KEEP_ALIVE_TIMEOUT
+    # 小さな JSON レスポンスが Nagle アルゴリズムで遅延しないようにする
+    disable_nagle_algorithm = True
+
+    # 採点関数はサーバーインスタンスが保持する
+    server: _QuizHTTPServer
 
     def log_message(self, format: str, *args: Any) -> None:
-        """ログ出力を Python logging に統合する。"""
-        logger.debug("QuizServer: %s", format % args)
+        """ログ出力を Python logging に統合する。
+
+        フォーマットは logging に委ね、DEBUG 無効時は文字列を組み立てない。
+        """
+        logger.debug("QuizServer: " + format, *args)
+
+    def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+        """アクセスログを DEBUG 有効時のみ出力する。"""
+        if logger.isEnabledFor(logging.DEBUG):
+            super().log_request(code, size)
 
     def do_OPTIONS(self) -> None:  # noqa: N802
         """CORS プリフライトリクエストに対応する。"""
-        self.send_response(200)
-        self._set_cors_headers()
-        self.end_headers()
+        self._send_response_block(200, _PREFLIGHT_HEADERS)
 
     def do_POST(self) -> None:  # noqa: N802
-        """POST リクエストを処理する。"""
-        if self.path == "/quiz/submit":
-            self._handle_quiz_submit()
-        else:
+        """POST リクエストをパス（クエリ文字列を除く）でルーティングする。"""
+        handler_name = _POST_ROUTES.get(self.path.partition("?")[0])
+        if handler_name is None:
             self.send_error(404, "Not Found")
+            return
+        getattr(self, handler_name)()
 
-    def _set_cors_headers(self) -> None:
-        """CORS ヘッダーを設定する。"""
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+    def _send_response_block(
+        self, status: int, header_block: bytes, body: bytes = b""
+    ) -> None:
+        """ステータス行・ヘッダー・本文を 1 回の write で送信する。
+
+        send_header() を 1 行ずつ呼ばず、send_response() と同じステータス行と
+        Server/Date ヘッダーに組み立て済みのヘッダー列と本文を連結し、
+        wfile へ直接書き出す。
+
+        Args:
+            status: HTTP ステータスコード。
+            header_block: CRLF 区切りのヘッダー行を連結したバイト列。
+            body: レスポンス本文。
+        """
+        self.log_request(status)
+        reason = self.responses.get(status, ("",))[0]
+        parts = [
+            f"{self.protocol_version} {status} {reason}\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Date: {self.date_time_string()}\r\n".encode("latin-1"),
+            header_block,
+        ]
+        if self.close_connection:
+            parts.append(b"Connection: close\r\n")
+        parts.append(b"\r\n")
+        parts.append(body)
+        self.wfile.write(b"".join(parts))
 
     def _handle_quiz_submit(self) -> None:
         """クイズ回答を受け付けて採点する。"""
         try:
-            # リクエストボディの読み込み
-            content_length = int(self.headers.get("Content-Length", 0))
+            # Content-Length は ASCII 数字のみ受け付ける（符号・空白・全角数字は不可）
+            raw_length = self.headers.get("Content-Length")
+            if raw_length is None or not (raw_length.isascii() and raw_length.isdigit()):
+                self.close_connection = True
+                self._send_error_body(411, "server.error_length_required")
+                return
+
+            # JSON 以外（フォーム送信など）はプリフライト不要の単純リクエストに
+            # なり得るため、ボディを読む前に拒否する
+            content_type = self.headers.get("Content-Type", "")
+            if content_type.partition(";")[0].strip().lower() != "application/json":
+                self.close_connection = True
+                self._send_error_body(415, "server.error_unsupported_media_type")
+                return
+
+            content_length = int(raw_length)
             if content_length == 0:
-                self._send_json_response(400, {"error": t("server.error_empty_body")})
+                self._send_error_body(400, "server.error_empty_body")
                 return
 
-            body = self.rfile.read(content_length)
-            data = json.loads(body.decode("utf-8"))
+            if content_length > _MAX_BODY_BYTES:
+                # 未読のボディが次のリクエストとして解釈されないよう接続を閉じる
+                self.close_connection = True
+                self._send_error_body(413, "server.error_body_too_large")
+                return
 
-            topic_key = data.get("topic_key", "")
-            q1_choice = data.get("q1_choice", "")
-            q2_answer = data.get("q2_answer", "")
-            briefing_file = data.get("briefing_file", "")
+            request = _QuizSubmitRequest.from_json(
+                _json_loads(self._read_body(content_length))
+            )
+            if request is None:
+                self._send_error_body(400, "server.error_invalid_request")
+                return
 
-            if not topic_key:
-                self._send_json_response(400, {"error": t("server.error_topic_key_required")})
+            if not request.topic_key:
+                self._send_error_body(400, "server.error_topic_key_required")
                 return
 
-            logger.info("クイズ回答受信: %s (Q1=%s)", topic_key, q1_choice)
+            logger.info("クイズ回答受信: %s (Q1=%s)", request.topic_key, request.q1_choice)
 
             # 採点実行
-            if self.score_func is None:
-                self._send_json_response(500, {"error": t("server.error_scorer_not_init")})
+            if self.server.bound_score is None:
+                self._send_error_body(500, "server.error_scorer_not_init")
                 return
 
-            result = self.score_func(
-                topic_key=topic_key,
-                q1_choice=q1_choice,
-                q2_answer=q2_answer,
-                briefing_file=briefing_file,
-                copilot_client=self.copilot_client,
-                state_manager=self.state_manager,
-                app_config=self.app_config,
-            )
-
-            # 結果をレスポンスとして返す
-            response_data = {
-                "topic_key": result.topic_key,
-                "q1_correct": result.q1_correct,
-                "q1_correct_answer": result.q1_correct_answer,
-                "q1_explanation": result.q1_explanation,
-                "q2_evaluation": result.q2_evaluation,
-                "q2_feedback": result.q2_feedback,
-                "new_level": result.new_level,
-                "next_quiz_at": result.next_quiz_at,
-                "level_change": result.level_change,
-            }
-
-            self._send_json_response(200, response_data)
-            logger.info("採点結果返却: %s — Q1=%s, Q2=%s", topic_key, result.q1_correct, result.q2_evaluation)
+            # 採点側に Copilot 呼び出しのタイムアウトがあるため、ここでは完了を待つだけ
+            result, body = self.server.submit_scoring(request).result()
+            self._send_raw_json(200, body)
+            logger.info("採点結果返却: %s — Q1=%s, Q2=%s", request.topic_key, result.q1_correct, result.q2_evaluation)
 
         except json.JSONDecodeError:
-            self._send_json_response(400, {"error": t("server.error_json_parse")})
+            self._send_error_body(400, "server.error_json_parse")
         except Exception as e:
             logger.exception("採点中にエラーが発生しました")
+            # ボディを読み切れていない可能性があるため接続を再利用しない
+            self.close_connection = True
             self._send_json_response(500, {
                 "error": t("server.error_scoring_failed", error=e),
                 "message": t("server.error_retry_later"),
             })
 
+    def _read_body(self, content_length: int) -> bytearray:
+        """リクエストボディを事前確保したバッファへ直接読み込む。
+
+        クライアントが途中で切断した場合は受信できた分だけを返す。
+
+        Args:
+            content_length: Content-Length ヘッダーの値。
+
+        Returns:
+            受信したボディ。
+        """
+        buf = bytearray(content_length)
+        received = 0
+        with memoryview(buf) as view:
+            while received < content_length:
+                n = self.rfile.readinto(view[received:])
+                if not n:
+                    break
+                received += n
+        if received < content_length:
+            del buf[received:]
+        return buf
+
     def _send_json_response(self, status: int, data: dict[str, Any]) -> None:
         """JSON レスポンスを送信する。"""
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self._set_cors_headers()
-        self.end_headers()
-        response = json.dumps(data, ensure_ascii=False)
-        self.wfile.write(response.encode("utf-8"))
+        self._send_raw_json(status, _json_dumps(data))
+
+    def _send_error_body(self, status: int, key: str) -> None:
+        """固定文言のエラーレスポンスをキャッシュ済みの本文で送信する。"""
+        self._send_raw_json(status, _error_body(key, get_language()))
+
+    def _send_raw_json(self, status: int, body: bytes) -> None:
+        """シリアライズ済みの JSON 本文をレスポンスとして送信する。"""
+        self._send_response_block(
+            status, _JSON_HEADERS + b"Content-Length: %d\r\n" % len(body), body
+        )
+
+
+class _QuizHTTPServer(ThreadingHTTPServer):
+    """採点関数と採点用ワーカープールを保持する ThreadingHTTPServer。
+
+    リクエストに依存しない引数（Copilot クライアント・状態・設定）は
+    起動時に partial で束縛しておき、ハンドラは ``self.server.bound_score``
+    にリクエスト由来の値だけを渡す。採点は ``score_pool`` で実行し、
+    接続数に関わらず同時に走る Copilot 呼び出しを上限内に抑える。
+    直近の採点は短時間保持し、同一内容の再送には同じ結果を返す。
+    """
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        *,
+        score_func: Callable[..., Any] | None,
+        copilot_client: CopilotClientWrapper | None,
+        state_manager: StateManager | None,
+        app_config: AppConfig | None,
+    ) -> None:
+        """採点関数を束縛してソケットをバインドする。"""
+        self.bound_score: Callable[..., Any] | None = (
+            partial(
+                score_func,
+                copilot_client=copilot_client,
+                state_manager=state_manager,
+                app_config=app_config,
+            )
+            if score_func is not None
+            else None
+        )
+        # リクエスト → (受付時刻, 採点結果とシリアライズ済み本文の Future)
+        self._recent: OrderedDict[
+            _QuizSubmitRequest, tuple[float, Future[tuple[Any, bytes]]]
+        ] = OrderedDict()
+        self._recent_lock = threading.Lock()
+        super().__init__(server_address, _QuizRequestHandler)
+        # バインド失敗時にスレッドプールを残さないよう、バインド後に作成する
+        self.score_pool = ThreadPoolExecutor(
+            max_workers=_MAX_CONCURRENT_SCORING,
+            thread_name_prefix="QuizScore",
+        )
+
+    def submit_scoring(self, request: _QuizSubmitRequest) -> Future[tuple[Any, bytes]]:
+        """採点をワーカープールに投入する。
+
+        同じ内容の回答が TTL 内に再送された場合は新たに採点せず、
+        採点中または採点済みの Future を返す。採点は間隔反復の状態を
+        更新するため、リトライで二重に記録されることも防げる。
+        失敗・取り消しされた採点は再利用せず、採点し直す。
+
+        Args:
+            request: 回答リクエスト。
+
+        Returns:
+            (採点結果, レスポンス本文) を返す Future。
+        """
+        now = time.monotonic()
+        with self._recent_lock:
+            entry = self._recent.get(request)
+            if (
+                entry is not None
+                and now - entry[0] < _REPLAY_TTL_SECONDS
+                and not _has_failed(entry[1])
+            ):
+                logger.info("クイズ回答の再送を検出、採点結果を再利用: %s", request.topic_key)
+                return entry[1]
+            future = self.score_pool.submit(self._score_to_json, request)
+            self._recent[request] = (now, future)
+            self._recent.move_to_end(request)
+            while len(self._recent) > _REPLAY_CACHE_SIZE:
+                self._recent.popitem(last=False)
+        return future
+
+    def _score_to_json(self, request: _QuizSubmitRequest) -> tuple[Any, bytes]:
+        """採点し、結果のデータクラスをそのままレスポンス本文にシリアライズする。"""
+        assert self.bound_score is not None
+        result = self.bound_score(
+            topic_key=request.topic_key,
+            q1_choice=request.q1_choice,
+            q2_answer=request.q2_answer,
+            briefing_file=request.briefing_file,
+        )
+        return result, _json_dumps(result)
 
 
 class QuizServer:
@@ -133,7 +405,7 @@ class QuizServer:
 
     def __init__(self) -> None:
         """QuizServer を初期化する。"""
-        self._server: HTTPServer | None = None
+        self._server: _QuizHTTPServer | None = None
         self._thread: threading.Thread | None = None
         self._port: int = 0
 
@@ -174,19 +446,15 @@ class QuizServer:
             logger.warning("QuizServer は既に起動しています (port=%d)", self._port)
             return self._port
 
-        # ハンドラにスコアリング関数を注入
-        handler = type(
-            "_BoundQuizHandler",
-            (_QuizRequestHandler,),
-            {
-                "score_func": staticmethod(score_func),
-                "copilot_client": copilot_client,
-                "state_manager": state_manager,
-                "app_config": app_config,
-            },
+        # 採点は Copilot 呼び出しで数秒〜数十秒ブロックするため、
+        # 接続ごとにスレッドを分けて後続の回答受付を止めない
+        self._server = _QuizHTTPServer(
+            (host, port),
+            score_func=score_func,
+            copilot_client=copilot_client,
+            state_manager=state_manager,
+            app_config=app_config,
         )
-
-        self._server = HTTPServer((host, port), handler)
         self._port = self._server.server_address[1]
 
         self._thread = threading.Thread(
@@ -204,6 +472,8 @@ class QuizServer:
         if self._server is not None:
             self._server.shutdown()
             self._server.server_close()
+            # 未着手の採点は取り消し、実行中の採点の完了は待たない
+            self._server.score_pool.shutdown(wait=False, cancel_futures=True)
             logger.info("QuizServer 停止 (port=%d)", self._port)
             self._server = None
             self._thread = None
@@ -10,9 +10,11 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
 from typing import Callable
 
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
@@ -22,6 +24,9 @@ from app.config import AppConfig, ScheduleEntry
 
 logger = logging.getLogger(__name__)
 
+# ローカルタイムゾーン（インポート時に一度だけ解決し、全 Scheduler とトリガーで共有）
+_LOCAL_TZ = get_localzone()
+
 # 同時実行避譲の遅延秒数（3 分）
 _DEFER_SECONDS = 180
 
@@ -29,11 +34,20 @@ _DEFER_SECONDS = 180
 # 朝9時のジョブが深夜0時までにスリープ復帰すれば実行される
 _MISFIRE_GRACE_TIME = 54000
 
-# ジョブ ID
-_JOB_A_PREFIX = "job_a"
-_JOB_B_PREFIX = "job_b"
-_JOB_C_PREFIX = "job_c"
-_JOB_D_PREFIX = "job_d"
+# A/B/C/D のジョブ（定期・遅延・キャッチアップ）を格納するジョブストア名
+# スケジュール更新時はこのストアを丸ごと空にする
+_JOBSTORE = "scheduled"
+
+# 機能 ID（手動実行・ジョブ登録はこの順で行う）
+_FEATURES = ("a", "b", "c", "d")
+
+# 機能ごとの避譲対象（いずれかが実行中ならトリガーを 3 分遅延する）
+_DEFER_WHILE: dict[str, tuple[str, ...]] = {
+    "a": ("b",),
+    "b": ("a",),
+    "c": ("a", "b"),
+    "d": ("a", "b", "c"),
+}
 
 # スリープ復帰監視の間隔（秒）
 # Windows の WaitForSingleObjectEx はスリープ中の時間をカウントしないため、
@@ -60,26 +74,21 @@ class Scheduler:
 
     def __init__(self) -> None:
         """Scheduler を初期化する。"""
-        self._local_tz = get_localzone()
+        self._local_tz = _LOCAL_TZ
         self._scheduler = BackgroundScheduler(
+            jobstores={"default": MemoryJobStore(), _JOBSTORE: MemoryJobStore()},
             timezone=self._local_tz,
             job_defaults={
                 "misfire_grace_time": _MISFIRE_GRACE_TIME,
                 "coalesce": True,
+                "max_instances": 1,
             },
         )
-        self._lock_a = threading.Lock()
-        self._lock_b = threading.Lock()
-        self._lock_c = threading.Lock()
-        self._lock_d = threading.Lock()
-        self._running_a = False
-        self._running_b = False
-        self._running_c = False
-        self._running_d = False
-        self._on_job_a: Callable[[], None] | None = None
-        self._on_job_b: Callable[[], None] | None = None
-        self._on_job_c: Callable[[], None] | None = None
-        self._on_job_d: Callable[[], None] | None = None
+        # 実行中判定はロックの保持状態（locked()）で行い、別途フラグは持たない
+        self._locks: dict[str, threading.Lock] = {f: threading.Lock() for f in _FEATURES}
+        # 避譲判定とロック取得を不可分にするためのガード（ジョブ本体の実行中は保持しない）
+        self._interlock = threading.Lock()
+        self._callbacks: dict[str, Callable[[], None] | None] = dict.fromkeys(_FEATURES)
         self._started = False
         # スリープ復帰監視
         self._watchdog_stop = threading.Event()
@@ -105,10 +114,7 @@ class Scheduler:
             on_job_c: 機能 C のジョブコールバック。
             on_job_d: 機能 D のジョブコールバック。
         """
-        self._on_job_a = on_job_a
-        self._on_job_b = on_job_b
-        self._on_job_c = on_job_c
-        self._on_job_d = on_job_d
+        self._callbacks.update(a=on_job_a, b=on_job_b, c=on_job_c, d=on_job_d)
 
         # スケジュールジョブの登録
         self._register_jobs(config)
@@ -138,11 +144,18 @@ class Scheduler:
         Args:
             config: 更新後のアプリケーション設定。
         """
-        # 既存ジョブの削除
-        self._remove_all_jobs()
+        # 登録中はスケジューラを一時停止し、ジョブごとの起床を最後の 1 回にまとめる
+        if self._started:
+            self._scheduler.pause()
+        try:
+            # 既存ジョブの削除
+            self._remove_all_jobs()
 
-        # 新しいジョブの登録
-        self._register_jobs(config)
+            # 新しいジョブの登録
+            self._register_jobs(config)
+        finally:
+            if self._started:
+                self._scheduler.resume()
         logger.info("スケジュールを更新しました")
 
     def run_manual(
@@ -164,109 +177,63 @@ class Scheduler:
             on_job_c: 機能 C のコールバック（None の場合は登録済みを使用）。
             on_job_d: 機能 D のコールバック（None の場合は登録済みを使用）。
         """
-        job_a = on_job_a or self._on_job_a
-        job_b = on_job_b or self._on_job_b
-        job_c = on_job_c or self._on_job_c
-        job_d = on_job_d or self._on_job_d
-
-        if "a" in features and job_a:
-            logger.info("手動実行: 機能 A を開始")
-            self._execute_job_a_wrapper(job_a)
-
-        if "b" in features and job_b:
-            logger.info("手動実行: 機能 B を開始")
-            self._execute_job_b_wrapper(job_b)
-
-        if "c" in features and job_c:
-            logger.info("手動実行: 機能 C を開始")
-            self._execute_job_c_wrapper(job_c)
-
-        if "d" in features and job_d:
-            logger.info("手動実行: 機能 D を開始")
-            self._execute_job_d_wrapper(job_d)
+        overrides = {"a": on_job_a, "b": on_job_b, "c": on_job_c, "d": on_job_d}
+        for feature in _FEATURES:
+            callback = overrides[feature] or self._callbacks[feature]
+            if feature in features and callback:
+                logger.info("手動実行: 機能 %s を開始", feature.upper())
+                self._execute(feature, callback)
 
     def _register_jobs(self, config: AppConfig) -> None:
         """config のスケジュール設定に基づきジョブを登録する。"""
-        for i, entry in enumerate(config.schedule.feature_a):
-            job_id = f"{_JOB_A_PREFIX}_{i}"
-            trigger = self._create_trigger(entry)
-            self._scheduler.add_job(
-                self._on_trigger_a,
-                trigger=trigger,
-                id=job_id,
-                replace_existing=True,
-                name=f"機能A (schedule {i})",
-            )
-            logger.info(
-                "機能A ジョブ登録: %s (day_of_week=%s, hour=%s)",
-                job_id,
-                entry.day_of_week,
-                entry.hour,
-            )
-
-        for i, entry in enumerate(config.schedule.feature_b):
-            job_id = f"{_JOB_B_PREFIX}_{i}"
-            trigger = self._create_trigger(entry)
-            self._scheduler.add_job(
-                self._on_trigger_b,
-                trigger=trigger,
-                id=job_id,
-                replace_existing=True,
-                name=f"機能B (schedule {i})",
-            )
-            logger.info(
-                "機能B ジョブ登録: %s (day_of_week=%s, hour=%s)",
-                job_id,
-                entry.day_of_week,
-                entry.hour,
-            )
+        for feature in _FEATURES:
+            label = feature.upper()
+            entries: list[ScheduleEntry] = getattr(config.schedule, f"feature_{feature}")
+            for i, entry in enumerate(entries):
+                job_id = f"job_{feature}_{i}"
+                self._add_job(
+                    feature,
+                    trigger=self._create_trigger(entry),
+                    job_id=job_id,
+                    name=f"機能{label} (schedule {i})",
+                )
+                logger.info(
+                    "機能%s ジョブ登録: %s (day_of_week=%s, hour=%s)",
+                    label,
+                    job_id,
+                    entry.day_of_week,
+                    entry.hour,
+                )
 
-        for i, entry in enumerate(config.schedule.feature_c):
-            job_id = f"{_JOB_C_PREFIX}_{i}"
-            trigger = self._create_trigger(entry)
-            self._scheduler.add_job(
-                self._on_trigger_c,
-                trigger=trigger,
-                id=job_id,
-                replace_existing=True,
-                name=f"機能C (schedule {i})",
-            )
-            logger.info(
-                "機能C ジョブ登録: %s (day_of_week=%s, hour=%s)",
-                job_id,
-                entry.day_of_week,
-                entry.hour,
-            )
+    def _add_job(
+        self,
+        feature: str,
+        trigger: CronTrigger | DateTrigger,
+        job_id: str,
+        name: str,
+    ) -> None:
+        """A/B/C/D 専用のジョブストアに機能のトリガージョブを登録する。
 
-        for i, entry in enumerate(config.schedule.feature_d):
-            job_id = f"{_JOB_D_PREFIX}_{i}"
-            trigger = self._create_trigger(entry)
-            self._scheduler.add_job(
-                self._on_trigger_d,
-                trigger=trigger,
-                id=job_id,
-                replace_existing=True,
-                name=f"機能D (schedule {i})",
-            )
-            logger.info(
-                "機能D ジョブ登録: %s (day_of_week=%s, hour=%s)",
-                job_id,
-                entry.day_of_week,
-                entry.hour,
-            )
+        Args:
+            feature: 機能 ID（"a", "b", "c", "d"）。
+            trigger: ジョブのトリガー。
+            job_id: ジョブ ID（同じ ID の既存ジョブは置き換える）。
+            name: ジョブの表示名。
+        """
+        self._scheduler.add_job(
+            self._on_trigger,
+            trigger=trigger,
+            args=(feature,),
+            id=job_id,
+            replace_existing=True,
+            name=name,
+            jobstore=_JOBSTORE,
+        )
 
     def _remove_all_jobs(self) -> None:
-        """登録済みの A/B/C/D ジョブをすべて削除する。"""
-        jobs = self._scheduler.get_jobs()
-        for job in jobs:
-            if (
-                job.id.startswith(_JOB_A_PREFIX)
-                or job.id.startswith(_JOB_B_PREFIX)
-                or job.id.startswith(_JOB_C_PREFIX)
-                or job.id.startswith(_JOB_D_PREFIX)
-            ):
-                self._scheduler.remove_job(job.id)
-                logger.debug("ジョブ削除: %s", job.id)
+        """登録済みの A/B/C/D ジョブ（遅延・キャッチアップを含む）をすべて削除する。"""
+        self._scheduler.remove_all_jobs(jobstore=_JOBSTORE)
+        logger.debug("ジョブストア %s のジョブをすべて削除しました", _JOBSTORE)
 
     def _create_trigger(self, entry: ScheduleEntry) -> CronTrigger:
         """ScheduleEntry から CronTrigger を生成する。
@@ -277,180 +244,90 @@ class Scheduler:
         Returns:
             CronTrigger インスタンス。
         """
-        return CronTrigger(
-            day_of_week=entry.day_of_week,
-            hour=entry.hour,
-            minute=entry.minute,
-            timezone=self._local_tz,
-        )
-
-    def _on_trigger_a(self) -> None:
-        """機能 A のスケジュールトリガーハンドラ。
-
-        機能 B が実行中の場合は 3 分後にリスケジュールする。
-        """
-        if self._running_b:
-            defer_time = datetime.now() + timedelta(seconds=_DEFER_SECONDS)
-            logger.info(
-                "機能 B が実行中のため、機能 A を %s に遅延実行します",
-                defer_time.strftime("%H:%M:%S"),
-            )
-            self._scheduler.add_job(
-                self._on_trigger_a,
-                trigger=DateTrigger(run_date=defer_time),
-                id="job_a_deferred",
-                replace_existing=True,
-                name="機能A (遅延実行)",
-            )
-            return
+        return _make_cron(entry.day_of_week, entry.hour, entry.minute, self._local_tz)
 
-        if self._on_job_a:
-            self._execute_job_a_wrapper(self._on_job_a)
+    def _defer_run_date(self) -> tuple[datetime, str]:
+        """避譲時の遅延実行日時とログ用の時刻文字列を返す。
 
-    def _on_trigger_b(self) -> None:
-        """機能 B のスケジュールトリガーハンドラ。
+        DateTrigger は壁時計の日時で発火するため、monotonic ではなく time.time() を基準にする。
+        タイムゾーン付きで返すので DateTrigger 側でのローカライズも不要。
 
-        機能 A が実行中の場合は 3 分後にリスケジュールする。
+        Returns:
+            (DateTrigger に渡すタイムゾーン付き日時, "HH:MM:SS" 形式の時刻文字列)。
         """
-        if self._running_a:
-            defer_time = datetime.now() + timedelta(seconds=_DEFER_SECONDS)
-            logger.info(
-                "機能 A が実行中のため、機能 B を %s に遅延実行します",
-                defer_time.strftime("%H:%M:%S"),
-            )
-            self._scheduler.add_job(
-                self._on_trigger_b,
-                trigger=DateTrigger(run_date=defer_time),
-                id="job_b_deferred",
-                replace_existing=True,
-                name="機能B (遅延実行)",
-            )
-            return
+        ts = time.time() + _DEFER_SECONDS
+        run_date = datetime.fromtimestamp(ts, self._local_tz)
+        return run_date, time.strftime("%H:%M:%S", time.localtime(ts))
 
-        if self._on_job_b:
-            self._execute_job_b_wrapper(self._on_job_b)
+    def _on_trigger(self, feature: str) -> None:
+        """機能のスケジュールトリガーハンドラ。
 
-    def _execute_job_a_wrapper(self, callback: Callable[[], None]) -> None:
-        """機能 A のジョブを排他制御付きで実行する。
+        避譲対象の機能（_DEFER_WHILE）が実行中の場合は 3 分後にリスケジュールする。
 
-        既に実行中の場合はスキップする（スリープ復帰時の二重起動防止）。
-        """
-        if not self._lock_a.acquire(blocking=False):
-            logger.warning("機能 A は既に実行中のためスキップします（二重起動防止）")
-            return
-        try:
-            self._running_a = True
-            try:
-                callback()
-            except Exception:
-                logger.exception("機能 A の実行中にエラーが発生しました")
-            finally:
-                self._running_a = False
-        finally:
-            self._lock_a.release()
-
-    def _execute_job_b_wrapper(self, callback: Callable[[], None]) -> None:
-        """機能 B のジョブを排他制御付きで実行する。
-
-        既に実行中の場合はスキップする（スリープ復帰時の二重起動防止）。
+        Args:
+            feature: 機能 ID（"a", "b", "c", "d"）。
         """
-        if not self._lock_b.acquire(blocking=False):
-            logger.warning("機能 B は既に実行中のためスキップします（二重起動防止）")
+        callback = self._callbacks[feature]
+        if not callback:
             return
-        try:
-            self._running_b = True
-            try:
-                callback()
-            except Exception:
-                logger.exception("機能 B の実行中にエラーが発生しました")
-            finally:
-                self._running_b = False
-        finally:
-            self._lock_b.release()
-
-    def _on_trigger_c(self) -> None:
-        """機能 C のスケジュールトリガーハンドラ。
 
-        機能 A または B が実行中の場合は 3 分後にリスケジュールする。
-        """
-        if self._running_a or self._running_b:
-            defer_time = datetime.now() + timedelta(seconds=_DEFER_SECONDS)
-            logger.info(
-                "機能 A/B が実行中のため、機能 C を %s に遅延実行します",
-                defer_time.strftime("%H:%M:%S"),
-            )
-            self._scheduler.add_job(
-                self._on_trigger_c,
-                trigger=DateTrigger(run_date=defer_time),
-                id="job_c_deferred",
-                replace_existing=True,
-                name="機能C (遅延実行)",
-            )
+        peers = _DEFER_WHILE[feature]
+        if self._execute(feature, callback, defer_while=peers):
             return
 
-        if self._on_job_c:
-            self._execute_job_c_wrapper(self._on_job_c)
+        label = feature.upper()
+        run_date, hhmmss = self._defer_run_date()
+        logger.info(
+            "機能 %s が実行中のため、機能 %s を %s に遅延実行します",
+            "/".join(peers).upper(),
+            label,
+            hhmmss,
+        )
+        self._add_job(
+            feature,
+            trigger=DateTrigger(run_date=run_date),
+            job_id=f"job_{feature}_deferred",
+            name=f"機能{label} (遅延実行)",
+        )
 
-    def _execute_job_c_wrapper(self, callback: Callable[[], None]) -> None:
-        """機能 C のジョブを排他制御付きで実行する。
+    def _execute(
+        self,
+        feature: str,
+        callback: Callable[[], None],
+        defer_while: tuple[str, ...] = (),
+    ) -> bool:
+        """機能のジョブを排他制御付きで実行する。
 
         既に実行中の場合はスキップする（スリープ復帰時の二重起動防止）。
-        """
-        if not self._lock_c.acquire(blocking=False):
-            logger.warning("機能 C は既に実行中のためスキップします（二重起動防止）")
-            return
-        try:
-            self._running_c = True
-            try:
-                callback()
-            except Exception:
-                logger.exception("機能 C の実行中にエラーが発生しました")
-            finally:
-                self._running_c = False
-        finally:
-            self._lock_c.release()
+        defer_while の機能の実行中判定と自機能のロック取得は _interlock の下で
+        まとめて行うため、A と B が同時にトリガーされても両方が実行されることはない。
 
-    def _on_trigger_d(self) -> None:
-        """機能 D のスケジュールトリガーハンドラ。
+        Args:
+            feature: 機能 ID（"a", "b", "c", "d"）。
+            callback: ジョブ本体。
+            defer_while: 実行中なら自機能を実行しない機能 ID。
 
-        機能 A・B・C のいずれかが実行中の場合は 3 分後にリスケジュールする。
+        Returns:
+            defer_while のいずれかが実行中で実行を見送った場合は False。
+            それ以外（実行した・二重起動でスキップした）は True。
         """
-        if self._running_a or self._running_b or self._running_c:
-            defer_time = datetime.now() + timedelta(seconds=_DEFER_SECONDS)
-            logger.info(
-                "機能 A/B/C が実行中のため、機能 D を %s に遅延実行します",
-                defer_time.strftime("%H:%M:%S"),
-            )
-            self._scheduler.add_job(
-                self._on_trigger_d,
-                trigger=DateTrigger(run_date=defer_time),
-                id="job_d_deferred",
-                replace_existing=True,
-                name="機能D (遅延実行)",
+        lock = self._locks[feature]
+        with self._interlock:
+            if any(self._locks[peer].locked() for peer in defer_while):
+                return False
+            acquired = lock.acquire(blocking=False)
+        if not acquired:
+            logger.warning(
+                "機能 %s は既に実行中のためスキップします（二重起動防止）", feature.upper(),
             )
-            return
-
-        if self._on_job_d:
-            self._execute_job_d_wrapper(self._on_job_d)
-
-    def _execute_job_d_wrapper(self, callback: Callable[[], None]) -> None:
-        """機能 D のジョブを排他制御付きで実行する。
-
-        既に実行中の場合はスキップする（スリープ復帰時の二重起動防止）。
-        """
-        if not self._lock_d.acquire(blocking=False):
-            logger.warning("機能 D は既に実行中のためスキップします（二重起動防止）")
-            return
+            return True
         try:
-            self._running_d = True
-            try:
-                callback()
-            except Exception:
-                logger.exception("機能 D の実行中にエラーが発生しました")
-            finally:
-                self._running_d = False
+            callback()
+        except Exception:
+            logger.exception("機能 %s の実行中にエラーが発生しました", feature.upper())
         finally:
-            self._lock_d.release()
+            lock.release()
+        return True
 
     # ─── スリープ復帰監視（ウォッチドッグ） ───
 
@@ -525,27 +402,28 @@ class Scheduler:
             last_run_d_at: 機能 D の最終実行日時（ISO 形式）。空文字は未実行。
         """
         now = datetime.now()
+        # DateTrigger にはタイムゾーン付きの日時を渡す（判定用の now は naive のまま）
+        run_base = datetime.now(self._local_tz)
         today = now.date()
         today_weekday = today.weekday()
 
         # 機能 A のキャッチアップ（実行中の場合はスケジュール済みとみなしてスキップ）
-        a_has_catchup = self._on_job_a and not self._running_a and _should_catchup(
+        a_has_catchup = self._callbacks["a"] and not self._locks["a"].locked() and _should_catchup(
             config.schedule.feature_a, today_weekday, now, last_run_a_at,
         )
         if a_has_catchup:
             logger.info(
                 "起動時キャッチアップ: 機能 A のスケジュール時刻を逃しています。即時実行します"
             )
-            self._scheduler.add_job(
-                self._on_trigger_a,
-                trigger=DateTrigger(run_date=now + timedelta(seconds=10)),
-                id="job_a_catchup",
-                replace_existing=True,
+            self._add_job(
+                "a",
+                trigger=DateTrigger(run_date=run_base + timedelta(seconds=10)),
+                job_id="job_a_catchup",
                 name="機能A (起動時キャッチアップ)",
             )
 
         # 機能 B のキャッチアップ（実行中の場合はスケジュール済みとみなしてスキップ）
-        b_has_catchup = self._on_job_b and not self._running_b and _should_catchup(
+        b_has_catchup = self._callbacks["b"] and not self._locks["b"].locked() and _should_catchup(
             config.schedule.feature_b, today_weekday, now, last_run_b_at,
         )
         if b_has_catchup:
@@ -555,16 +433,15 @@ class Scheduler:
                 "起動時キャッチアップ: 機能 B のスケジュール時刻を逃しています。%d秒後に実行します",
                 delay,
             )
-            self._scheduler.add_job(
-                self._on_trigger_b,
-                trigger=DateTrigger(run_date=now + timedelta(seconds=delay)),
-                id="job_b_catchup",
-                replace_existing=True,
+            self._add_job(
+                "b",
+                trigger=DateTrigger(run_date=run_base + timedelta(seconds=delay)),
+                job_id="job_b_catchup",
                 name="機能B (起動時キャッチアップ)",
             )
 
         # 機能 C のキャッチアップ（実行中の場合はスケジュール済みとみなしてスキップ）
-        c_has_catchup = self._on_job_c and not self._running_c and _should_catchup(
+        c_has_catchup = self._callbacks["c"] and not self._locks["c"].locked() and _should_catchup(
             config.schedule.feature_c, today_weekday, now, last_run_c_at,
         )
         if c_has_catchup:
@@ -575,16 +452,15 @@ class Scheduler:
                 "起動時キャッチアップ: 機能 C のスケジュール時刻を逃しています。%d秒後に実行します",
                 delay,
             )
-            self._scheduler.add_job(
-                self._on_trigger_c,
-                trigger=DateTrigger(run_date=now + timedelta(seconds=delay)),
-                id="job_c_catchup",
-                replace_existing=True,
+            self._add_job(
+                "c",
+                trigger=DateTrigger(run_date=run_base + timedelta(seconds=delay)),
+                job_id="job_c_catchup",
                 name="機能C (起動時キャッチアップ)",
             )
 
         # 機能 D のキャッチアップ（実行中の場合はスケジュール済みとみなしてスキップ）
-        if self._on_job_d and not self._running_d and _should_catchup(
+        if self._callbacks["d"] and not self._locks["d"].locked() and _should_catchup(
             config.schedule.feature_d, today_weekday, now, last_run_d_at,
         ):
             # A/B/C のキャッチアップがある場合はさらに遅延して重複を回避
@@ -594,15 +470,36 @@ class Scheduler:
                 "起動時キャッチアップ: 機能 D のスケジュール時刻を逃しています。%d秒後に実行します",
                 delay,
             )
-            self._scheduler.add_job(
-                self._on_trigger_d,
-                trigger=DateTrigger(run_date=now + timedelta(seconds=delay)),
-                id="job_d_catchup",
-                replace_existing=True,
+            self._add_job(
+                "d",
+                trigger=DateTrigger(run_date=run_base + timedelta(seconds=delay)),
+                job_id="job_d_catchup",
                 name="機能D (起動時キャッチアップ)",
             )
 
 
+# ── トリガー生成ヘルパー ──
+
+
+@lru_cache(maxsize=128)
+def _make_cron(day_of_week: str, hour: str, minute: str, tz: tzinfo) -> CronTrigger:
+    """CronTrigger を生成する（同一設定はキャッシュを共有）。
+
+    update_schedule のたびに cron フィールドを再パースしないようにする。
+    CronTrigger は生成後に変更されないため、複数ジョブで共有しても安全。
+
+    Args:
+        day_of_week: APScheduler 形式の曜日指定文字列。
+        hour: 時。
+        minute: 分。
+        tz: タイムゾーン。
+
+    Returns:
+        CronTrigger インスタンス。
+    """
+    return CronTrigger(day_of_week=day_of_week, hour=hour, minute=minute, timezone=tz)
+
+
 # ── キャッチアップ判定ヘルパー ──
 
 
@@ -6,9 +6,12 @@
 
 from __future__ import annotations
 
+import base64
 import logging
+import re
 import tkinter as tk
 from tkinter import messagebox
+from functools import lru_cache
 from pathlib import Path
 from tkinter import filedialog, ttk
 from typing import Any, Callable
@@ -17,57 +20,137 @@ from app import autostart
 from app import config as config_module
 from app.config import AppConfig, MonitoredPage, ScheduleEntry
 from app.i18n import SUPPORTED_LANGUAGES, get_language, set_language, t
-from app.sample_data import generate_sample_data
 
 logger = logging.getLogger(__name__)
 
+# 言語ドロップダウンの表示名 → 言語コード
+_LABEL_TO_CODE: dict[str, str] = {label: code for code, label in SUPPORTED_LANGUAGES.items()}
+
+# 時刻入力欄（"9, 13, 18"）から時刻を取り出すパターン
+_HOURS_RE = re.compile(r"[^,\s]+")
+
+# 設定画面で作成するスケジュールエントリの分（UI では分を編集しない）
+_DEFAULT_MINUTE = ScheduleEntry.minute
+
+# ウィンドウアイコン（PNG）
+_ICON_PATH = Path(__file__).resolve().parent.parent / "assets" / "icon_normal.png"
+
+
+def _schedule_snapshot(entries: list[ScheduleEntry]) -> tuple[tuple[str, str, str], ...]:
+    """変更検出用にスケジュールを (day_of_week, hour, minute) のタプルに変換する。"""
+    return tuple((e.day_of_week, e.hour, e.minute) for e in entries)
+
+
+def _rebuild_schedule(
+    entries: list[ScheduleEntry], day_str: str, hours: list[str], default_hour: str,
+) -> list[ScheduleEntry]:
+    """入力値からスケジュールエントリを作り直す。
+
+    曜日・時刻が既存エントリと同じ（分は既定値）なら既存リストをそのまま返し、
+    不要な ScheduleEntry の再生成を避ける。
+
+    Args:
+        entries: 現在のスケジュールエントリ。
+        day_str: 曜日指定文字列。
+        hours: 入力された時刻のリスト。
+        default_hour: 時刻が未入力の場合に使う時刻。
+
+    Returns:
+        新しい（または既存の）スケジュールエントリのリスト。
+    """
+    hours = hours or [default_hour]
+    if _schedule_snapshot(entries) == tuple(
+        (day_str, h, _DEFAULT_MINUTE) for h in hours
+    ):
+        return entries
+    return [ScheduleEntry(day_of_week=day_str, hour=h) for h in hours]
+
+
+def _pages_snapshot(pages: list[MonitoredPage]) -> tuple[tuple[str, bool], ...]:
+    """変更検出用に監視ページを (url, enabled) のタプルに変換する。"""
+    return tuple((p.url, p.enabled) for p in pages)
+
 
 def _log_setting_changes(
     config: AppConfig,
     *,
     old_language: str,
-    old_schedule_a: list[tuple[str, str]],
-    old_schedule_b: list[tuple[str, str]],
+    old_schedule_a: tuple[tuple[str, str, str], ...],
+    new_schedule_a: tuple[tuple[str, str, str], ...],
+    old_schedule_b: tuple[tuple[str, str, str], ...],
+    new_schedule_b: tuple[tuple[str, str, str], ...],
+    old_schedule_c: tuple[tuple[str, str, str], ...],
+    new_schedule_c: tuple[tuple[str, str, str], ...],
+    old_schedule_d: tuple[tuple[str, str, str], ...],
+    new_schedule_d: tuple[tuple[str, str, str], ...],
+    old_page_monitor_enabled: bool,
+    old_pages: tuple[tuple[str, bool], ...],
+    old_feature_d_enabled: bool,
     old_folders: list[str],
     old_notif_enabled: bool,
     old_notif_click: bool,
     old_run_at_startup: bool,
-) -> None:
-    """変更された設定項目をログに記録する。"""
-    changes: list[str] = []
+) -> bool:
+    """変更された設定項目をログに記録する。
+
+    スケジュールは呼び出し側で作成済みの (day_of_week, hour, minute) タプルを受け取る。
+    スケジュールタブを開いていない場合は old と new に同じオブジェクトが渡される。
+
+    Returns:
+        設定ダイアログで変更できる項目のいずれかが変更されていれば True。
+    """
+    changes: list[tuple[str, Any, Any]] = []
 
     if old_language != config.language:
-        changes.append(f"language: {old_language} -> {config.language}")
+        changes.append(("language", old_language, config.language))
 
-    new_schedule_a = [(e.day_of_week, e.hour) for e in config.schedule.feature_a]
     if old_schedule_a != new_schedule_a:
-        changes.append(f"schedule.feature_a: {old_schedule_a} -> {new_schedule_a}")
+        changes.append(("schedule.feature_a", old_schedule_a, new_schedule_a))
 
-    new_schedule_b = [(e.day_of_week, e.hour) for e in config.schedule.feature_b]
     if old_schedule_b != new_schedule_b:
-        changes.append(f"schedule.feature_b: {old_schedule_b} -> {new_schedule_b}")
+        changes.append(("schedule.feature_b", old_schedule_b, new_schedule_b))
+
+    if old_schedule_c != new_schedule_c:
+        changes.append(("schedule.feature_c", old_schedule_c, new_schedule_c))
+
+    if old_schedule_d != new_schedule_d:
+        changes.append(("schedule.feature_d", old_schedule_d, new_schedule_d))
+
+    if old_page_monitor_enabled != config.page_monitor.enabled:
+        changes.append(("page_monitor.enabled", old_page_monitor_enabled, config.page_monitor.enabled))
+
+    new_pages = _pages_snapshot(config.page_monitor.pages)
+    if old_pages != new_pages:
+        changes.append(("page_monitor.pages", old_pages, new_pages))
+
+    if old_feature_d_enabled != config.feature_d.enabled:
+        changes.append(("feature_d.enabled", old_feature_d_enabled, config.feature_d.enabled))
 
     if old_folders != list(config.input_folders):
-        changes.append(f"input_folders: {old_folders} -> {list(config.input_folders)}")
+        changes.append(("input_folders", old_folders, list(config.input_folders)))
 
     if old_notif_enabled != config.notification.enabled:
-        changes.append(f"notification.enabled: {old_notif_enabled} -> {config.notification.enabled}")
+        changes.append(("notification.enabled", old_notif_enabled, config.notification.enabled))
 
     if old_notif_click != config.notification.open_file_on_click:
-        changes.append(f"notification.open_file_on_click: {old_notif_click} -> {config.notification.open_file_on_click}")
+        changes.append(("notification.open_file_on_click", old_notif_click, config.notification.open_file_on_click))
 
     if old_run_at_startup != config.run_at_startup:
-        changes.append(f"run_at_startup: {old_run_at_startup} -> {config.run_at_startup}")
+        changes.append(("run_at_startup", old_run_at_startup, config.run_at_startup))
 
-    if changes:
-        for change in changes:
-            logger.info("Setting changed: %s", change)
-    else:
-        logger.info("Settings saved (no changes)")
+    # 変更の有無は保存判定に使うため常に求め、ログ出力だけを INFO 有効時に限る
+    if logger.isEnabledFor(logging.INFO):
+        if changes:
+            for change in changes:
+                logger.info("Setting changed: %s: %s -> %s", *change)
+        else:
+            logger.info("Settings saved (no changes)")
+
+    return bool(changes)
 
 
 # 曜日ラベルキー → APScheduler 用文字列のマッピング
-_WEEKDAY_KEYS = [
+_WEEKDAY_KEYS: tuple[tuple[str, str], ...] = (
     ("settings.day.mon", "mon"),
     ("settings.day.tue", "tue"),
     ("settings.day.wed", "wed"),
@@ -75,7 +158,13 @@ _WEEKDAY_KEYS = [
     ("settings.day.fri", "fri"),
     ("settings.day.sat", "sat"),
     ("settings.day.sun", "sun"),
-]
+)
+
+# 「平日のみ」ショートカットで OFF にする曜日
+_WEEKEND = frozenset(("sat", "sun"))
+
+# 曜日 → ビットマスクのビット（月=bit0 〜 日=bit6）
+_DAY_BIT: dict[str, int] = {key: 1 << i for i, (_, key) in enumerate(_WEEKDAY_KEYS)}
 
 
 def _parse_day_of_week(day_str: str) -> list[str]:
@@ -112,6 +201,36 @@ def _parse_day_of_week(day_str: str) -> list[str]:
     return result
 
 
+@lru_cache(maxsize=64)
+def _parse_day_mask(day_str: str) -> int:
+    """day_of_week 文字列を曜日ビットマスクに変換する（結果はキャッシュ）。
+
+    Args:
+        day_str: "mon-fri" や "mon,wed,fri" 形式。
+
+    Returns:
+        _DAY_BIT のビットを OR した値（"mon-fri" → 0b0011111）。
+    """
+    mask = 0
+    for day in _parse_day_of_week(day_str):
+        mask |= _DAY_BIT.get(day, 0)
+    return mask
+
+
+def _is_valid_hours_input(text: str) -> bool:
+    """時刻入力欄の編集後の文字列が数字・カンマ・空白だけで構成されているかを返す。
+
+    Entry の validatecommand から呼ばれる。
+
+    Args:
+        text: 編集後の入力欄の文字列（%P）。
+
+    Returns:
+        受け付ける場合は True。
+    """
+    return all(c.isdigit() or c in ", " for c in text)
+
+
 def _days_to_string(selected_days: list[str]) -> str:
     """選択された曜日リストを day_of_week 文字列に変換する。
 
@@ -124,6 +243,22 @@ def _days_to_string(selected_days: list[str]) -> str:
     return ",".join(selected_days) if selected_days else "mon-fri"
 
 
+@lru_cache(maxsize=1)
+def _load_icon_data() -> str | None:
+    """ウィンドウアイコンの PNG を base64 文字列として読み込む（結果はキャッシュ）。
+
+    PhotoImage は Tk ルートごとに作り直す必要があるが、
+    ファイル読み込みはダイアログを何度開いても 1 回で済ませる。
+
+    Returns:
+        base64 エンコード済みの PNG データ。ファイルがない場合は None。
+    """
+    try:
+        return base64.b64encode(_ICON_PATH.read_bytes()).decode("ascii")
+    except OSError:
+        return None
+
+
 def open_settings(
     config: AppConfig,
     on_save: Callable[[AppConfig], None] | None = None,
@@ -145,11 +280,11 @@ def open_settings(
         root.resizable(False, True)
         root.minsize(650, 500)
 
-        # ウィンドウアイコン設定
-        _icon_path = Path(__file__).resolve().parent.parent / "assets" / "icon_normal.png"
-        if _icon_path.exists():
+        # ウィンドウアイコン設定（PNG の読み込みは初回のみ）
+        icon_data = _load_icon_data()
+        if icon_data is not None:
             try:
-                _icon_img = tk.PhotoImage(file=str(_icon_path))
+                _icon_img = tk.PhotoImage(master=root, data=icon_data)
                 root.iconphoto(True, _icon_img)
             except Exception:
                 pass  # アイコン設定失敗は無視
@@ -189,409 +324,371 @@ def open_settings(
             foreground="gray",
         ).pack(anchor=tk.W, padx=(20, 0))
 
+        # 一般タブ以外は初めて表示されたときに中身を構築する。
+        # 未構築のタブの変数は None のままとし、保存時はその項目を変更しない。
+        a_day_vars: dict[str, tk.BooleanVar] | None = None
+        b_day_vars: dict[str, tk.BooleanVar] | None = None
+        c_day_vars: dict[str, tk.BooleanVar] | None = None
+        d_day_vars: dict[str, tk.BooleanVar] | None = None
+        a_hour_var: tk.StringVar | None = None
+        b_hour_var: tk.StringVar | None = None
+        c_hour_var: tk.StringVar | None = None
+        d_hour_var: tk.StringVar | None = None
+        c_enabled_var: tk.BooleanVar | None = None
+        d_enabled_var: tk.BooleanVar | None = None
+        folder_listbox: tk.Listbox | None = None
+        pm_tree: ttk.Treeview | None = None
+        notif_enabled_var: tk.BooleanVar | None = None
+        open_on_click_var: tk.BooleanVar | None = None
+
         # ─── タブ1: スケジュール（スクロール対応） ───
         schedule_outer = ttk.Frame(notebook)
         notebook.add(schedule_outer, text=t("settings.tab.schedule"))
 
-        schedule_canvas = tk.Canvas(schedule_outer, highlightthickness=0)
-        schedule_scrollbar = ttk.Scrollbar(schedule_outer, orient=tk.VERTICAL, command=schedule_canvas.yview)
-        schedule_tab = ttk.Frame(schedule_canvas, padding=10)
-
-        schedule_tab.bind(
-            "<Configure>",
-            lambda e: schedule_canvas.configure(scrollregion=schedule_canvas.bbox("all")),
-        )
-        schedule_canvas.create_window((0, 0), window=schedule_tab, anchor="nw")
-        schedule_canvas.configure(yscrollcommand=schedule_scrollbar.set)
-
-        schedule_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        schedule_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # キャンバス幅を外枠に合わせる
-        def _on_canvas_configure(event: Any) -> None:
-            schedule_canvas.itemconfigure("all", width=event.width)
-
-        schedule_canvas.bind("<Configure>", _on_canvas_configure)
-
-        # マウスホイールスクロール対応
-        def _on_mousewheel(event: Any) -> None:
-            schedule_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        schedule_canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-        # 機能 A スケジュール
-        ttk.Label(schedule_tab, text=t("settings.feature_a_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(0, 5))
-
-        a_frame = ttk.LabelFrame(schedule_tab, text=t("settings.feature_a_schedule"), padding=8)
-        a_frame.pack(fill=tk.X, pady=(0, 15))
-
-        # 曜日チェックボックス（機能 A）
-        ttk.Label(a_frame, text=t("settings.days_label")).pack(anchor=tk.W)
-        a_day_frame = ttk.Frame(a_frame)
-        a_day_frame.pack(anchor=tk.W, pady=3)
-
-        a_day_vars: dict[str, tk.BooleanVar] = {}
-        # 既存設定から曜日を取得
-        a_existing_days: list[str] = []
-        for entry in config.schedule.feature_a:
-            a_existing_days.extend(_parse_day_of_week(entry.day_of_week))
-        a_existing_days = list(set(a_existing_days))
-
-        for i18n_key, key in _WEEKDAY_KEYS:
-            var = tk.BooleanVar(master=root, value=key in a_existing_days)
-            a_day_vars[key] = var
-            ttk.Checkbutton(a_day_frame, text=t(i18n_key), variable=var).pack(side=tk.LEFT, padx=3)
-
-        # ショートカットボタン
-        a_shortcut_frame = ttk.Frame(a_frame)
-        a_shortcut_frame.pack(anchor=tk.W, pady=3)
-
-        def a_select_weekdays() -> None:
-            for d in ["mon", "tue", "wed", "thu", "fri"]:
-                a_day_vars[d].set(True)
-            for d in ["sat", "sun"]:
-                a_day_vars[d].set(False)
-
-        def a_select_everyday() -> None:
-            for var in a_day_vars.values():
-                var.set(True)
-
-        ttk.Button(a_shortcut_frame, text=t("settings.weekdays_only"), command=a_select_weekdays, width=10).pack(side=tk.LEFT, padx=3)
-        ttk.Button(a_shortcut_frame, text=t("settings.every_day"), command=a_select_everyday, width=10).pack(side=tk.LEFT, padx=3)
-
-        # 時刻選択（機能 A）
-        ttk.Label(a_frame, text=t("settings.hour_label")).pack(anchor=tk.W, pady=(5, 0))
-        a_hours_frame = ttk.Frame(a_frame)
-        a_hours_frame.pack(anchor=tk.W, pady=3)
-
-        a_existing_hours = [entry.hour for entry in config.schedule.feature_a]
-        a_hour_var = tk.StringVar(master=root, value=", ".join(a_existing_hours))
-        a_hour_entry = ttk.Entry(a_hours_frame, textvariable=a_hour_var, width=30)
-        a_hour_entry.pack(side=tk.LEFT)
-        ttk.Label(a_hours_frame, text=t("settings.hour_hint"), foreground="gray").pack(side=tk.LEFT, padx=5)
-
-        # 機能 B スケジュール
-        ttk.Label(schedule_tab, text=t("settings.feature_b_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(10, 5))
-
-        b_frame = ttk.LabelFrame(schedule_tab, text=t("settings.feature_b_schedule"), padding=8)
-        b_frame.pack(fill=tk.X, pady=(0, 10))
-
-        # 曜日チェックボックス（機能 B）
-        ttk.Label(b_frame, text=t("settings.days_label")).pack(anchor=tk.W)
-        b_day_frame = ttk.Frame(b_frame)
-        b_day_frame.pack(anchor=tk.W, pady=3)
-
-        b_day_vars: dict[str, tk.BooleanVar] = {}
-        b_existing_days: list[str] = []
-        for entry in config.schedule.feature_b:
-            b_existing_days.extend(_parse_day_of_week(entry.day_of_week))
-        b_existing_days = list(set(b_existing_days))
-
-        for i18n_key, key in _WEEKDAY_KEYS:
-            var = tk.BooleanVar(master=root, value=key in b_existing_days)
-            b_day_vars[key] = var
-            ttk.Checkbutton(b_day_frame, text=t(i18n_key), variable=var).pack(side=tk.LEFT, padx=3)
-
-        # ショートカットボタン
-        b_shortcut_frame = ttk.Frame(b_frame)
-        b_shortcut_frame.pack(anchor=tk.W, pady=3)
-
-        def b_select_weekdays() -> None:
-            for d in ["mon", "tue", "wed", "thu", "fri"]:
-                b_day_vars[d].set(True)
-            for d in ["sat", "sun"]:
-                b_day_vars[d].set(False)
-
-        def b_select_everyday() -> None:
-            for var in b_day_vars.values():
-                var.set(True)
-
-        ttk.Button(b_shortcut_frame, text=t("settings.weekdays_only"), command=b_select_weekdays, width=10).pack(side=tk.LEFT, padx=3)
-        ttk.Button(b_shortcut_frame, text=t("settings.every_day"), command=b_select_everyday, width=10).pack(side=tk.LEFT, padx=3)
-
-        # 時刻選択（機能 B）
-        ttk.Label(b_frame, text=t("settings.hour_label")).pack(anchor=tk.W, pady=(5, 0))
-        b_hours_frame = ttk.Frame(b_frame)
-        b_hours_frame.pack(anchor=tk.W, pady=3)
-
-        b_existing_hours = [entry.hour for entry in config.schedule.feature_b]
-        b_hour_var = tk.StringVar(master=root, value=", ".join(b_existing_hours))
-        b_hour_entry = ttk.Entry(b_hours_frame, textvariable=b_hour_var, width=30)
-        b_hour_entry.pack(side=tk.LEFT)
-        ttk.Label(b_hours_frame, text=t("settings.hour_hint"), foreground="gray").pack(side=tk.LEFT, padx=5)
-
-        # 機能 C スケジュール
-        ttk.Label(schedule_tab, text=t("settings.feature_c_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(10, 5))
-
-        c_frame = ttk.LabelFrame(schedule_tab, text=t("settings.feature_c_schedule"), padding=8)
-        c_frame.pack(fill=tk.X, pady=(0, 10))
-
-        # 有効/無効チェックボックス（機能 C）
-        c_enabled_var = tk.BooleanVar(master=root, value=config.page_monitor.enabled)
-        ttk.Checkbutton(c_frame, text=t("settings.feature_c_enabled"), variable=c_enabled_var).pack(anchor=tk.W, pady=(0, 5))
-
-        # 曜日チェックボックス（機能 C）
-        ttk.Label(c_frame, text=t("settings.days_label")).pack(anchor=tk.W)
-        c_day_frame = ttk.Frame(c_frame)
-        c_day_frame.pack(anchor=tk.W, pady=3)
-
-        c_day_vars: dict[str, tk.BooleanVar] = {}
-        c_existing_days: list[str] = []
-        for entry in config.schedule.feature_c:
-            c_existing_days.extend(_parse_day_of_week(entry.day_of_week))
-        c_existing_days = list(set(c_existing_days))
-
-        for i18n_key, key in _WEEKDAY_KEYS:
-            var = tk.BooleanVar(master=root, value=key in c_existing_days)
-            c_day_vars[key] = var
-            ttk.Checkbutton(c_day_frame, text=t(i18n_key), variable=var).pack(side=tk.LEFT, padx=3)
-
-        # ショートカットボタン
-        c_shortcut_frame = ttk.Frame(c_frame)
-        c_shortcut_frame.pack(anchor=tk.W, pady=3)
-
-        def c_select_weekdays() -> None:
-            for d in ["mon", "tue", "wed", "thu", "fri"]:
-                c_day_vars[d].set(True)
-            for d in ["sat", "sun"]:
-                c_day_vars[d].set(False)
-
-        def c_select_everyday() -> None:
-            for var in c_day_vars.values():
-                var.set(True)
-
-        ttk.Button(c_shortcut_frame, text=t("settings.weekdays_only"), command=c_select_weekdays, width=10).pack(side=tk.LEFT, padx=3)
-        ttk.Button(c_shortcut_frame, text=t("settings.every_day"), command=c_select_everyday, width=10).pack(side=tk.LEFT, padx=3)
-
-        # 時刻選択（機能 C）
-        ttk.Label(c_frame, text=t("settings.hour_label")).pack(anchor=tk.W, pady=(5, 0))
-        c_hours_frame = ttk.Frame(c_frame)
-        c_hours_frame.pack(anchor=tk.W, pady=3)
-
-        c_existing_hours = [entry.hour for entry in config.schedule.feature_c]
-        c_hour_var = tk.StringVar(master=root, value=", ".join(c_existing_hours))
-        c_hour_entry = ttk.Entry(c_hours_frame, textvariable=c_hour_var, width=30)
-        c_hour_entry.pack(side=tk.LEFT)
-        ttk.Label(c_hours_frame, text=t("settings.hour_hint"), foreground="gray").pack(side=tk.LEFT, padx=5)
-
-        # 機能 D スケジュール
-        ttk.Label(schedule_tab, text=t("settings.feature_d_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(10, 5))
-
-        d_frame = ttk.LabelFrame(schedule_tab, text=t("settings.feature_d_schedule"), padding=8)
-        d_frame.pack(fill=tk.X, pady=(0, 10))
-
-        # 有効/無効チェックボックス（機能 D）
-        d_enabled_var = tk.BooleanVar(master=root, value=config.feature_d.enabled)
-        ttk.Checkbutton(d_frame, text=t("settings.feature_d_enabled"), variable=d_enabled_var).pack(anchor=tk.W, pady=(0, 5))
-
-        # 曜日チェックボックス（機能 D）
-        ttk.Label(d_frame, text=t("settings.days_label")).pack(anchor=tk.W)
-        d_day_frame = ttk.Frame(d_frame)
-        d_day_frame.pack(anchor=tk.W, pady=3)
-
-        d_day_vars: dict[str, tk.BooleanVar] = {}
-        d_existing_days: list[str] = []
-        for entry in config.schedule.feature_d:
-            d_existing_days.extend(_parse_day_of_week(entry.day_of_week))
-        d_existing_days = list(set(d_existing_days))
-
-        for i18n_key, key in _WEEKDAY_KEYS:
-            var = tk.BooleanVar(master=root, value=key in d_existing_days)
-            d_day_vars[key] = var
-            ttk.Checkbutton(d_day_frame, text=t(i18n_key), variable=var).pack(side=tk.LEFT, padx=3)
-
-        # ショートカットボタン
-        d_shortcut_frame = ttk.Frame(d_frame)
-        d_shortcut_frame.pack(anchor=tk.W, pady=3)
-
-        def d_select_weekdays() -> None:
-            for d in ["mon", "tue", "wed", "thu", "fri"]:
-                d_day_vars[d].set(True)
-            for d in ["sat", "sun"]:
-                d_day_vars[d].set(False)
-
-        def d_select_everyday() -> None:
-            for var in d_day_vars.values():
-                var.set(True)
-
-        ttk.Button(d_shortcut_frame, text=t("settings.weekdays_only"), command=d_select_weekdays, width=10).pack(side=tk.LEFT, padx=3)
-        ttk.Button(d_shortcut_frame, text=t("settings.every_day"), command=d_select_everyday, width=10).pack(side=tk.LEFT, padx=3)
-
-        # 時刻選択（機能 D）
-        ttk.Label(d_frame, text=t("settings.hour_label")).pack(anchor=tk.W, pady=(5, 0))
-        d_hours_frame = ttk.Frame(d_frame)
-        d_hours_frame.pack(anchor=tk.W, pady=3)
-
-        d_existing_hours = [entry.hour for entry in config.schedule.feature_d]
-        d_hour_var = tk.StringVar(master=root, value=", ".join(d_existing_hours))
-        d_hour_entry = ttk.Entry(d_hours_frame, textvariable=d_hour_var, width=30)
-        d_hour_entry.pack(side=tk.LEFT)
-        ttk.Label(d_hours_frame, text=t("settings.hour_hint"), foreground="gray").pack(side=tk.LEFT, padx=5)
+        def build_schedule_tab() -> None:
+            """スケジュールタブの中身を構築する。"""
+            nonlocal a_day_vars, b_day_vars, c_day_vars, d_day_vars
+            nonlocal a_hour_var, b_hour_var, c_hour_var, d_hour_var
+            nonlocal c_enabled_var, d_enabled_var
+
+            schedule_canvas = tk.Canvas(schedule_outer, highlightthickness=0)
+            schedule_scrollbar = ttk.Scrollbar(schedule_outer, orient=tk.VERTICAL, command=schedule_canvas.yview)
+            schedule_tab = ttk.Frame(schedule_canvas, padding=10)
+
+            schedule_tab.bind(
+                "<Configure>",
+                lambda e: schedule_canvas.configure(scrollregion=schedule_canvas.bbox("all")),
+            )
+            schedule_canvas.create_window((0, 0), window=schedule_tab, anchor="nw")
+            schedule_canvas.configure(yscrollcommand=schedule_scrollbar.set)
+
+            schedule_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            schedule_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+            # キャンバス幅を外枠に合わせる
+            def _on_canvas_configure(event: Any) -> None:
+                schedule_canvas.itemconfigure("all", width=event.width)
+
+            schedule_canvas.bind("<Configure>", _on_canvas_configure)
+
+            # マウスホイールスクロール対応
+            def _on_mousewheel(event: Any) -> None:
+                schedule_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+            schedule_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+
+            # 機能 A〜D で共通のラベルは一度だけ翻訳する
+            weekday_labels = [(t(i18n_key), key) for i18n_key, key in _WEEKDAY_KEYS]
+            days_label = t("settings.days_label")
+            hour_label = t("settings.hour_label")
+            hour_hint = t("settings.hour_hint")
+            weekdays_only_label = t("settings.weekdays_only")
+            every_day_label = t("settings.every_day")
+
+            # 時刻入力欄はキー入力の時点で数字・カンマ・空白以外を受け付けない
+            validate_hours = (root.register(_is_valid_hours_input), "%P")
+
+            def build_day_hour_fields(
+                frame: ttk.LabelFrame,
+                entries: list[ScheduleEntry],
+            ) -> tuple[dict[str, tk.BooleanVar], tk.StringVar]:
+                """曜日チェックボックス・ショートカットボタン・時刻入力を frame 内に構築する。
+
+                Args:
+                    frame: 構築先のフレーム。
+                    entries: 既存のスケジュールエントリ（初期値に使用）。
+
+                Returns:
+                    (曜日 → BooleanVar の辞書, 時刻入力の StringVar)。
+                """
+                # 曜日チェックボックス
+                ttk.Label(frame, text=days_label).pack(anchor=tk.W)
+                day_frame = ttk.Frame(frame)
+                day_frame.pack(anchor=tk.W, pady=3)
+
+                # 既存設定から曜日を取得
+                day_mask = 0
+                for entry in entries:
+                    day_mask |= _parse_day_mask(entry.day_of_week)
+
+                day_vars: dict[str, tk.BooleanVar] = {}
+                for label, key in weekday_labels:
+                    var = tk.BooleanVar(master=root, value=bool(day_mask & _DAY_BIT[key]))
+                    day_vars[key] = var
+                    ttk.Checkbutton(day_frame, text=label, variable=var).pack(side=tk.LEFT, padx=3)
+
+                # ショートカットボタン
+                shortcut_frame = ttk.Frame(frame)
+                shortcut_frame.pack(anchor=tk.W, pady=3)
+
+                # 7 個の変数を Tcl スクリプト 1 回の評価でまとめて設定する（変数名は構築後に固定）
+                weekdays_script = "; ".join(
+                    f"set ::{var} {0 if key in _WEEKEND else 1}" for key, var in day_vars.items()
+                )
+                everyday_script = "; ".join(f"set ::{var} 1" for var in day_vars.values())
+
+                def select_weekdays() -> None:
+                    root.tk.eval(weekdays_script)
+
+                def select_everyday() -> None:
+                    root.tk.eval(everyday_script)
+
+                ttk.Button(shortcut_frame, text=weekdays_only_label, command=select_weekdays, width=10).pack(side=tk.LEFT, padx=3)
+                ttk.Button(shortcut_frame, text=every_day_label, command=select_everyday, width=10).pack(side=tk.LEFT, padx=3)
+
+                # 時刻選択
+                ttk.Label(frame, text=hour_label).pack(anchor=tk.W, pady=(5, 0))
+                hours_frame = ttk.Frame(frame)
+                hours_frame.pack(anchor=tk.W, pady=3)
+
+                hour_var = tk.StringVar(master=root, value=", ".join(entry.hour for entry in entries))
+                ttk.Entry(
+                    hours_frame,
+                    textvariable=hour_var,
+                    width=30,
+                    validate="key",
+                    validatecommand=validate_hours,
+                ).pack(side=tk.LEFT)
+                ttk.Label(hours_frame, text=hour_hint, foreground="gray").pack(side=tk.LEFT, padx=5)
+
+                return day_vars, hour_var
+
+            # 機能 A スケジュール
+            ttk.Label(schedule_tab, text=t("settings.feature_a_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(0, 5))
+
+            a_frame = ttk.LabelFrame(schedule_tab, text=t("settings.feature_a_schedule"), padding=8)
+            a_frame.pack(fill=tk.X, pady=(0, 15))
+            a_day_vars, a_hour_var = build_day_hour_fields(a_frame, config.schedule.feature_a)
+
+            # 機能 B スケジュール
+            ttk.Label(schedule_tab, text=t("settings.feature_b_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(10, 5))
+
+            b_frame = ttk.LabelFrame(schedule_tab, text=t("settings.feature_b_schedule"), padding=8)
+            b_frame.pack(fill=tk.X, pady=(0, 10))
+            b_day_vars, b_hour_var = build_day_hour_fields(b_frame, config.schedule.feature_b)
+
+            # 機能 C スケジュール
+            ttk.Label(schedule_tab, text=t("settings.feature_c_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(10, 5))
+
+            c_frame = ttk.LabelFrame(schedule_tab, text=t("settings.feature_c_schedule"), padding=8)
+            c_frame.pack(fill=tk.X, pady=(0, 10))
+
+            # 有効/無効チェックボックス（機能 C）
+            c_enabled_var = tk.BooleanVar(master=root, value=config.page_monitor.enabled)
+            ttk.Checkbutton(c_frame, text=t("settings.feature_c_enabled"), variable=c_enabled_var).pack(anchor=tk.W, pady=(0, 5))
+            c_day_vars, c_hour_var = build_day_hour_fields(c_frame, config.schedule.feature_c)
+
+            # 機能 D スケジュール
+            ttk.Label(schedule_tab, text=t("settings.feature_d_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(10, 5))
+
+            d_frame = ttk.LabelFrame(schedule_tab, text=t("settings.feature_d_schedule"), padding=8)
+            d_frame.pack(fill=tk.X, pady=(0, 10))
+
+            # 有効/無効チェックボックス（機能 D）
+            d_enabled_var = tk.BooleanVar(master=root, value=config.feature_d.enabled)
+            ttk.Checkbutton(d_frame, text=t("settings.feature_d_enabled"), variable=d_enabled_var).pack(anchor=tk.W, pady=(0, 5))
+            d_day_vars, d_hour_var = build_day_hour_fields(d_frame, config.schedule.feature_d)
 
         # ─── タブ2: フォルダ ───
         folder_tab = ttk.Frame(notebook, padding=10)
         notebook.add(folder_tab, text=t("settings.tab.folders"))
 
-        ttk.Label(folder_tab, text=t("settings.target_folders"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(0, 10))
-
-        folder_list_frame = ttk.Frame(folder_tab)
-        folder_list_frame.pack(fill=tk.BOTH, expand=True)
+        def build_folder_tab() -> None:
+            """フォルダタブの中身を構築する。"""
+            nonlocal folder_listbox
 
-        folder_listbox = tk.Listbox(folder_list_frame, height=10)
-        folder_listbox.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
+            ttk.Label(folder_tab, text=t("settings.target_folders"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(0, 10))
 
-        folder_scrollbar = ttk.Scrollbar(folder_list_frame, orient=tk.VERTICAL, command=folder_listbox.yview)
-        folder_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        folder_listbox.config(yscrollcommand=folder_scrollbar.set)
+            folder_list_frame = ttk.Frame(folder_tab)
+            folder_list_frame.pack(fill=tk.BOTH, expand=True)
 
-        # 既存フォルダを表示
-        for folder in config.input_folders:
-            folder_listbox.insert(tk.END, folder)
+            folder_listbox = tk.Listbox(folder_list_frame, height=10)
+            folder_listbox.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
 
-        folder_btn_frame = ttk.Frame(folder_tab)
-        folder_btn_frame.pack(fill=tk.X, pady=(5, 0))
+            folder_scrollbar = ttk.Scrollbar(folder_list_frame, orient=tk.VERTICAL, command=folder_listbox.yview)
+            folder_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            folder_listbox.config(yscrollcommand=folder_scrollbar.set)
 
-        def add_folder() -> None:
-            """フォルダ選択ダイアログで追加する。"""
-            folder = filedialog.askdirectory(title=t("settings.select_folder"))
-            if folder:
-                # 重複チェック
-                existing = list(folder_listbox.get(0, tk.END))
-                if folder not in existing:
-                    folder_listbox.insert(tk.END, folder)
+            # 既存フォルダを表示
+            for folder in config.input_folders:
+                folder_listbox.insert(tk.END, folder)
 
-        def remove_folder() -> None:
-            """選択中のフォルダを削除する。"""
-            selection = folder_listbox.curselection()
-            if selection:
-                folder_listbox.delete(selection[0])
+            # 重複チェック用に一覧の内容を Python 側でも保持する（Tcl からの全件取得を避ける）
+            folder_set = set(config.input_folders)
 
-        ttk.Button(folder_btn_frame, text=t("settings.add"), command=add_folder, width=10).pack(side=tk.LEFT, padx=3)
-        ttk.Button(folder_btn_frame, text=t("settings.remove"), command=remove_folder, width=10).pack(side=tk.LEFT, padx=3)
+            def insert_folder(folder: str) -> None:
+                """未登録のフォルダを一覧に追加する。"""
+                if folder not in folder_set:
+                    folder_listbox.insert(tk.END, folder)
+                    folder_set.add(folder)
+
+            folder_btn_frame = ttk.Frame(folder_tab)
+            folder_btn_frame.pack(fill=tk.X, pady=(5, 0))
+
+            def add_folder() -> None:
+                """フォルダ選択ダイアログで追加する。"""
+                folder = filedialog.askdirectory(title=t("settings.select_folder"))
+                if folder:
+                    insert_folder(folder)
+
+            def remove_folder() -> None:
+                """選択中のフォルダを削除する。"""
+                selection = folder_listbox.curselection()
+                if selection:
+                    folder_set.discard(folder_listbox.get(selection[0]))
+                    folder_listbox.delete(selection[0])
+
+            ttk.Button(folder_btn_frame, text=t("settings.add"), command=add_folder, width=10).pack(side=tk.LEFT, padx=3)
+            ttk.Button(folder_btn_frame, text=t("settings.remove"), command=remove_folder, width=10).pack(side=tk.LEFT, padx=3)
+
+            def create_sample() -> None:
+                """サンプルデータを生成してフォルダ一覧に追加する。"""
+                folder = filedialog.askdirectory(title=t("sample.select_folder"))
+                if not folder:
+                    return
 
-        def create_sample() -> None:
-            """サンプルデータを生成してフォルダ一覧に追加する。"""
-            folder = filedialog.askdirectory(title=t("sample.select_folder"))
-            if not folder:
-                return
-            try:
-                created = generate_sample_data(Path(folder), get_language())
-                if created:
-                    existing = list(folder_listbox.get(0, tk.END))
-                    if folder not in existing:
-                        folder_listbox.insert(tk.END, folder)
-                    messagebox.showinfo(
-                        t("sample.success_title"),
-                        t("sample.success_message", count=len(created)),
-                    )
-                else:
-                    messagebox.showinfo(
-                        t("sample.success_title"),
-                        t("sample.all_exist_message"),
+                from app.sample_data import generate_sample_data
+
+                try:
+                    created = generate_sample_data(Path(folder), get_language())
+                    if created:
+                        insert_folder(folder)
+                        messagebox.showinfo(
+                            t("sample.success_title"),
+                            t("sample.success_message", count=len(created)),
+                        )
+                    else:
+                        messagebox.showinfo(
+                            t("sample.success_title"),
+                            t("sample.all_exist_message"),
+                        )
+                except Exception as exc:
+                    logger.exception("サンプルデータ生成に失敗")
+                    messagebox.showerror(
+                        t("sample.error_title"),
+                        t("sample.error_message", error=str(exc)),
                     )
-            except Exception as exc:
-                logger.exception("サンプルデータ生成に失敗")
-                messagebox.showerror(
-                    t("sample.error_title"),
-                    t("sample.error_message", error=str(exc)),
-                )
 
-        ttk.Button(folder_btn_frame, text=t("sample.button_label"), command=create_sample, width=18).pack(side=tk.LEFT, padx=3)
+            ttk.Button(folder_btn_frame, text=t("sample.button_label"), command=create_sample, width=18).pack(side=tk.LEFT, padx=3)
 
         # ─── タブ3: ページモニター ───
         pm_tab = ttk.Frame(notebook, padding=10)
         notebook.add(pm_tab, text=t("settings.tab.page_monitor"))
 
-        ttk.Label(pm_tab, text=t("settings.page_monitor_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(0, 10))
-
-        # ページ一覧 Treeview
-        pm_tree_frame = ttk.Frame(pm_tab)
-        pm_tree_frame.pack(fill=tk.BOTH, expand=True)
-
-        pm_columns = ("url", "name", "mode", "enabled")
-        pm_tree = ttk.Treeview(pm_tree_frame, columns=pm_columns, show="headings", height=8)
-        pm_tree.heading("url", text=t("settings.page_url_label"))
-        pm_tree.heading("name", text=t("settings.page_name_label"))
-        pm_tree.heading("mode", text=t("settings.page_mode_label"))
-        pm_tree.heading("enabled", text=t("settings.page_enabled"))
-        pm_tree.column("url", width=250)
-        pm_tree.column("name", width=180)
-        pm_tree.column("mode", width=60)
-        pm_tree.column("enabled", width=50)
-        pm_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        pm_scrollbar = ttk.Scrollbar(pm_tree_frame, orient=tk.VERTICAL, command=pm_tree.yview)
-        pm_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        pm_tree.config(yscrollcommand=pm_scrollbar.set)
-
-        # 既存ページを表示
-        for page in config.page_monitor.pages:
-            enabled_mark = "✓" if page.enabled else ""
-            pm_tree.insert("", tk.END, values=(page.url, page.name, page.mode, enabled_mark))
-
-        # ページ追加フレーム
-        pm_add_frame = ttk.LabelFrame(pm_tab, text=t("settings.page_add"), padding=8)
-        pm_add_frame.pack(fill=tk.X, pady=(10, 0))
-
-        url_input_frame = ttk.Frame(pm_add_frame)
-        url_input_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(url_input_frame, text=t("settings.page_url_label")).pack(side=tk.LEFT)
-        pm_url_var = tk.StringVar(master=root)
-        pm_url_entry = ttk.Entry(url_input_frame, textvariable=pm_url_var, width=50)
-        pm_url_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
-
-        pm_btn_frame = ttk.Frame(pm_add_frame)
-        pm_btn_frame.pack(fill=tk.X, pady=(5, 0))
-
-        def pm_add_page() -> None:
-            """URLを一覧に追加する。"""
-            url = pm_url_var.get().strip()
-            if not url:
-                return
-            # 重複チェック
-            for item in pm_tree.get_children():
-                if pm_tree.item(item, "values")[0] == url:
+        def build_page_monitor_tab() -> None:
+            """ページモニタータブの中身を構築する。"""
+            nonlocal pm_tree
+
+            ttk.Label(pm_tab, text=t("settings.page_monitor_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(0, 10))
+
+            # ページ一覧 Treeview
+            pm_tree_frame = ttk.Frame(pm_tab)
+            pm_tree_frame.pack(fill=tk.BOTH, expand=True)
+
+            pm_columns = ("url", "name", "mode", "enabled")
+            pm_tree = ttk.Treeview(pm_tree_frame, columns=pm_columns, show="headings", height=8)
+            pm_tree.heading("url", text=t("settings.page_url_label"))
+            pm_tree.heading("name", text=t("settings.page_name_label"))
+            pm_tree.heading("mode", text=t("settings.page_mode_label"))
+            pm_tree.heading("enabled", text=t("settings.page_enabled"))
+            pm_tree.column("url", width=250)
+            pm_tree.column("name", width=180)
+            pm_tree.column("mode", width=60)
+            pm_tree.column("enabled", width=50)
+            pm_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+            pm_scrollbar = ttk.Scrollbar(pm_tree_frame, orient=tk.VERTICAL, command=pm_tree.yview)
+            pm_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            pm_tree.config(yscrollcommand=pm_scrollbar.set)
+
+            # 既存ページを表示
+            for page in config.page_monitor.pages:
+                enabled_mark = "✓" if page.enabled else ""
+                pm_tree.insert("", tk.END, values=(page.url, page.name, page.mode, enabled_mark))
+
+            # ページ追加フレーム
+            pm_add_frame = ttk.LabelFrame(pm_tab, text=t("settings.page_add"), padding=8)
+            pm_add_frame.pack(fill=tk.X, pady=(10, 0))
+
+            url_input_frame = ttk.Frame(pm_add_frame)
+            url_input_frame.pack(fill=tk.X, pady=2)
+            ttk.Label(url_input_frame, text=t("settings.page_url_label")).pack(side=tk.LEFT)
+            pm_url_var = tk.StringVar(master=root)
+            pm_url_entry = ttk.Entry(url_input_frame, textvariable=pm_url_var, width=50)
+            pm_url_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+
+            pm_btn_frame = ttk.Frame(pm_add_frame)
+            pm_btn_frame.pack(fill=tk.X, pady=(5, 0))
+
+            def pm_add_page() -> None:
+                """URLを一覧に追加する。"""
+                url = pm_url_var.get().strip()
+                if not url:
                     return
-            pm_tree.insert("", tk.END, values=(url, "", "auto", "✓"))
-            pm_url_var.set("")
-
-        def pm_remove_page() -> None:
-            """選択中のページを削除する。"""
-            selected = pm_tree.selection()
-            for item in selected:
-                pm_tree.delete(item)
-
-        def pm_toggle_enabled() -> None:
-            """選択中のページの有効/無効を切り替える。"""
-            selected = pm_tree.selection()
-            for item in selected:
-                vals = list(pm_tree.item(item, "values"))
-                vals[3] = "" if vals[3] == "✓" else "✓"
-                pm_tree.item(item, values=vals)
-
-        ttk.Button(pm_btn_frame, text=t("settings.page_add"), command=pm_add_page, width=10).pack(side=tk.LEFT, padx=3)
-        ttk.Button(pm_btn_frame, text=t("settings.page_remove"), command=pm_remove_page, width=10).pack(side=tk.LEFT, padx=3)
-        ttk.Button(pm_btn_frame, text=t("settings.page_enabled"), command=pm_toggle_enabled, width=10).pack(side=tk.LEFT, padx=3)
+                # 重複チェック
+                for item in pm_tree.get_children():
+                    if pm_tree.item(item, "values")[0] == url:
+                        return
+                pm_tree.insert("", tk.END, values=(url, "", "auto", "✓"))
+                pm_url_var.set("")
+
+            def pm_remove_page() -> None:
+                """選択中のページを削除する。"""
+                selected = pm_tree.selection()
+                for item in selected:
+                    pm_tree.delete(item)
+
+            def pm_toggle_enabled() -> None:
+                """選択中のページの有効/無効を切り替える。"""
+                selected = pm_tree.selection()
+                for item in selected:
+                    vals = list(pm_tree.item(item, "values"))
+                    vals[3] = "" if vals[3] == "✓" else "✓"
+                    pm_tree.item(item, values=vals)
+
+            ttk.Button(pm_btn_frame, text=t("settings.page_add"), command=pm_add_page, width=10).pack(side=tk.LEFT, padx=3)
+            ttk.Button(pm_btn_frame, text=t("settings.page_remove"), command=pm_remove_page, width=10).pack(side=tk.LEFT, padx=3)
+            ttk.Button(pm_btn_frame, text=t("settings.page_enabled"), command=pm_toggle_enabled, width=10).pack(side=tk.LEFT, padx=3)
 
         # ─── タブ4: 通知 ───
         notif_tab = ttk.Frame(notebook, padding=10)
         notebook.add(notif_tab, text=t("settings.tab.notifications"))
 
-        ttk.Label(notif_tab, text=t("settings.notification_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(0, 10))
-
-        notif_enabled_var = tk.BooleanVar(master=root, value=config.notification.enabled)
-        ttk.Checkbutton(
-            notif_tab,
-            text=t("settings.enable_toast"),
-            variable=notif_enabled_var,
-        ).pack(anchor=tk.W, pady=3)
-
-        open_on_click_var = tk.BooleanVar(master=root, value=config.notification.open_file_on_click)
-        ttk.Checkbutton(
-            notif_tab,
-            text=t("settings.open_viewer_on_click"),
-            variable=open_on_click_var,
-        ).pack(anchor=tk.W, pady=3)
+        def build_notification_tab() -> None:
+            """通知タブの中身を構築する。"""
+            nonlocal notif_enabled_var, open_on_click_var
+
+            ttk.Label(notif_tab, text=t("settings.notification_header"), font=("", 11, "bold")).pack(anchor=tk.W, pady=(0, 10))
+
+            notif_enabled_var = tk.BooleanVar(master=root, value=config.notification.enabled)
+            ttk.Checkbutton(
+                notif_tab,
+                text=t("settings.enable_toast"),
+                variable=notif_enabled_var,
+            ).pack(anchor=tk.W, pady=3)
+
+            open_on_click_var = tk.BooleanVar(master=root, value=config.notification.open_file_on_click)
+            ttk.Checkbutton(
+                notif_tab,
+                text=t("settings.open_viewer_on_click"),
+                variable=open_on_click_var,
+            ).pack(anchor=tk.W, pady=3)
+
+        # タブ（ウィジェット名）→ 未実行の構築関数
+        tab_builders: dict[str, Callable[[], None]] = {
+            str(schedule_outer): build_schedule_tab,
+            str(folder_tab): build_folder_tab,
+            str(pm_tab): build_page_monitor_tab,
+            str(notif_tab): build_notification_tab,
+        }
+
+        def on_tab_changed(event: Any) -> None:
+            """初めて選択されたタブの中身を構築する。"""
+            builder = tab_builders.pop(notebook.select(), None)
+            if builder is not None:
+                builder()
+
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
 
         # ─── ボタンフレーム ───
         btn_frame = ttk.Frame(root)
@@ -600,90 +697,106 @@ def open_settings(
         def on_save_click() -> None:
             """設定を保存して閉じる。"""
             # 変更前の値を保存
-            old_schedule_a = [(e.day_of_week, e.hour) for e in config.schedule.feature_a]
-            old_schedule_b = [(e.day_of_week, e.hour) for e in config.schedule.feature_b]
+            old_schedule_a = _schedule_snapshot(config.schedule.feature_a)
+            old_schedule_b = _schedule_snapshot(config.schedule.feature_b)
+            old_schedule_c = _schedule_snapshot(config.schedule.feature_c)
+            old_schedule_d = _schedule_snapshot(config.schedule.feature_d)
+            new_schedule_a = old_schedule_a
+            new_schedule_b = old_schedule_b
+            new_schedule_c = old_schedule_c
+            new_schedule_d = old_schedule_d
+            old_page_monitor_enabled = config.page_monitor.enabled
+            old_pages = _pages_snapshot(config.page_monitor.pages)
+            old_feature_d_enabled = config.feature_d.enabled
             old_folders = list(config.input_folders)
             old_notif_enabled = config.notification.enabled
             old_notif_click = config.notification.open_file_on_click
             old_run_at_startup = config.run_at_startup
 
-            # スケジュール A
-            a_selected_days = [k for k, v in a_day_vars.items() if v.get()]
-            a_hours = [h.strip() for h in a_hour_var.get().split(",") if h.strip()]
-            a_day_str = _days_to_string(a_selected_days)
-
-            config.schedule.feature_a = [
-                ScheduleEntry(day_of_week=a_day_str, hour=h) for h in a_hours
-            ] if a_hours else [ScheduleEntry(day_of_week=a_day_str, hour="9")]
-
-            # スケジュール B
-            b_selected_days = [k for k, v in b_day_vars.items() if v.get()]
-            b_hours = [h.strip() for h in b_hour_var.get().split(",") if h.strip()]
-            b_day_str = _days_to_string(b_selected_days)
-
-            config.schedule.feature_b = [
-                ScheduleEntry(day_of_week=b_day_str, hour=h) for h in b_hours
-            ] if b_hours else [ScheduleEntry(day_of_week=b_day_str, hour="8")]
-
-            # スケジュール C
-            c_selected_days = [k for k, v in c_day_vars.items() if v.get()]
-            c_hours = [h.strip() for h in c_hour_var.get().split(",") if h.strip()]
-            c_day_str = _days_to_string(c_selected_days)
-
-            config.schedule.feature_c = [
-                ScheduleEntry(day_of_week=c_day_str, hour=h) for h in c_hours
-            ] if c_hours else [ScheduleEntry(day_of_week=c_day_str, hour="8")]
-
-            # ページモニター有効/無効
-            config.page_monitor.enabled = c_enabled_var.get()
-
-            # スケジュール D
-            d_selected_days = [k for k, v in d_day_vars.items() if v.get()]
-            d_hours = [h.strip() for h in d_hour_var.get().split(",") if h.strip()]
-            d_day_str = _days_to_string(d_selected_days)
-
-            config.schedule.feature_d = [
-                ScheduleEntry(day_of_week=d_day_str, hour=h) for h in d_hours
-            ] if d_hours else [ScheduleEntry(day_of_week=d_day_str, hour="8")]
-
-            # 機能 D 有効/無効
-            config.feature_d.enabled = d_enabled_var.get()
-
-            # ページモニター URL 一覧
-            new_pages: list[MonitoredPage] = []
-            existing_map = {p.url: p for p in config.page_monitor.pages}
-            for item in pm_tree.get_children():
-                vals = pm_tree.item(item, "values")
-                url = str(vals[0])
-                # 既存ページの設定を引き継ぎ、新規はデフォルト
-                if url in existing_map:
-                    page = existing_map[url]
-                    page.enabled = str(vals[3]) == "✓"
-                    new_pages.append(page)
-                else:
-                    new_pages.append(MonitoredPage(
-                        url=url,
-                        enabled=str(vals[3]) == "✓",
-                    ))
-            config.page_monitor.pages = new_pages
+            # スケジュール（タブ未表示なら変更なし。A〜D の変数はまとめて構築される）
+            if a_day_vars is not None:
+                # スケジュール A
+                a_selected_days = [k for k, v in a_day_vars.items() if v.get()]
+                a_hours = _HOURS_RE.findall(a_hour_var.get())
+                a_day_str = _days_to_string(a_selected_days)
 
-            # フォルダ
-            config.input_folders = list(folder_listbox.get(0, tk.END))
+                config.schedule.feature_a = _rebuild_schedule(
+                    config.schedule.feature_a, a_day_str, a_hours, "9",
+                )
+
+                # スケジュール B
+                b_selected_days = [k for k, v in b_day_vars.items() if v.get()]
+                b_hours = _HOURS_RE.findall(b_hour_var.get())
+                b_day_str = _days_to_string(b_selected_days)
+
+                config.schedule.feature_b = _rebuild_schedule(
+                    config.schedule.feature_b, b_day_str, b_hours, "8",
+                )
+
+                # スケジュール C
+                c_selected_days = [k for k, v in c_day_vars.items() if v.get()]
+                c_hours = _HOURS_RE.findall(c_hour_var.get())
+                c_day_str = _days_to_string(c_selected_days)
+
+                config.schedule.feature_c = _rebuild_schedule(
+                    config.schedule.feature_c, c_day_str, c_hours, "8",
+                )
+
+                # ページモニター有効/無効
+                config.page_monitor.enabled = c_enabled_var.get()
+
+                # スケジュール D
+                d_selected_days = [k for k, v in d_day_vars.items() if v.get()]
+                d_hours = _HOURS_RE.findall(d_hour_var.get())
+                d_day_str = _days_to_string(d_selected_days)
 
-            # 通知
-            config.notification.enabled = notif_enabled_var.get()
-            config.notification.open_file_on_click = open_on_click_var.get()
+                config.schedule.feature_d = _rebuild_schedule(
+                    config.schedule.feature_d, d_day_str, d_hours, "8",
+                )
+
+                # 機能 D 有効/無効
+                config.feature_d.enabled = d_enabled_var.get()
+
+                new_schedule_a = _schedule_snapshot(config.schedule.feature_a)
+                new_schedule_b = _schedule_snapshot(config.schedule.feature_b)
+                new_schedule_c = _schedule_snapshot(config.schedule.feature_c)
+                new_schedule_d = _schedule_snapshot(config.schedule.feature_d)
+
+            # ページモニター URL 一覧（タブ未表示なら変更なし）
+            if pm_tree is not None:
+                new_pages: list[MonitoredPage] = []
+                existing_map = {p.url: p for p in config.page_monitor.pages}
+                for item in pm_tree.get_children():
+                    vals = pm_tree.item(item, "values")
+                    url = str(vals[0])
+                    # 既存ページの設定を引き継ぎ、新規はデフォルト
+                    if url in existing_map:
+                        page = existing_map[url]
+                        page.enabled = str(vals[3]) == "✓"
+                        new_pages.append(page)
+                    else:
+                        new_pages.append(MonitoredPage(
+                            url=url,
+                            enabled=str(vals[3]) == "✓",
+                        ))
+                config.page_monitor.pages = new_pages
+
+            # フォルダ（タブ未表示なら変更なし）
+            if folder_listbox is not None:
+                config.input_folders = list(folder_listbox.get(0, tk.END))
+
+            # 通知（タブ未表示なら変更なし）
+            if notif_enabled_var is not None and open_on_click_var is not None:
+                config.notification.enabled = notif_enabled_var.get()
+                config.notification.open_file_on_click = open_on_click_var.get()
 
             # 言語
             old_language = config.language
-            selected_label = lang_var.get()
-            for code, label in SUPPORTED_LANGUAGES.items():
-                if label == selected_label:
-                    config.language = code
-                    set_language(code)
-                    break
+            config.language = _LABEL_TO_CODE.get(lang_var.get(), old_language)
 
             language_changed = old_language != config.language
+            if language_changed:
+                set_language(config.language)
 
             # 自動起動（PC 起動時）
             config.run_at_startup = startup_var.get()
@@ -695,23 +808,33 @@ def open_settings(
                     )
 
             # 変更内容をログに記録
-            _log_setting_changes(
+            changed = _log_setting_changes(
                 config,
                 old_language=old_language,
                 old_schedule_a=old_schedule_a,
+                new_schedule_a=new_schedule_a,
                 old_schedule_b=old_schedule_b,
+                new_schedule_b=new_schedule_b,
+                old_schedule_c=old_schedule_c,
+                new_schedule_c=new_schedule_c,
+                old_schedule_d=old_schedule_d,
+                new_schedule_d=new_schedule_d,
+                old_page_monitor_enabled=old_page_monitor_enabled,
+                old_pages=old_pages,
+                old_feature_d_enabled=old_feature_d_enabled,
                 old_folders=old_folders,
                 old_notif_enabled=old_notif_enabled,
                 old_notif_click=old_notif_click,
                 old_run_at_startup=old_run_at_startup,
             )
 
-            # config.yaml に保存
-            config_module.save(config)
+            # config.yaml に保存（変更がなければ保存もスケジュール再登録も行わない）
+            if changed:
+                config_module.save(config)
 
-            # コールバック
-            if on_save is not None:
-                on_save(config)
+                # コールバック
+                if on_save is not None:
+                    on_save(config)
 
             root.destroy()
 
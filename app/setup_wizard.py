@@ -7,12 +7,19 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 import logging
+import os
+import shutil
 import subprocess
+import time
 import tkinter as tk
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 from app import config as config_module
 
@@ -22,29 +29,96 @@ from app.i18n import get_language, t
 from app.sample_data import generate_sample_data
 
 if TYPE_CHECKING:
-    pass
+    from app.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# 前提チェックのキャッシュ有効期間（秒）
+_GH_CHECK_TTL = 60.0
+_LICENSE_CHECK_TTL = 300.0
+
+# ウィンドウアイコン（PNG）
+_ICON_PATH = Path(__file__).resolve().parent.parent / "assets" / "icon_normal.png"
+
+# 前提チェックの ID（_run_checks_async の結果と同じ順序）
+_CHECK_IDS = ("gh", "auth", "license", "folders")
+
+
+@dataclass(slots=True)
+class _Check:
+    """前提チェック1項目の表示内容。"""
+
+    id: str
+    name: str
+    ok: bool
+    message: str
+
+
+# gh --version の結果（(実行ファイルのパス, 更新日時) → バージョン文字列）
+# gh を更新すると更新日時が変わるため、再度 gh --version を実行する
+_gh_version_cache: dict[tuple[str, float], str] = {}
+
+# 成功した前提チェックの結果（チェック名 → (有効期限, (成否, メッセージ))）
+_check_cache: dict[str, tuple[float, tuple[bool, str]]] = {}
+
+
+async def _cached_check(
+    name: str,
+    ttl: float,
+    check: Callable[[], Awaitable[tuple[bool, str]]],
+) -> tuple[bool, str]:
+    """有効期限内の成功結果があれば再利用し、なければチェックを実行する。
+
+    失敗した結果はキャッシュしない。「再チェック」ではキャッシュを
+    破棄してから実行するため、すべての項目が確認し直される。
+
+    Args:
+        name: キャッシュのキーとなるチェック名。
+        ttl: 成功結果を再利用する秒数。
+        check: (成否, メッセージ) を返すコルーチンを作る関数。
+
+    Returns:
+        (成否, メッセージ) のタプル。
+    """
+    now = time.monotonic()
+    cached = _check_cache.get(name)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    result = await check()
+    if result[0]:
+        _check_cache[name] = (now + ttl, result)
+    return result
+
 
 def _check_gh_cli() -> tuple[bool, str]:
     """GitHub CLI (gh) のインストール状態を確認する。
 
+    インストール有無は PATH の検索だけで判定し、gh --version は
+    実行ファイルが変わったとき（初回・更新時）にだけ実行する。
+
     Returns:
         (成否, メッセージ) のタプル。
     """
+    gh_path = shutil.which("gh")
+    if gh_path is None:
+        return False, t("wizard.gh_cli_not_installed")
+
     try:
-        result = subprocess.run(
-            ["gh", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            encoding="utf-8",
-        )
-        if result.returncode == 0:
+        key = (gh_path, os.stat(gh_path).st_mtime)
+        version = _gh_version_cache.get(key)
+        if version is None:
+            result = subprocess.run(
+                [gh_path, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+                encoding="utf-8",
+            )
+            if result.returncode != 0:
+                return False, t("wizard.gh_cli_not_working")
             version = result.stdout.strip().split("\n")[0]
-            return True, f"GitHub CLI: {version}"
-        return False, t("wizard.gh_cli_not_working")
+            _gh_version_cache[key] = version
+        return True, f"GitHub CLI: {version}"
     except FileNotFoundError:
         return False, t("wizard.gh_cli_not_installed")
     except subprocess.TimeoutExpired:
@@ -59,9 +133,13 @@ def _check_gh_auth() -> tuple[bool, str]:
     Returns:
         (成否, メッセージ) のタプル。
     """
+    gh_path = shutil.which("gh")
+    if gh_path is None:
+        return False, t("wizard.gh_cli_not_found_skip")
+
     try:
         result = subprocess.run(
-            ["gh", "auth", "status"],
+            [gh_path, "auth", "status"],
             capture_output=True,
             text=True,
             timeout=15,
@@ -98,24 +176,7 @@ async def _check_copilot_license_async(
         return False, t("wizard.copilot_license_check_failed", error=e)
 
 
-def _check_copilot_license(
-    copilot_client: CopilotClientWrapper,
-) -> tuple[bool, str]:
-    """Copilot ライセンスを確認する（同期ラッパー）。
-
-    Args:
-        copilot_client: Copilot クライアントラッパー。
-
-    Returns:
-        (成否, メッセージ) のタプル。
-    """
-    try:
-        return asyncio.run(_check_copilot_license_async(copilot_client))
-    except Exception as e:
-        return False, t("wizard.copilot_license_check_failed", error=e)
-
-
-def _check_copilot_license_standalone(
+async def _check_copilot_license_standalone_async(
     sdk_config: CopilotSdkConfig,
 ) -> tuple[bool, str]:
     """一時的に Copilot クライアントを起動してライセンスを確認する。
@@ -129,7 +190,7 @@ def _check_copilot_license_standalone(
     Returns:
         (成否, メッセージ) のタプル。
     """
-    async def _check() -> tuple[bool, str]:
+    try:
         client = CopilotClientWrapper(sdk_config)
         await client.__aenter__()
         try:
@@ -139,9 +200,6 @@ def _check_copilot_license_standalone(
             return False, t("wizard.copilot_license_not_assigned")
         finally:
             await client.__aexit__(None, None, None)
-
-    try:
-        return asyncio.run(_check())
     except Exception as e:
         return False, t("wizard.copilot_license_check_failed", error=e)
 
@@ -163,64 +221,191 @@ def _check_input_folders(config: AppConfig) -> tuple[bool, str]:
     return False, t("wizard.folders_not_set")
 
 
+def _saved_license_result(
+    state_manager: StateManager,
+    cache_hours: int,
+    *,
+    now: datetime | None = None,
+) -> tuple[bool, str] | None:
+    """state.json に記録された前回のライセンス確認成功が有効期間内なら、その結果を返す。
+
+    Args:
+        state_manager: 状態マネージャ。
+        cache_hours: 確認結果を再利用する時間。0 以下なら再利用しない。
+        now: 基準日時。None の場合は datetime.now() を使用。
+
+    Returns:
+        (True, メッセージ) のタプル。再利用できない場合は None。
+    """
+    last_ok_at = state_manager.state.last_license_ok_at
+    if cache_hours <= 0 or not last_ok_at:
+        return None
+    try:
+        checked_at = datetime.fromisoformat(last_ok_at)
+    except ValueError:
+        return None
+
+    if now is None:
+        now = datetime.now()
+    if not timedelta(0) <= now - checked_at < timedelta(hours=cache_hours):
+        return None
+    return True, t(
+        "wizard.copilot_license_ok_cached",
+        checked_at=checked_at.strftime("%Y-%m-%d %H:%M"),
+    )
+
+
+async def _run_checks_async(
+    config: AppConfig,
+    copilot_client: CopilotClientWrapper | None,
+    state_manager: StateManager | None = None,
+    *,
+    use_saved_license: bool = False,
+) -> list[tuple[bool, str]]:
+    """4項目の前提チェックを実行する。
+
+    互いに独立した gh CLI / 認証 / input_folders のチェックはスレッドで並行実行し、
+    Copilot ライセンスは gh CLI と認証の結果が揃ってから確認する。
+
+    Args:
+        config: アプリケーション設定。
+        copilot_client: Copilot クライアントラッパー。
+        state_manager: 状態マネージャ。指定時はライセンス確認の成功日時を記録する。
+        use_saved_license: True の場合、記録済みの成功日時が有効期間内なら
+            一時クライアントを起動せずにライセンス確認済みとみなす。
+
+    Returns:
+        gh CLI・認証・ライセンス・input_folders の順の (成否, メッセージ) のリスト。
+    """
+    (gh_ok, gh_msg), (auth_ok, auth_msg), folders = await asyncio.gather(
+        _cached_check("gh", _GH_CHECK_TTL, lambda: asyncio.to_thread(_check_gh_cli)),
+        _cached_check("auth", _GH_CHECK_TTL, lambda: asyncio.to_thread(_check_gh_auth)),
+        asyncio.to_thread(_check_input_folders, config),
+    )
+
+    if copilot_client is not None:
+        license_result = await _cached_check(
+            "license", _LICENSE_CHECK_TTL,
+            lambda: _check_copilot_license_async(copilot_client),
+        )
+    elif gh_ok and auth_ok:
+        saved = None
+        if use_saved_license and state_manager is not None:
+            saved = _saved_license_result(state_manager, config.copilot_sdk.license_cache_hours)
+        if saved is not None:
+            license_result = saved
+        else:
+            # gh + 認証 OK なら一時クライアントでライセンスチェック
+            license_result = await _cached_check(
+                "license", _LICENSE_CHECK_TTL,
+                lambda: _check_copilot_license_standalone_async(config.copilot_sdk),
+            )
+            if license_result[0] and state_manager is not None:
+                try:
+                    state_manager.update_license_ok_at()
+                    state_manager.save()
+                except Exception:
+                    logger.exception("ライセンス確認日時の保存に失敗")
+    else:
+        license_result = (False, t("wizard.complete_auth_first"))
+
+    return [(gh_ok, gh_msg), (auth_ok, auth_msg), license_result, folders]
+
+
+async def _recheck_async(
+    config: AppConfig,
+    copilot_client: CopilotClientWrapper | None,
+    state_manager: StateManager | None = None,
+) -> list[tuple[bool, str]]:
+    """キャッシュ済みの結果を破棄して前提チェックをやり直す。
+
+    Args:
+        config: アプリケーション設定。
+        copilot_client: Copilot クライアントラッパー。
+        state_manager: 状態マネージャ。
+
+    Returns:
+        _run_checks_async() と同じ (成否, メッセージ) のリスト。
+    """
+    _check_cache.clear()
+    return await _run_checks_async(config, copilot_client, state_manager)
+
+
+@lru_cache(maxsize=1)
+def _load_icon_data() -> str | None:
+    """ウィンドウアイコンの PNG を base64 文字列として読み込む（結果はキャッシュ）。
+
+    PhotoImage は Tk ルートごとに作り直す必要があるため、
+    ファイルの解決と読み込みだけを1回で済ませる。
+
+    Returns:
+        base64 エンコード済みの PNG データ。ファイルがない場合は None。
+    """
+    try:
+        return base64.b64encode(_ICON_PATH.read_bytes()).decode("ascii")
+    except OSError:
+        return None
+
+
 def run_wizard(
     config: AppConfig,
     copilot_client: CopilotClientWrapper | None = None,
+    state_manager: StateManager | None = None,
 ) -> bool:
     """セットアップウィザードを実行する。
 
     4項目の前提チェックを行い、条件未達の場合は GUI で案内する。
     すべてのチェックをパスした場合のみ True を返す。
 
+    state_manager を渡すと、前回のライセンス確認成功から
+    copilot_sdk.license_cache_hours 以内の起動ではライセンス確認を省略する。
+    「再チェック」では常にライセンスを確認し直す。
+
     Args:
         config: アプリケーション設定。
         copilot_client: Copilot クライアントラッパー。
+        state_manager: 状態マネージャ。
 
     Returns:
         すべてのチェックにパスした場合は True。
     """
     logger.info("セットアップウィザードを開始します")
 
-    # 各チェックの実行
-    checks: list[dict[str, object]] = []
-
-    # 1. gh CLI
-    gh_ok, gh_msg = _check_gh_cli()
-    checks.append({"name": "GitHub CLI", "ok": gh_ok, "message": gh_msg, "id": "gh"})
-
-    # 2. gh auth
-    auth_ok, auth_msg = _check_gh_auth()
-    checks.append({"name": t("wizard.check_name_gh_auth"), "ok": auth_ok, "message": auth_msg, "id": "auth"})
-
-    # 3. Copilot ライセンス
-    if copilot_client is not None:
-        license_ok, license_msg = _check_copilot_license(copilot_client)
-    elif gh_ok and auth_ok:
-        # gh + 認証 OK なら一時クライアントでライセンスチェック
-        license_ok, license_msg = _check_copilot_license_standalone(config.copilot_sdk)
-    else:
-        license_ok, license_msg = False, t("wizard.complete_auth_first")
-    checks.append({"name": t("wizard.check_name_copilot_license"), "ok": license_ok, "message": license_msg, "id": "license"})
-
-    # 4. input_folders
-    folders_ok, folders_msg = _check_input_folders(config)
-    checks.append({"name": t("wizard.check_name_folders"), "ok": folders_ok, "message": folders_msg, "id": "folders"})
-
-    # すべてパスしていれば GUI を表示せずに返す
-    all_ok = all(c["ok"] for c in checks)
-    if all_ok:
-        logger.info("セットアップウィザード: すべてのチェックにパスしました")
-        return True
-
-    # GUI を表示
-    logger.info("セットアップウィザード: 未達項目があるため GUI を表示します")
-    return _show_wizard_dialog(config, checks, copilot_client)
+    # 起動時チェックと「再チェック」で同じイベントループを使い回す
+    with asyncio.Runner() as runner:
+        # 各チェックの実行（gh CLI / 認証 / input_folders は並行実行）
+        names = (
+            "GitHub CLI",
+            t("wizard.check_name_gh_auth"),
+            t("wizard.check_name_copilot_license"),
+            t("wizard.check_name_folders"),
+        )
+        checks = [
+            _Check(id=check_id, name=name, ok=ok, message=message)
+            for check_id, name, (ok, message) in zip(
+                _CHECK_IDS, names, runner.run(_run_checks_async(
+                    config, copilot_client, state_manager, use_saved_license=True,
+                )),
+            )
+        ]
+
+        # すべてパスしていれば GUI を表示せずに返す
+        all_ok = all(c.ok for c in checks)
+        if all_ok:
+            logger.info("セットアップウィザード: すべてのチェックにパスしました")
+            return True
+
+        # GUI を表示
+        logger.info("セットアップウィザード: 未達項目があるため GUI を表示します")
+        return _show_wizard_dialog(config, checks, copilot_client, state_manager, runner)
 
 
 def _show_wizard_dialog(
     config: AppConfig,
-    checks: list[dict[str, object]],
+    checks: list[_Check],
     copilot_client: CopilotClientWrapper | None,
+    state_manager: StateManager | None,
+    runner: asyncio.Runner,
 ) -> bool:
     """セットアップウィザードの GUI ダイアログを表示する。
 
@@ -228,6 +413,8 @@ def _show_wizard_dialog(
         config: アプリケーション設定。
         checks: チェック結果のリスト。
         copilot_client: Copilot クライアントラッパー。
+        state_manager: 状態マネージャ。
+        runner: 再チェックに使うイベントループのランナー。
 
     Returns:
         すべてのチェックにパスした場合は True。
@@ -241,10 +428,10 @@ def _show_wizard_dialog(
         root.resizable(False, False)
 
         # ウィンドウアイコン設定
-        _icon_path = Path(__file__).resolve().parent.parent / "assets" / "icon_normal.png"
-        if _icon_path.exists():
+        icon_data = _load_icon_data()
+        if icon_data is not None:
             try:
-                _icon_img = tk.PhotoImage(file=str(_icon_path))
+                _icon_img = tk.PhotoImage(master=root, data=icon_data)
                 root.iconphoto(True, _icon_img)
             except Exception:
                 pass  # アイコン設定失敗は無視
@@ -268,28 +455,31 @@ def _show_wizard_dialog(
         check_frame = ttk.LabelFrame(main_frame, text=t("wizard.prerequisites_check"), padding=10)
         check_frame.pack(fill=tk.X, pady=(0, 10))
 
-        status_labels: dict[str, ttk.Label] = {}
-        msg_labels: dict[str, ttk.Label] = {}
+        # 表示文字列は StringVar 経由で更新する（ラベルの再設定より Tcl 呼び出しが少ない）
+        status_vars: dict[str, tk.StringVar] = {}
+        msg_vars: dict[str, tk.StringVar] = {}
 
         for check in checks:
             row = ttk.Frame(check_frame)
             row.pack(fill=tk.X, pady=3)
 
-            icon = "✅" if check["ok"] else "❌"
-            status_lbl = ttk.Label(row, text=f"{icon} {check['name']}", width=25)
-            status_lbl.pack(side=tk.LEFT)
-            status_labels[str(check["id"])] = status_lbl
+            icon = "✅" if check.ok else "❌"
+            status_var = tk.StringVar(master=root, value=f"{icon} {check.name}")
+            ttk.Label(row, textvariable=status_var, width=25).pack(side=tk.LEFT)
+            status_vars[check.id] = status_var
 
-            msg_lbl = ttk.Label(row, text=str(check["message"]), foreground="gray")
-            msg_lbl.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            msg_labels[str(check["id"])] = msg_lbl
+            msg_var = tk.StringVar(master=root, value=check.message)
+            ttk.Label(row, textvariable=msg_var, foreground="gray").pack(
+                side=tk.LEFT, fill=tk.X, expand=True
+            )
+            msg_vars[check.id] = msg_var
 
         # アクションフレーム
         action_frame = ttk.LabelFrame(main_frame, text=t("wizard.remediation"), padding=10)
         action_frame.pack(fill=tk.X, pady=(0, 10))
 
         # gh CLI 未インストール
-        if not checks[0]["ok"]:
+        if not checks[0].ok:
             gh_frame = ttk.Frame(action_frame)
             gh_frame.pack(fill=tk.X, pady=3)
             ttk.Label(gh_frame, text=t("wizard.gh_cli_label")).pack(side=tk.LEFT)
@@ -313,7 +503,7 @@ def _show_wizard_dialog(
             ttk.Button(gh_frame, text=t("wizard.open_download_page"), command=open_gh_download).pack(side=tk.LEFT, padx=5)
 
         # gh auth 未ログイン
-        if not checks[1]["ok"] and checks[0]["ok"]:
+        if not checks[1].ok and checks[0].ok:
             auth_frame = ttk.Frame(action_frame)
             auth_frame.pack(fill=tk.X, pady=3)
             ttk.Label(auth_frame, text=t("wizard.gh_auth_label")).pack(side=tk.LEFT)
@@ -331,7 +521,7 @@ def _show_wizard_dialog(
             ttk.Button(auth_frame, text=t("wizard.login"), command=run_gh_login).pack(side=tk.LEFT, padx=5)
 
         # Copilot ライセンス
-        if not checks[2]["ok"]:
+        if not checks[2].ok:
             license_frame = ttk.Frame(action_frame)
             license_frame.pack(fill=tk.X, pady=3)
             ttk.Label(
@@ -341,7 +531,7 @@ def _show_wizard_dialog(
             ).pack(side=tk.LEFT)
 
         # input_folders
-        if not checks[3]["ok"]:
+        if not checks[3].ok:
             folder_frame = ttk.Frame(action_frame)
             folder_frame.pack(fill=tk.X, pady=3)
             ttk.Label(folder_frame, text=t("wizard.folders_action_label")).pack(side=tk.LEFT)
@@ -355,9 +545,9 @@ def _show_wizard_dialog(
                     config_module.save(config)
 
                     # 表示を更新
-                    status_labels["folders"].config(text=f"✅ {t('wizard.check_name_folders')}")
-                    msg_labels["folders"].config(text=t("wizard.folder_configured_msg", folder=folder))
-                    checks[3]["ok"] = True
+                    status_vars["folders"].set(f"✅ {t('wizard.check_name_folders')}")
+                    msg_vars["folders"].set(t("wizard.folder_configured_msg", folder=folder))
+                    checks[3].ok = True
                     logger.info("input_folders を設定: %s", folder)
 
             ttk.Button(folder_frame, text=t("wizard.select_folder"), command=select_folder).pack(side=tk.LEFT, padx=5)
@@ -373,11 +563,9 @@ def _show_wizard_dialog(
                         if folder not in config.input_folders:
                             config.input_folders.append(folder)
                         config_module.save(config)
-                        status_labels["folders"].config(text=f"✅ {t('wizard.check_name_folders')}")
-                        msg_labels["folders"].config(
-                            text=t("wizard.folder_configured_msg", folder=folder)
-                        )
-                        checks[3]["ok"] = True
+                        status_vars["folders"].set(f"✅ {t('wizard.check_name_folders')}")
+                        msg_vars["folders"].set(t("wizard.folder_configured_msg", folder=folder))
+                        checks[3].ok = True
                         messagebox.showinfo(
                             t("sample.success_title"),
                             t("sample.success_message", count=len(created)),
@@ -402,36 +590,20 @@ def _show_wizard_dialog(
 
         def on_recheck() -> None:
             """すべてのチェックを再実行する。"""
-            gh_ok_new, gh_msg_new = _check_gh_cli()
-            checks[0]["ok"] = gh_ok_new
-            checks[0]["message"] = gh_msg_new
-
-            auth_ok_new, auth_msg_new = _check_gh_auth()
-            checks[1]["ok"] = auth_ok_new
-            checks[1]["message"] = auth_msg_new
-
-            if copilot_client is not None:
-                lic_ok_new, lic_msg_new = _check_copilot_license(copilot_client)
-            elif gh_ok_new and auth_ok_new:
-                lic_ok_new, lic_msg_new = _check_copilot_license_standalone(config.copilot_sdk)
-            else:
-                lic_ok_new, lic_msg_new = False, t("wizard.complete_auth_first")
-            checks[2]["ok"] = lic_ok_new
-            checks[2]["message"] = lic_msg_new
-
-            fld_ok_new, fld_msg_new = _check_input_folders(config)
-            checks[3]["ok"] = fld_ok_new
-            checks[3]["message"] = fld_msg_new
+            for check, (ok, message) in zip(
+                checks, runner.run(_recheck_async(config, copilot_client, state_manager)),
+            ):
+                check.ok = ok
+                check.message = message
 
             # 表示を更新
             for check in checks:
-                cid = str(check["id"])
-                icon = "✅" if check["ok"] else "❌"
-                status_labels[cid].config(text=f"{icon} {check['name']}")
-                msg_labels[cid].config(text=str(check["message"]))
+                icon = "✅" if check.ok else "❌"
+                status_vars[check.id].set(f"{icon} {check.name}")
+                msg_vars[check.id].set(check.message)
 
             # 全パスなら自動的に閉じる
-            if all(c["ok"] for c in checks):
+            if all(c.ok for c in checks):
                 result["passed"] = True
                 root.destroy()
 
@@ -441,11 +613,11 @@ def _show_wizard_dialog(
             すべてのチェックをパスしている場合のみウィザードを閉じて通常起動に進む。
             未達項目がある場合は警告メッセージを表示し、ウィザードは閉じない。
             """
-            if all(c["ok"] for c in checks):
+            if all(c.ok for c in checks):
                 result["passed"] = True
                 root.destroy()
             else:
-                failed = [str(c["name"]) for c in checks if not c["ok"]]
+                failed = [c.name for c in checks if not c.ok]
                 items_str = "\n".join(f"  ・{name}" for name in failed)
                 messagebox.showwarning(
                     t("wizard.prerequisites_incomplete_title"),
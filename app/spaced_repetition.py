@@ -7,7 +7,8 @@ SM-2 を簡略化したレベル制（Level 0〜5）で、トピックごとの
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from app.config import SpacedRepetitionConfig
@@ -19,6 +20,27 @@ logger = logging.getLogger(__name__)
 # デフォルト間隔表（Level → 日数）
 _DEFAULT_INTERVALS = [1, 3, 7, 14, 30, 60]
 
+# レベル変化の規則（レベル増分, ログ用ラベル）。増分 None は Level 0 へのリセット
+_LEVEL_UP: tuple[int | None, str] = (1, "昇格")
+_LEVEL_STAY: tuple[int | None, str] = (0, "据え置き")
+_LEVEL_RESET: tuple[int | None, str] = (None, "降格")
+
+# (Q1 正解, Q2 評価) → レベル変化の規則。表にない Q2 評価は Q1 の正誤で決める
+_LEVEL_RULES: dict[tuple[bool, str], tuple[int | None, str]] = {
+    (True, "good"): _LEVEL_UP,
+    (True, "partial"): _LEVEL_STAY,
+    (True, "poor"): _LEVEL_RESET,
+    (False, "good"): _LEVEL_RESET,
+    (False, "partial"): _LEVEL_RESET,
+    (False, "poor"): _LEVEL_RESET,
+}
+
+
+@lru_cache(maxsize=None)
+def _interval_delta(days: int) -> timedelta:
+    """間隔日数の timedelta を返す（日数ごとにキャッシュ）。"""
+    return timedelta(days=days)
+
 
 def calculate_next_level(
     q1_correct: bool,
@@ -41,36 +63,25 @@ def calculate_next_level(
     Returns:
         次のレベル値。
     """
-    # 降格条件: Q1 不正解 or Q2 poor
-    if not q1_correct or q2_evaluation == "poor":
-        logger.debug(
-            "降格: Level %d → 0 (q1_correct=%s, q2=%s)",
-            current_level,
-            q1_correct,
-            q2_evaluation,
-        )
-        return 0
+    delta, label = _LEVEL_RULES.get(
+        (q1_correct, q2_evaluation),
+        _LEVEL_STAY if q1_correct else _LEVEL_RESET,
+    )
+    if delta is None:
+        new_level = 0
+    else:
+        new_level = min(current_level + delta, max_level) if delta else current_level
 
-    # 昇格条件: Q1 正解 かつ Q2 good
-    if q1_correct and q2_evaluation == "good":
-        new_level = min(current_level + 1, max_level)
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
-            "昇格: Level %d → %d (q1_correct=%s, q2=%s)",
+            "%s: Level %d → %d (q1_correct=%s, q2=%s)",
+            label,
             current_level,
             new_level,
             q1_correct,
             q2_evaluation,
         )
-        return new_level
-
-    # 据え置き（Q2 partial 等）
-    logger.debug(
-        "据え置き: Level %d (q1_correct=%s, q2=%s)",
-        current_level,
-        q1_correct,
-        q2_evaluation,
-    )
-    return current_level
+    return new_level
 
 
 def calculate_next_quiz_date(
@@ -84,22 +95,20 @@ def calculate_next_quiz_date(
     Args:
         level: 現在のレベル（0〜5）。
         intervals: レベルごとの間隔日数リスト。None の場合はデフォルト値を使用。
-        now: 基準日時。None の場合は datetime.now() を使用。
+        now: 基準日時。None の場合は今日の日付を使用。
 
     Returns:
         次回出題日（YYYY-MM-DD 形式）。
     """
     if intervals is None:
         intervals = _DEFAULT_INTERVALS
-    if now is None:
-        now = datetime.now()
+    base = now.date() if now is not None else date.today()
 
     # レベルが intervals の範囲外の場合は最後の値を使用
     idx = min(level, len(intervals) - 1)
     interval_days = intervals[idx]
 
-    next_date = now + timedelta(days=interval_days)
-    return next_date.strftime("%Y-%m-%d")
+    return (base + _interval_delta(interval_days)).isoformat()
 
 
 def get_interval_days(
@@ -134,28 +143,32 @@ def get_due_topics(
         today: 基準日（YYYY-MM-DD 形式）。None の場合は今日。
 
     Returns:
-        期限到来トピックのリスト。各要素は:
+        期限到来トピックのリスト（next_quiz_at の古い順）。各要素は:
         - topic_key (str)
         - level (int)
         - interval_days (int)
         - last_result (QuizResult | None)
     """
     if today is None:
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = date.today().isoformat()
 
     due: list[dict[str, Any]] = []
-
-    for topic_key, entry in state_manager.state.quiz_history.items():
-        if entry.next_quiz_at and entry.next_quiz_at <= today:
-            last_result = entry.results[-1] if entry.results else None
-            due.append(
-                {
-                    "topic_key": topic_key,
-                    "level": entry.level,
-                    "interval_days": entry.interval_days,
-                    "last_result": last_result,
-                }
-            )
+    history = state_manager.state.quiz_history
+
+    for topic_key in state_manager.get_due_quiz_keys(today):
+        # quiz_history が StateManager を経由せずに変更された場合に備える
+        entry = history.get(topic_key)
+        if entry is None:
+            continue
+        last_result = entry.results[-1] if entry.results else None
+        due.append(
+            {
+                "topic_key": topic_key,
+                "level": entry.level,
+                "interval_days": entry.interval_days,
+                "last_result": last_result,
+            }
+        )
 
     logger.debug("期限到来トピック: %d 件", len(due))
     return due
@@ -182,22 +195,25 @@ def build_quiz_schedule_info(
     if not due_topics:
         return t("sr.no_topics_due")
 
+    # 翻訳テンプレートはトピックごとに引かず、ループの前に1回だけ解決する
+    interval_tmpl = t("sr.interval")
+    last_result_tmpl = t("sr.last_result")
+    correct, incorrect = t("sr.correct"), t("sr.incorrect")
+
     lines = [t("sr.topics_due_header")]
     for topic in due_topics:
-        topic_key = topic["topic_key"]
-        level = topic["level"]
-        interval_days = topic["interval_days"]
-
         # 前回結果サマリ
         last_result = topic["last_result"]
         result_str = ""
         if last_result is not None:
-            q1 = t("sr.correct") if last_result.q1_correct else t("sr.incorrect")  # type: ignore[union-attr]
-            result_str = t("sr.last_result", q1=q1, q2=last_result.q2_evaluation)  # type: ignore[union-attr]
+            result_str = last_result_tmpl.format(
+                q1=correct if last_result.q1_correct else incorrect,
+                q2=last_result.q2_evaluation,
+            )
 
         lines.append(
-            f"- **{topic_key}** — Level {level}, "
-            f"{t('sr.interval', days=interval_days)}, {result_str}"
+            f"- **{topic['topic_key']}** — Level {topic['level']}, "
+            f"{interval_tmpl.format(days=topic['interval_days'])}, {result_str}"
         )
 
     return "\n".join(lines)
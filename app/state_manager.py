@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import json
 import logging
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Callable
 
@@ -71,6 +73,7 @@ class AppState:
     last_run_b_at: str = ""
     last_run_c_at: str = ""
     last_run_d_at: str = ""
+    last_license_ok_at: str = ""
     output_folder_path: str = ""
     random_pick_history: list[str] = field(default_factory=list)
     pending_quizzes: list[PendingQuiz] = field(default_factory=list)
@@ -144,6 +147,7 @@ def _dict_to_app_state(d: dict[str, Any]) -> AppState:
         last_run_b_at=str(d.get("last_run_b_at", "")),
         last_run_c_at=str(d.get("last_run_c_at", "")),
         last_run_d_at=str(d.get("last_run_d_at", "")),
+        last_license_ok_at=str(d.get("last_license_ok_at", "")),
         output_folder_path=str(d.get("output_folder_path", "")),
         random_pick_history=list(d.get("random_pick_history", [])),
         pending_quizzes=[_dict_to_pending_quiz(p) for p in pending_raw] if isinstance(pending_raw, list) else [],
@@ -210,6 +214,7 @@ def _app_state_to_dict(state: AppState) -> dict[str, Any]:
         "last_run_b_at": state.last_run_b_at,
         "last_run_c_at": state.last_run_c_at,
         "last_run_d_at": state.last_run_d_at,
+        "last_license_ok_at": state.last_license_ok_at,
         "output_folder_path": state.output_folder_path,
         "random_pick_history": state.random_pick_history,
         "pending_quizzes": [_pending_quiz_to_dict(p) for p in state.pending_quizzes],
@@ -234,6 +239,11 @@ def _parse_json(raw: str) -> AppState:
 class StateManager:
     """state.json の読み書きと各種更新メソッドを提供するクラス。"""
 
+    # quiz_history の (next_quiz_at, topic_key) 昇順インデックスと、その作成元の dict
+    # （load() などで quiz_history が差し替えられたら作り直す）
+    _due_index: list[tuple[str, str]] | None = None
+    _due_index_source: dict[str, QuizHistoryEntry] | None = None
+
     def __init__(self, state_path: Path | None = None) -> None:
         """StateManager を初期化する。
 
@@ -327,6 +337,11 @@ class StateManager:
         else:
             raise ValueError(f"不正な feature 値: {feature!r} （'a'、'b'、'c'、または 'd' を指定）")
 
+    def update_license_ok_at(self) -> None:
+        """Copilot ライセンスの最終確認成功日時を現在時刻に更新する。"""
+        self._state.last_license_ok_at = datetime.now().isoformat(timespec="seconds")
+        logger.debug("last_license_ok_at = %s", self._state.last_license_ok_at)
+
     def update_page_monitor_state(self, url: str, entry: PageMonitorEntry) -> None:
         """ページモニターの状態を更新する。
 
@@ -417,6 +432,14 @@ class StateManager:
             self._state.quiz_history[topic_key] = QuizHistoryEntry()
 
         entry = self._state.quiz_history[topic_key]
+        if self._due_index is not None and self._due_index_source is self._state.quiz_history:
+            old_item = (entry.next_quiz_at, topic_key)
+            i = bisect_left(self._due_index, old_item)
+            if i < len(self._due_index) and self._due_index[i] == old_item:
+                del self._due_index[i]
+            if next_quiz_at:
+                insort(self._due_index, (next_quiz_at, topic_key))
+
         entry.last_quizzed_at = result.date
         entry.level = new_level
         entry.interval_days = new_interval_days
@@ -440,6 +463,30 @@ class StateManager:
         """
         return self._state.quiz_history.get(topic_key)
 
+    def get_due_quiz_keys(self, today: str) -> list[str]:
+        """出題期限（next_quiz_at <= today）が到来したトピックキーを取得する。
+
+        next_quiz_at 順のインデックスを二分探索するため、
+        quiz_history 全体を走査せずに期限到来分だけを取り出せる。
+
+        Args:
+            today: 基準日（YYYY-MM-DD 形式）。
+
+        Returns:
+            トピックキーのリスト（next_quiz_at の古い順）。
+        """
+        history = self._state.quiz_history
+        if self._due_index is None or self._due_index_source is not history:
+            self._due_index = sorted(
+                (entry.next_quiz_at, key)
+                for key, entry in history.items()
+                if entry.next_quiz_at
+            )
+            self._due_index_source = history
+
+        end = bisect_right(self._due_index, today, key=itemgetter(0))
+        return [key for _, key in self._due_index[:end]]
+
     def get_pending_quizzes(self) -> list[PendingQuiz]:
         """未回答のクイズ一覧を取得する。
 
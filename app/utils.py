@@ -31,6 +31,27 @@ def atomic_write(file_path: Path, content: str, *, create_backup: bool = True) -
         content: 書き込む内容（文字列）。
         create_backup: True の場合、書き込み前に既存ファイルの .bak を作成する。
     """
+    _atomic_write_impl(file_path, content, create_backup=create_backup)
+
+
+def atomic_write_bytes(file_path: Path, data: bytes, *, create_backup: bool = True) -> None:
+    """atomic_write() のバイト列版。エンコード・改行変換を行わずにそのまま書き込む。
+
+    Args:
+        file_path: 書き込み先のファイルパス。
+        data: 書き込む内容（バイト列）。
+        create_backup: True の場合、書き込み前に既存ファイルの .bak を作成する。
+    """
+    _atomic_write_impl(file_path, data, create_backup=create_backup)
+
+
+def _atomic_write_impl(
+    file_path: Path,
+    content: str | bytes,
+    *,
+    create_backup: bool,
+) -> None:
+    """atomic_write() / atomic_write_bytes() の共通実装。"""
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -39,7 +60,11 @@ def atomic_write(file_path: Path, content: str, *, create_backup: bool = True) -
 
     try:
         # 1. 一時ファイルに書き込み
-        with open(tmp_path, "w", encoding="utf-8") as f:
+        if isinstance(content, bytes):
+            f = open(tmp_path, "wb")
+        else:
+            f = open(tmp_path, "w", encoding="utf-8")
+        with f:
             f.write(content)
             # 2. fsync でディスクにフラッシュ
             f.flush()
@@ -67,6 +92,40 @@ def atomic_write(file_path: Path, content: str, *, create_backup: bool = True) -
         raise
 
 
+def append_text(file_path: Path, suffix: str) -> None:
+    """ファイル末尾の改行を詰めてから、空行を挟んで suffix を追記する。
+
+    既存内容を読み込んで全体を書き直す代わりに、末尾の改行だけを
+    その場で切り詰め、追記分のみを書き込む。書き込み量は追記分に比例する。
+    結果は既存内容を読み込んで末尾改行を除去し、追記して書き直した場合と同じ内容になる。
+
+    Args:
+        file_path: 追記先のファイルパス（既存ファイル）。
+        suffix: 追記する文字列。
+    """
+    data = ("\n\n" + suffix.strip() + "\n").replace("\n", os.linesep).encode("utf-8")
+
+    with open(file_path, "r+b") as f:
+        # 末尾の改行（CR/LF）を後ろから探して切り詰める
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            chunk_start = max(0, pos - 256)
+            f.seek(chunk_start)
+            stripped = f.read(pos - chunk_start).rstrip(b"\r\n")
+            pos = chunk_start + len(stripped)
+            if stripped:
+                break
+        if pos < end:
+            f.truncate(pos)
+
+        f.seek(pos)
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    logger.debug("追記完了: %s", file_path)
+
+
 def safe_read_with_fallback(
     file_path: Path,
     parser: Callable[[str], object],
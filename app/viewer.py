@@ -32,7 +32,7 @@ from tkinterweb import HtmlFrame
 from app.copilot_client import CopilotClientWrapper
 from app.i18n import t
 from app.output_writer import append_quiz_result, format_quiz_result_section
-from app.quiz_scorer import build_result_item, score_async
+from app.quiz_scorer import build_result_item, score_many_async
 
 if TYPE_CHECKING:
     from app.config import AppConfig
@@ -698,18 +698,29 @@ def _open_viewer_in_tk(
                     q1 = w["q1_var"].get()
                     q2 = w["q2_text"].get("1.0", tk.END).strip()
                     answers.append({
-                        "q1": q1,
-                        "q2": q2,
                         "topic_key": w["topic_key"],
+                        "q1_choice": q1,
+                        "q2_answer": q2,
                     })
 
                 # UI をローディング状態に切り替え
                 submit_btn.configure(state=tk.DISABLED, text=t("viewer.scoring"))
                 progress_bar.pack(pady=4)
                 progress_bar.start(15)
-                status_label.configure(text=t("viewer.querying_sdk"))
+                status_label.configure(
+                    text=t("viewer.scoring_batch", total=len(answers))
+                )
                 logger.info("クイズ採点を開始します (%d トピック)", len(answers))
 
+                def _on_progress(idx: int, total: int) -> None:
+                    """個別採点の進捗をステータスに表示する（UI スレッドへ委譲）。"""
+                    root.after(
+                        0,
+                        lambda: status_label.configure(
+                            text=t("viewer.scoring_progress", idx=idx + 1, total=total)
+                        ),
+                    )
+
                 def _run_scoring() -> None:
                     """バックグラウンドスレッドで採点を実行する。"""
                     try:
@@ -717,26 +728,14 @@ def _open_viewer_in_tk(
                             async with CopilotClientWrapper(
                                 app_config.copilot_sdk
                             ) as client:
-                                results = []
-                                total = len(answers)
-                                for j, a in enumerate(answers):
-                                    root.after(
-                                        0,
-                                        lambda idx=j: status_label.configure(
-                                            text=t("viewer.scoring_progress", idx=idx + 1, total=total)
-                                        ),
-                                    )
-                                    result = await score_async(
-                                        topic_key=a["topic_key"],
-                                        q1_choice=a["q1"],
-                                        q2_answer=a["q2"],
-                                        briefing_file=file_path,
-                                        copilot_client=client,
-                                        state_manager=state_manager,
-                                        app_config=app_config,
-                                    )
-                                    results.append(result)
-                                return results
+                                return await score_many_async(
+                                    answers,
+                                    file_path,
+                                    copilot_client=client,
+                                    state_manager=state_manager,
+                                    app_config=app_config,
+                                    on_progress=_on_progress,
+                                )
 
                         scored: list = asyncio.run(_score_all())  # type: ignore[arg-type]
 
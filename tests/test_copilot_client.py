@@ -207,6 +207,45 @@ class TestScoreQuiz:
         with pytest.raises(ValueError, match="JSON パースに失敗"):
             await wrapper.score_quiz("prompt")
 
+    async def test_uses_orjson_when_available(
+        self, wrapper: CopilotClientWrapper, monkeypatch
+    ):
+        from types import SimpleNamespace
+
+        calls: list[str] = []
+
+        def fake_loads(data: str) -> dict[str, Any]:
+            calls.append(data)
+            return json.loads(data)
+
+        monkeypatch.setattr("app.copilot_client.orjson", SimpleNamespace(loads=fake_loads))
+        wrapper._send_prompt = AsyncMock(return_value='{"q1_correct": true}')
+        result = await wrapper.score_quiz("prompt")
+        assert result == {"q1_correct": True}
+        assert calls == ['{"q1_correct": true}']
+
+
+class TestScoreQuizBatch:
+    async def test_parses_json_array(self, wrapper: CopilotClientWrapper):
+        expected = [
+            {"topic_key": "a.md#1", "q1_correct": True, "q2_evaluation": "good"},
+            {"topic_key": "b.md#2", "q1_correct": False, "q2_evaluation": "poor"},
+        ]
+        wrapper._send_prompt = AsyncMock(return_value=json.dumps(expected))
+        result = await wrapper.score_quiz_batch("prompt")
+        assert result == expected
+
+    async def test_parses_array_with_extra_text(self, wrapper: CopilotClientWrapper):
+        raw = 'Result: [{"topic_key": "a.md#1", "q1_correct": true}] done'
+        wrapper._send_prompt = AsyncMock(return_value=raw)
+        result = await wrapper.score_quiz_batch("prompt")
+        assert result[0]["topic_key"] == "a.md#1"
+
+    async def test_raises_on_object_response(self, wrapper: CopilotClientWrapper):
+        wrapper._send_prompt = AsyncMock(return_value='{"q1_correct": true}')
+        with pytest.raises(ValueError, match="JSON パースに失敗"):
+            await wrapper.score_quiz_batch("prompt")
+
 
 # ────────────────────────────────────────────
 # _send_prompt (セッション管理)
@@ -0,0 +1,73 @@
+"""logger モジュールのユニットテスト。"""
+
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from app import logger as logger_module
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """ログ出力先を一時ディレクトリに差し替え、ルートロガーを元に戻す。"""
+    monkeypatch.setattr(logger_module, "_LOG_DIR", tmp_path)
+    monkeypatch.setattr(logger_module, "_LOG_FILE", tmp_path / "app.log")
+    root_logger = logging.getLogger()
+    saved_handlers = root_logger.handlers[:]
+    saved_level = root_logger.level
+    yield tmp_path / "app.log"
+    logger_module.stop_logging()
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
+
+
+# ────────────────────────────────────────────
+# setup_logging / stop_logging
+# ────────────────────────────────────────────
+
+
+class TestSetupLogging:
+    def test_root_logger_uses_queue_handler(self, log_file):
+        logger_module.setup_logging("INFO")
+        handlers = logging.getLogger().handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], QueueHandler)
+
+    def test_records_written_after_stop(self, log_file):
+        logger_module.setup_logging("INFO")
+        logging.getLogger("test.logger").info("キュー経由のメッセージ")
+        logger_module.stop_logging()
+        content = log_file.read_text(encoding="utf-8")
+        assert "[INFO] test.logger - キュー経由のメッセージ" in content
+
+    def test_exception_traceback_written(self, log_file):
+        logger_module.setup_logging("INFO")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("test.logger").exception("失敗しました")
+        logger_module.stop_logging()
+        content = log_file.read_text(encoding="utf-8")
+        assert "失敗しました" in content
+        assert "ValueError: boom" in content
+
+    def test_level_respected(self, log_file):
+        logger_module.setup_logging("WARNING")
+        logging.getLogger("test.logger").info("出力されない")
+        logging.getLogger("test.logger").warning("出力される")
+        logger_module.stop_logging()
+        content = log_file.read_text(encoding="utf-8")
+        assert "出力されない" not in content
+        assert "出力される" in content
+
+    def test_setup_twice_replaces_listener(self, log_file):
+        logger_module.setup_logging("INFO")
+        logger_module.setup_logging("DEBUG")
+        assert len(logging.getLogger().handlers) == 1
+        logging.getLogger("test.logger").debug("再設定後")
+        logger_module.stop_logging()
+        assert "再設定後" in log_file.read_text(encoding="utf-8")
+
+    def test_stop_without_setup_is_noop(self):
+        logger_module.stop_logging()
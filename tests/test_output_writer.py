@@ -28,6 +28,10 @@ class TestGenerateFilename:
         name = _generate_filename("b", now=now)
         assert name == "briefing_quiz_2026-03-15_093000.md"
 
+    def test_precomputed_timestamp(self):
+        name = _generate_filename("c", timestamp="2026-03-15_093000")
+        assert name == "briefing_monitor_2026-03-15_093000.md"
+
     def test_unknown_feature(self):
         now = datetime(2026, 3, 15, 9, 30, 0)
         name = _generate_filename("x", now=now)
@@ -76,6 +80,17 @@ class TestDetermineOutputFolder:
         )
         assert result.name == "_briefings_2"
 
+    def test_collision_skips_taken_suffixes(self, tmp_path: Path):
+        (tmp_path / "_briefings").mkdir()
+        (tmp_path / "_briefings_2").mkdir()
+        (tmp_path / "_briefings_3").write_text("file", encoding="utf-8")
+        result = _determine_output_folder(
+            input_folders=[str(tmp_path)],
+            output_folder_name="_briefings",
+            existing_output_path="",
+        )
+        assert result.name == "_briefings_4"
+
 
 # ────────────────────────────────────────────
 # write_briefing
@@ -96,6 +111,13 @@ class TestWriteBriefing:
         path = write_briefing("content", "b", str(out_dir), now=now)
         assert Path(path).exists()
 
+    def test_returns_absolute_path_for_relative_folder(self, tmp_path: Path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        now = datetime(2026, 1, 1, 10, 0, 0)
+        path = write_briefing("content", "a", "rel_output", now=now)
+        assert Path(path).is_absolute()
+        assert Path(path) == (tmp_path / "rel_output" / "briefing_news_2026-01-01_100000.md").resolve()
+
 
 # ────────────────────────────────────────────
 # append_quiz_result
@@ -110,6 +132,19 @@ class TestAppendQuizResult:
         assert "# Original" in content
         assert "## Quiz Result" in content
 
+    def test_matches_rewrite_format(self, tmp_path: Path):
+        f = tmp_path / "briefing.md"
+        f.write_text("# Original\n\n", encoding="utf-8")
+        append_quiz_result(str(f), "## Quiz Result\n")
+        assert f.read_text(encoding="utf-8") == "# Original\n\n## Quiz Result\n"
+
+    def test_backup_uses_rewrite(self, tmp_path: Path):
+        f = tmp_path / "briefing.md"
+        f.write_text("# Original", encoding="utf-8")
+        append_quiz_result(str(f), "## Quiz Result", create_backup=True)
+        assert f.read_text(encoding="utf-8") == "# Original\n\n## Quiz Result\n"
+        assert (tmp_path / "briefing.md.bak").read_text(encoding="utf-8") == "# Original"
+
     def test_nonexistent_file_noop(self, tmp_path: Path):
         # 存在しないファイルへの追記は何もしない
         append_quiz_result(str(tmp_path / "nope.md"), "result")
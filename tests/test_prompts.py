@@ -6,6 +6,7 @@ from app.config import AppConfig, WorkIQMcpConfig
 from app.prompts import (
     build_file_contents,
     build_file_list_with_metadata,
+    build_quiz_schedule_info,
     get_discovery_appendix,
     get_scoring_prompt_template,
     get_system_prompt_a,
@@ -17,6 +18,7 @@ from app.prompts import (
     get_user_prompt_d,
     load_prompt,
 )
+from app.state_manager import AppState, QuizHistoryEntry, QuizResult, StateManager
 
 
 # ────────────────────────────────────────────
@@ -168,3 +170,39 @@ class TestOtherPrompts:
             text = get_scoring_prompt_template()
             assert "{source_content}" in text
             assert "{q1_question_text}" in text
+
+
+# ────────────────────────────────────────────
+# build_quiz_schedule_info
+# ────────────────────────────────────────────
+
+
+class TestBuildQuizScheduleInfo:
+    def _make_sm(self, history: dict[str, QuizHistoryEntry]) -> StateManager:
+        sm = StateManager.__new__(StateManager)
+        sm._state = AppState(quiz_history=history)
+        sm._path = None  # type: ignore[assignment]
+        return sm
+
+    def test_no_due_topics(self):
+        sm = self._make_sm({"t": QuizHistoryEntry(next_quiz_at="2999-01-01")})
+        assert build_quiz_schedule_info(sm) == "期限到来トピックなし"
+
+    def test_due_topics_listed(self):
+        sm = self._make_sm({
+            "t1": QuizHistoryEntry(
+                next_quiz_at="2000-01-02", level=2, interval_days=7,
+                results=[QuizResult(q1_correct=True, q2_evaluation="good")],
+            ),
+            "t2": QuizHistoryEntry(next_quiz_at="2000-01-01", level=0, interval_days=1),
+        })
+        lines = build_quiz_schedule_info(sm).split("\n")
+        assert lines[0] == "以下のトピックは出題期限が到来しています:"
+        assert lines[1] == "- **t2** — Level 0, 間隔 1日, "
+        assert lines[2] == "- **t1** — Level 2, 間隔 7日, 前回: Q1=正解, Q2=good"
+
+    def test_key_removed_outside_state_manager(self):
+        sm = self._make_sm({"t": QuizHistoryEntry(next_quiz_at="2000-01-01")})
+        build_quiz_schedule_info(sm)
+        del sm.state.quiz_history["t"]
+        assert build_quiz_schedule_info(sm) == "期限到来トピックなし"
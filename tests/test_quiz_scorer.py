@@ -4,9 +4,25 @@
 SDK 連携系は copilot_client テストでカバー済み。
 """
 
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import AsyncMock
 
-from app.quiz_scorer import _read_source_content, _extract_quiz_questions
+from app.config import AppConfig
+from app.quiz_scorer import (
+    _SCORING_PROMPT_TEMPLATE,
+    _compile_template,
+    _extract_quiz_questions,
+    _index_briefing,
+    _load_quiz_questions,
+    _read_source_content,
+    _title_from_key,
+    SourceFileIndex,
+    process_unanswered,
+    score,
+    score_many_async,
+)
+from app.state_manager import PendingQuiz, StateManager
 
 
 # ────────────────────────────────────────────
@@ -39,6 +55,45 @@ class TestReadSourceContent:
         result = _read_source_content("found.md", [str(f1), str(f2)])
         assert result == "in f2"
 
+    def test_uses_source_index(self, tmp_path: Path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "doc.md").write_text("indexed", encoding="utf-8")
+        index = SourceFileIndex.build([str(tmp_path)])
+        assert _read_source_content("sub/doc.md#s", [], index) == "indexed"
+        assert _read_source_content("sub/none.md", [], index) == ""
+
+
+# ────────────────────────────────────────────
+# _title_from_key
+# ────────────────────────────────────────────
+
+class TestTitleFromKey:
+    def test_takes_last_segment(self):
+        assert _title_from_key("dir/doc.md#a#b") == "b"
+
+    def test_without_hash(self):
+        assert _title_from_key("doc.md") == "doc.md"
+
+
+# ────────────────────────────────────────────
+# SourceFileIndex
+# ────────────────────────────────────────────
+
+class TestSourceFileIndex:
+    def test_first_folder_wins(self, tmp_path: Path):
+        f1 = tmp_path / "f1"
+        f2 = tmp_path / "f2"
+        (f1 / "notes").mkdir(parents=True)
+        (f2 / "notes").mkdir(parents=True)
+        (f1 / "notes" / "a.md").write_text("one", encoding="utf-8")
+        (f2 / "notes" / "a.md").write_text("two", encoding="utf-8")
+        (f2 / "b.md").write_text("b", encoding="utf-8")
+        index = SourceFileIndex.build([str(f1), str(f2)])
+        assert index.get("notes/a.md") == f1 / "notes" / "a.md"
+        assert index.get("notes\\a.md") == f1 / "notes" / "a.md"
+        assert index.get("b.md") == f2 / "b.md"
+        assert index.get("missing.md") is None
+
 
 # ────────────────────────────────────────────
 # _extract_quiz_questions
@@ -86,3 +141,249 @@ B) Y
         q1, q2 = _extract_quiz_questions(content, "single.md")
         assert "Q1" in q1
         assert "Q2" in q2
+
+    def test_skips_question_markers_and_stops_at_results(self):
+        content = """
+<!-- topic_key: doc.md#s1 -->
+### Topic
+
+<!-- topic_key: doc.md#s1 -->
+### Q1: Which?
+A) X
+B) Y
+
+<!-- topic_key: doc.md#s1 -->
+### Q2: Explain.
+
+## 📝 Quiz Results
+### Q2 leaked
+"""
+        q1, q2 = _extract_quiz_questions(content, "doc.md#s1")
+        assert "A) X" in q1
+        assert "Explain" in q2
+        assert "leaked" not in q2
+
+    def test_q1_stops_at_adjacent_q2(self):
+        content = """
+<!-- topic_key: a.md#1 -->
+### Q1: Which one?
+**Q2:** Explain.
+"""
+        q1, q2 = _extract_quiz_questions(content, "a.md#1")
+        assert q1 == "### Q1: Which one?"
+        assert q2 == "**Q2:** Explain."
+
+    def test_q1_stops_at_q2_heading_at_eof(self):
+        # 改行で終わらない末尾の Q2 見出しでも Q1 は終わる（Q2 としては抽出しない）
+        content = "<!-- topic_key: a.md#1 -->\n\t### Q1\nA) foo\n  ### Q2"
+        q1, q2 = _extract_quiz_questions(content, "a.md#1")
+        assert q1 == "### Q1\nA) foo"
+        assert q2 == ""
+
+
+# ────────────────────────────────────────────
+# _index_briefing
+# ────────────────────────────────────────────
+
+class TestIndexBriefing:
+    def test_indexes_each_topic_once(self):
+        content = (
+            "<!-- topic_key: a.md#1 -->\n### A\nbody a\n"
+            "<!-- topic_key: b.md#2 -->\n### B\nbody b\n"
+        )
+        index = _index_briefing(content)
+        assert set(index) == {"a.md#1", "b.md#2"}
+        a_start, a_end = index["a.md#1"].section
+        assert content[a_start:a_end] == "\n### A\nbody a\n"
+        b_start, b_end = index["b.md#2"].section
+        assert content[b_start:b_end] == "\n### B\nbody b\n"
+        assert index["a.md#1"].q1 is None
+        assert index["a.md#1"].q2 is None
+
+    def test_question_spans(self):
+        content = (
+            "<!-- topic_key: a.md#1 -->\n### A\n"
+            "**Q1:** Which?\nA) x\n\n**Q2:** Why?\n"
+        )
+        spans = _index_briefing(content)["a.md#1"]
+        assert spans.q1 is not None and spans.q2 is not None
+        assert content[spans.q1[0]:spans.q1[1]].strip() == "**Q1:** Which?\nA) x"
+        assert content[spans.q2[0]:spans.q2[1]].strip() == "**Q2:** Why?"
+
+    def test_no_markers(self):
+        assert _index_briefing("# Nothing here") == {}
+
+
+# ────────────────────────────────────────────
+# _load_quiz_questions
+# ────────────────────────────────────────────
+
+class TestLoadQuizQuestions:
+    _CONTENT = (
+        "<!-- topic_key: a.md#1 -->\r\n### 話題\r\n"
+        "**Q1（4択）** どれ？\r\n- A) あ\r\n\r\n**Q2（記述）** 説明して。\r\n"
+    )
+
+    def test_small_file(self, tmp_path: Path):
+        f = tmp_path / "briefing.md"
+        f.write_bytes(self._CONTENT.encode("utf-8"))
+        q1, q2 = _load_quiz_questions(str(f), "a.md#1")
+        assert q1 == "**Q1（4択）** どれ？\n- A) あ"
+        assert q2 == "**Q2（記述）** 説明して。"
+
+    def test_mmap_path_matches_text_path(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr("app.quiz_scorer._MMAP_THRESHOLD_BYTES", 0)
+        f = tmp_path / "briefing.md"
+        f.write_bytes(self._CONTENT.encode("utf-8"))
+        q1, q2 = _load_quiz_questions(str(f), "a.md#1")
+        assert q1 == "**Q1（4択）** どれ？\n- A) あ"
+        assert q2 == "**Q2（記述）** 説明して。"
+        assert _load_quiz_questions(str(f), "missing") == ("", "")
+
+    def test_missing_file(self, tmp_path: Path):
+        assert _load_quiz_questions(str(tmp_path / "nope.md"), "a.md#1") == ("", "")
+
+
+# ────────────────────────────────────────────
+# _compile_template
+# ────────────────────────────────────────────
+
+class TestCompileTemplate:
+    def test_matches_str_format(self):
+        fields = {
+            "source_content": "src {not a field}",
+            "q1_question_text": "Q1?",
+            "q1_user_choice": "A",
+            "q2_question_text": "Q2?",
+            "q2_user_answer": "answer",
+        }
+        render = _compile_template(_SCORING_PROMPT_TEMPLATE)
+        assert render(**fields) == _SCORING_PROMPT_TEMPLATE.format(**fields)
+
+    def test_rejects_format_spec(self):
+        import pytest
+
+        with pytest.raises(ValueError):
+            _compile_template("{value:>10}")
+
+
+# ────────────────────────────────────────────
+# score
+# ────────────────────────────────────────────
+
+class TestScore:
+    def test_sync_wrapper_records_result(self, tmp_path: Path):
+        client = AsyncMock()
+        client.score_quiz = AsyncMock(
+            return_value={"q1_correct": False, "q1_correct_answer": "C", "q2_evaluation": "poor"}
+        )
+        sm = StateManager(tmp_path / "state.json")
+
+        result = score(
+            "a.md#1",
+            "A",
+            "",
+            str(tmp_path / "missing.md"),
+            copilot_client=client,
+            state_manager=sm,
+            app_config=AppConfig(input_folders=[str(tmp_path)]),
+            now=datetime(2026, 3, 1, 9, 0, 0),
+        )
+
+        assert result.q1_correct is False
+        assert result.q1_correct_answer == "C"
+        assert result.level_change in ("downgrade", "same")
+        entry = sm.get_quiz_history("a.md#1")
+        assert entry is not None
+        assert entry.results[-1].date == "2026-03-01"
+
+
+# ────────────────────────────────────────────
+# score_many_async
+# ────────────────────────────────────────────
+
+class TestScoreManyAsync:
+    async def test_single_request_for_all_topics(self, tmp_path: Path):
+        client = AsyncMock()
+        client.score_quiz_batch = AsyncMock(
+            return_value=[
+                {"topic_key": "b.md#2", "q1_correct": False, "q2_evaluation": "poor"},
+                {"topic_key": "a.md#1", "q1_correct": True, "q2_evaluation": "good"},
+            ]
+        )
+        client.score_quiz = AsyncMock()
+        sm = StateManager(tmp_path / "state.json")
+
+        results = await score_many_async(
+            [
+                {"topic_key": "a.md#1", "q1_choice": "A", "q2_answer": "x"},
+                {"topic_key": "b.md#2", "q1_choice": "B", "q2_answer": "y"},
+            ],
+            str(tmp_path / "briefing.md"),
+            copilot_client=client,
+            state_manager=sm,
+            app_config=AppConfig(input_folders=[str(tmp_path)]),
+            now=datetime(2026, 3, 1, 9, 0, 0),
+        )
+
+        client.score_quiz_batch.assert_awaited_once()
+        client.score_quiz.assert_not_awaited()
+        prompt = client.score_quiz_batch.await_args.args[0]
+        assert "a.md#1" in prompt and "b.md#2" in prompt
+        assert [r.topic_key for r in results] == ["a.md#1", "b.md#2"]
+        assert results[0].q1_correct is True
+        assert results[1].q1_correct is False
+        assert (tmp_path / "state.json").exists()
+
+    async def test_missing_topic_scored_individually(self, tmp_path: Path):
+        client = AsyncMock()
+        client.score_quiz_batch = AsyncMock(
+            return_value=[{"topic_key": "a.md#1", "q1_correct": True, "q2_evaluation": "good"}]
+        )
+        client.score_quiz = AsyncMock(
+            return_value={"q1_correct": True, "q2_evaluation": "partial"}
+        )
+        sm = StateManager(tmp_path / "state.json")
+        progress: list[tuple[int, int]] = []
+
+        results = await score_many_async(
+            [
+                {"topic_key": "a.md#1", "q1_choice": "A", "q2_answer": "x"},
+                {"topic_key": "b.md#2", "q1_choice": "B", "q2_answer": "y"},
+            ],
+            str(tmp_path / "briefing.md"),
+            copilot_client=client,
+            state_manager=sm,
+            app_config=AppConfig(input_folders=[str(tmp_path)]),
+            on_progress=lambda i, total: progress.append((i, total)),
+        )
+
+        client.score_quiz.assert_awaited_once()
+        assert results[1].q2_evaluation == "partial"
+        assert progress == [(1, 2)]
+
+
+# ────────────────────────────────────────────
+# process_unanswered
+# ────────────────────────────────────────────
+
+class TestProcessUnanswered:
+    def test_marks_pending_as_incorrect(self, tmp_path: Path):
+        briefing = tmp_path / "briefing.md"
+        briefing.write_text("# Briefing\n", encoding="utf-8")
+        sm = StateManager(tmp_path / "state.json")
+        sm.add_pending_quiz(
+            PendingQuiz(briefing_file=str(briefing), topic_key="a.md#1", pattern="learning")
+        )
+
+        process_unanswered(sm)
+
+        assert sm.get_pending_quizzes() == []
+        assert sm.get_quiz_history("a.md#1") is not None
+        assert "### 📘 1" in briefing.read_text(encoding="utf-8")
+        assert (tmp_path / "state.json").exists()
+
+    def test_no_pending_is_noop(self, tmp_path: Path):
+        sm = StateManager(tmp_path / "state.json")
+        process_unanswered(sm)
+        assert not (tmp_path / "state.json").exists()
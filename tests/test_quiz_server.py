@@ -0,0 +1,466 @@
+"""quiz_server モジュールのユニットテスト。
+
+127.0.0.1 のランダムポートで実サーバーを起動し、urllib で叩いて検証する。
+"""
+
+import http.client
+import json
+import logging
+import socket
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from app.config import AppConfig
+from app.quiz_scorer import QuizScoreResult
+from app.i18n import get_language, set_language
+from app.quiz_server import QuizServer, _QuizHTTPServer, _error_body, _json_dumps
+
+
+def _fake_score(**kwargs: Any) -> QuizScoreResult:
+    return QuizScoreResult(
+        topic_key=kwargs["topic_key"],
+        q1_correct=kwargs["q1_choice"] == "A",
+        q1_correct_answer="A",
+        q1_explanation="説明",
+        q2_evaluation="good",
+        q2_feedback="よくできました",
+        new_level=2,
+        new_interval_days=3,
+        next_quiz_at="2026-01-01",
+        level_change="upgrade",
+    )
+
+
+@pytest.fixture
+def server():
+    srv = QuizServer()
+    srv.start(
+        score_func=_fake_score,
+        copilot_client=None,  # type: ignore[arg-type]
+        state_manager=None,  # type: ignore[arg-type]
+        app_config=AppConfig(),
+    )
+    yield srv
+    srv.stop()
+
+
+def _post(port: int, path: str, body: bytes) -> tuple[int, dict[str, Any]]:
+    req = urllib.request.Request(
+        f"http://127.0.0.1:{port}{path}",
+        data=body,
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        raw = e.read()
+        return e.code, json.loads(raw) if raw.startswith(b"{") else {}
+
+
+# ────────────────────────────────────────────
+# POST /quiz/submit
+# ────────────────────────────────────────────
+
+class TestQuizSubmit:
+    def test_scores_and_returns_json(self, server: QuizServer):
+        body = json.dumps(
+            {"topic_key": "doc.md#見出し", "q1_choice": "A", "q2_answer": "回答"},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        status, data = _post(server.port, "/quiz/submit", body)
+        assert status == 200
+        assert data["topic_key"] == "doc.md#見出し"
+        assert data["q1_correct"] is True
+        assert data["new_level"] == 2
+        assert data["level_change"] == "upgrade"
+        assert data["new_interval_days"] == 3
+
+    def test_passes_bound_dependencies(self):
+        received: dict[str, Any] = {}
+
+        def capture(**kwargs: Any) -> QuizScoreResult:
+            received.update(kwargs)
+            return _fake_score(**kwargs)
+
+        config = AppConfig()
+        srv = QuizServer()
+        srv.start(
+            score_func=capture,
+            copilot_client="client",  # type: ignore[arg-type]
+            state_manager="state",  # type: ignore[arg-type]
+            app_config=config,
+        )
+        try:
+            _post(srv.port, "/quiz/submit", b'{"topic_key": "a.md", "briefing_file": "b.md"}')
+        finally:
+            srv.stop()
+
+        assert received["copilot_client"] == "client"
+        assert received["state_manager"] == "state"
+        assert received["app_config"] is config
+        assert received["briefing_file"] == "b.md"
+
+    def test_scored_on_worker_pool(self):
+        thread_names: list[str] = []
+
+        def record_thread(**kwargs: Any) -> QuizScoreResult:
+            thread_names.append(threading.current_thread().name)
+            return _fake_score(**kwargs)
+
+        srv = QuizServer()
+        srv.start(
+            score_func=record_thread,
+            copilot_client=None,  # type: ignore[arg-type]
+            state_manager=None,  # type: ignore[arg-type]
+            app_config=AppConfig(),
+        )
+        try:
+            status, _ = _post(srv.port, "/quiz/submit", b'{"topic_key": "a.md"}')
+        finally:
+            srv.stop()
+
+        assert status == 200
+        assert thread_names[0].startswith("QuizScore")
+
+    def test_stop_shuts_down_worker_pool(self):
+        srv = QuizServer()
+        srv.start(
+            score_func=_fake_score,
+            copilot_client=None,  # type: ignore[arg-type]
+            state_manager=None,  # type: ignore[arg-type]
+            app_config=AppConfig(),
+        )
+        pool = srv._server.score_pool  # type: ignore[union-attr]
+        srv.stop()
+        with pytest.raises(RuntimeError):
+            pool.submit(lambda: None)
+
+    def test_bind_failure_creates_no_pool(self, monkeypatch):
+        created: list[int] = []
+        monkeypatch.setattr(
+            "app.quiz_server.ThreadPoolExecutor", lambda *a, **kw: created.append(1),
+        )
+        with socket.socket() as occupied:
+            occupied.bind(("127.0.0.1", 0))
+            occupied.listen()
+            with pytest.raises(OSError):
+                _QuizHTTPServer(
+                    occupied.getsockname(),
+                    score_func=None,
+                    copilot_client=None,
+                    state_manager=None,
+                    app_config=None,
+                )
+        assert created == []
+
+    def test_invalid_json(self, server: QuizServer):
+        status, data = _post(server.port, "/quiz/submit", b"{not json")
+        assert status == 400
+        assert "error" in data
+
+    @pytest.mark.parametrize(
+        "body",
+        [b'["a.md"]', b'{"topic_key": 1}', b'{"topic_key": "a.md", "q2_answer": null}'],
+    )
+    def test_invalid_request_shape(self, server: QuizServer, body: bytes):
+        status, data = _post(server.port, "/quiz/submit", body)
+        assert status == 400
+        assert "error" in data
+
+    def test_missing_topic_key(self, server: QuizServer):
+        status, data = _post(server.port, "/quiz/submit", b'{"q1_choice": "A"}')
+        assert status == 400
+        assert "error" in data
+
+    def test_body_too_large(self, server: QuizServer, monkeypatch):
+        monkeypatch.setattr("app.quiz_server._MAX_BODY_BYTES", 16)
+        status, data = _post(server.port, "/quiz/submit", b'{"topic_key": "long.md"}')
+        assert status == 413
+        assert "error" in data
+
+    def test_default_limit_rejects_large_answer(self, server: QuizServer):
+        body = json.dumps({"topic_key": "a.md", "q2_answer": "x" * (65 * 1024)}).encode()
+        status, _ = _post(server.port, "/quiz/submit", body)
+        assert status == 413
+
+    def test_form_post_rejected(self, server: QuizServer):
+        req = urllib.request.Request(
+            f"http://127.0.0.1:{server.port}/quiz/submit",
+            data=b'{"topic_key": "a.md"}',
+            headers={"Content-Type": "text/plain"},
+            method="POST",
+        )
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(req, timeout=5)
+        assert exc_info.value.code == 415
+
+    def test_content_type_with_charset(self, server: QuizServer):
+        req = urllib.request.Request(
+            f"http://127.0.0.1:{server.port}/quiz/submit",
+            data=b'{"topic_key": "a.md"}',
+            headers={"Content-Type": "Application/JSON; charset=utf-8"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            assert resp.status == 200
+
+    @pytest.mark.parametrize("length", [None, b"-1", b"1e3", b"\xef\xbc\x91"])
+    def test_invalid_content_length(self, server: QuizServer, length: bytes | None):
+        header = b"" if length is None else b"Content-Length: " + length + b"\r\n"
+        with socket.create_connection(("127.0.0.1", server.port), timeout=5) as sock:
+            sock.sendall(
+                b"POST /quiz/submit HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Type: application/json\r\n" + header + b"\r\n"
+            )
+            response = sock.makefile("rb").read()
+        assert response.startswith(b"HTTP/1.1 411")
+
+    def test_truncated_body(self, server: QuizServer):
+        with socket.create_connection(("127.0.0.1", server.port), timeout=5) as sock:
+            sock.sendall(
+                b"POST /quiz/submit HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: 100\r\n\r\n"
+                b'{"topic_key"'
+            )
+            sock.shutdown(socket.SHUT_WR)
+            response = sock.makefile("rb").read()
+        assert response.startswith(b"HTTP/1.1 400")
+
+    def test_query_string_ignored(self, server: QuizServer):
+        status, data = _post(server.port, "/quiz/submit?t=123", b'{"topic_key": "a.md"}')
+        assert status == 200
+        assert data["topic_key"] == "a.md"
+
+    def test_unknown_path(self, server: QuizServer):
+        status, _ = _post(server.port, "/other", b"{}")
+        assert status == 404
+
+
+# ────────────────────────────────────────────
+# 再送時の採点結果再利用
+# ────────────────────────────────────────────
+
+class TestReplayCache:
+    def _start(self, score_func: Any) -> QuizServer:
+        srv = QuizServer()
+        srv.start(
+            score_func=score_func,
+            copilot_client=None,  # type: ignore[arg-type]
+            state_manager=None,  # type: ignore[arg-type]
+            app_config=AppConfig(),
+        )
+        return srv
+
+    def test_duplicate_submit_scored_once(self):
+        calls: list[str] = []
+
+        def counting(**kwargs: Any) -> QuizScoreResult:
+            calls.append(kwargs["q2_answer"])
+            return _fake_score(**kwargs)
+
+        srv = self._start(counting)
+        try:
+            body = b'{"topic_key": "a.md", "q1_choice": "A", "q2_answer": "x"}'
+            first = _post(srv.port, "/quiz/submit", body)
+            second = _post(srv.port, "/quiz/submit", body)
+            other = _post(srv.port, "/quiz/submit", body.replace(b'"x"', b'"y"'))
+        finally:
+            srv.stop()
+
+        assert first == second
+        assert other[0] == 200
+        assert calls == ["x", "y"]
+
+    def test_failed_scoring_not_reused(self):
+        attempts: list[int] = []
+
+        def flaky(**kwargs: Any) -> QuizScoreResult:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("Copilot unavailable")
+            return _fake_score(**kwargs)
+
+        srv = self._start(flaky)
+        try:
+            body = b'{"topic_key": "a.md", "q1_choice": "A"}'
+            assert _post(srv.port, "/quiz/submit", body)[0] == 500
+            assert _post(srv.port, "/quiz/submit", body)[0] == 200
+        finally:
+            srv.stop()
+
+        assert len(attempts) == 2
+
+
+# ────────────────────────────────────────────
+# OPTIONS (CORS プリフライト)
+# ────────────────────────────────────────────
+
+class TestPreflight:
+    def test_cors_headers(self, server: QuizServer):
+        req = urllib.request.Request(
+            f"http://127.0.0.1:{server.port}/quiz/submit", method="OPTIONS"
+        )
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            assert resp.status == 200
+            assert resp.headers["Access-Control-Allow-Origin"] == "*"
+            assert "POST" in resp.headers["Access-Control-Allow-Methods"]
+            assert resp.headers["Content-Length"] == "0"
+
+    def test_json_response_headers(self, server: QuizServer):
+        req = urllib.request.Request(
+            f"http://127.0.0.1:{server.port}/quiz/submit",
+            data=b'{"topic_key": "a.md"}',
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            body = resp.read()
+            assert resp.headers["Content-Type"] == "application/json; charset=utf-8"
+            assert resp.headers["Access-Control-Allow-Origin"] == "*"
+            assert int(resp.headers["Content-Length"]) == len(body)
+
+
+# ────────────────────────────────────────────
+# アクセスログ
+# ────────────────────────────────────────────
+
+class TestAccessLog:
+    def test_logged_at_debug(self, server: QuizServer, caplog):
+        with caplog.at_level(logging.DEBUG, logger="app.quiz_server"):
+            _post(server.port, "/quiz/submit", b'{"topic_key": "a.md"}')
+        assert any('"POST /quiz/submit HTTP/1.1" 200' in r.getMessage() for r in caplog.records)
+
+    def test_skipped_above_debug(self, server: QuizServer, caplog):
+        with caplog.at_level(logging.INFO, logger="app.quiz_server"):
+            _post(server.port, "/quiz/submit", b'{"topic_key": "a.md"}')
+        assert not any("QuizServer:" in r.getMessage() for r in caplog.records)
+
+
+# ────────────────────────────────────────────
+# keep-alive
+# ────────────────────────────────────────────
+
+class TestKeepAlive:
+    def test_preflight_and_post_share_connection(self, server: QuizServer):
+        conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+        try:
+            conn.request("OPTIONS", "/quiz/submit")
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.status == 200
+            sock = conn.sock
+
+            conn.request(
+                "POST",
+                "/quiz/submit",
+                body=b'{"topic_key": "a.md", "q1_choice": "A"}',
+                headers={"Content-Type": "application/json"},
+            )
+            resp = conn.getresponse()
+            data = json.loads(resp.read())
+            assert resp.status == 200
+            assert data["topic_key"] == "a.md"
+            assert conn.sock is sock
+        finally:
+            conn.close()
+
+    def test_oversized_body_closes_connection(self, server: QuizServer, monkeypatch):
+        monkeypatch.setattr("app.quiz_server._MAX_BODY_BYTES", 4)
+        conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+        try:
+            conn.request(
+                "POST",
+                "/quiz/submit",
+                body=b'{"topic_key": "a.md"}',
+                headers={"Content-Type": "application/json"},
+            )
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.status == 413
+            assert resp.will_close
+        finally:
+            conn.close()
+
+
+# ────────────────────────────────────────────
+# 並行処理
+# ────────────────────────────────────────────
+
+class TestConcurrency:
+    def test_submits_are_scored_concurrently(self):
+        # 2 件の採点が同時に走らなければ Barrier がタイムアウトする
+        barrier = threading.Barrier(2, timeout=5)
+
+        def blocking_score(**kwargs: Any) -> QuizScoreResult:
+            barrier.wait()
+            return _fake_score(**kwargs)
+
+        srv = QuizServer()
+        srv.start(
+            score_func=blocking_score,
+            copilot_client=None,  # type: ignore[arg-type]
+            state_manager=None,  # type: ignore[arg-type]
+            app_config=AppConfig(),
+        )
+        try:
+            bodies = [
+                json.dumps({"topic_key": f"t{i}.md", "q1_choice": "A"}).encode()
+                for i in range(2)
+            ]
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = list(
+                    pool.map(lambda b: _post(srv.port, "/quiz/submit", b), bodies)
+                )
+        finally:
+            srv.stop()
+
+        assert [status for status, _ in results] == [200, 200]
+
+
+# ────────────────────────────────────────────
+# _json_dumps
+# ────────────────────────────────────────────
+
+class TestJsonDumps:
+    def test_stdlib_fallback_is_ascii(self, monkeypatch):
+        monkeypatch.setattr("app.quiz_server.orjson", None)
+        body = _json_dumps({"error": "採点に失敗しました"})
+        assert body.isascii()
+        assert json.loads(body) == {"error": "採点に失敗しました"}
+
+    def test_dataclass(self):
+        result = _fake_score(topic_key="a.md", q1_choice="B")
+        data = json.loads(_json_dumps(result))
+        assert data["topic_key"] == "a.md"
+        assert data["q1_correct"] is False
+
+
+# ────────────────────────────────────────────
+# _error_body
+# ────────────────────────────────────────────
+
+class TestErrorBody:
+    def test_follows_language_switch(self):
+        original = get_language()
+        try:
+            set_language("ja")
+            ja = _error_body("server.error_json_parse", get_language())
+            set_language("en")
+            en = _error_body("server.error_json_parse", get_language())
+        finally:
+            set_language(original)
+        assert json.loads(ja)["error"] == "JSON パースエラー"
+        assert json.loads(en)["error"] != json.loads(ja)["error"]
+
+    def test_cached(self):
+        assert _error_body("server.error_empty_body", "ja") is _error_body(
+            "server.error_empty_body", "ja"
+        )
@@ -2,7 +2,16 @@
 
 from pathlib import Path
 
-from app.sample_data import _SAMPLES, generate_sample_data
+import pytest
+
+from app.sample_data import (
+    _SAMPLES,
+    _SAMPLES_BY_NAME,
+    _read_sample,
+    generate_sample_data,
+    generate_sample_data_async,
+    read_sample,
+)
 
 
 # ────────────────────────────────────────────
@@ -14,28 +23,48 @@ class TestSamplesDefinition:
         """サンプルは 10 ファイル分定義されている。"""
         assert len(_SAMPLES) == 10
 
-    def test_all_samples_have_required_keys(self):
-        """各サンプルに filename, ja, en キーがある。"""
-        for i, sample in enumerate(_SAMPLES):
-            assert "filename" in sample, f"sample[{i}] missing 'filename'"
-            assert "ja" in sample, f"sample[{i}] missing 'ja'"
-            assert "en" in sample, f"sample[{i}] missing 'en'"
+    def test_all_samples_have_resources(self):
+        """各サンプルに ja / en 両方の本文ファイルがある。"""
+        for sample in _SAMPLES:
+            assert _read_sample(sample, "ja"), f"{sample.filename} missing ja"
+            assert _read_sample(sample, "en"), f"{sample.filename} missing en"
 
     def test_filenames_are_unique(self):
         """ファイル名が重複していない。"""
-        filenames = [s["filename"] for s in _SAMPLES]
+        filenames = [s.filename for s in _SAMPLES]
         assert len(filenames) == len(set(filenames))
 
     def test_filenames_end_with_md(self):
         """全ファイル名が .md で終わる。"""
         for sample in _SAMPLES:
-            assert str(sample["filename"]).endswith(".md")
+            assert sample.filename.endswith(".md")
 
     def test_content_contains_heading(self):
         """ja/en コンテンツに Markdown 見出し (#) が含まれる。"""
         for i, sample in enumerate(_SAMPLES):
-            assert "#" in str(sample["ja"]), f"sample[{i}] ja has no heading"
-            assert "#" in str(sample["en"]), f"sample[{i}] en has no heading"
+            assert b"#" in _read_sample(sample, "ja"), f"sample[{i}] ja has no heading"
+            assert b"#" in _read_sample(sample, "en"), f"sample[{i}] en has no heading"
+
+
+# ────────────────────────────────────────────
+# ファイル名による参照
+# ────────────────────────────────────────────
+
+class TestReadSample:
+    def test_lookup_by_filename(self):
+        """ファイル名でサンプル本文を取得できる。"""
+        sample = _SAMPLES[2]
+        assert read_sample(sample.filename, "en") == _read_sample(sample, "en")
+
+    def test_unknown_filename(self):
+        """未定義のファイル名は KeyError。"""
+        with pytest.raises(KeyError):
+            read_sample("missing.md", "ja")
+
+    def test_mapping_is_read_only(self):
+        """ファイル名マップは変更できない。"""
+        with pytest.raises(TypeError):
+            _SAMPLES_BY_NAME["x.md"] = _SAMPLES[0]  # type: ignore[index]
 
 
 # ────────────────────────────────────────────
@@ -54,7 +83,7 @@ class TestGenerateSampleDataJa:
     def test_content_is_japanese(self, tmp_path: Path):
         """生成されたファイルに日本語文字が含まれる。"""
         generate_sample_data(tmp_path, "ja")
-        first_file = tmp_path / _SAMPLES[0]["filename"]
+        first_file = tmp_path / _SAMPLES[0].filename
         content = first_file.read_text(encoding="utf-8")
         # 日本語のひらがな・カタカナ・漢字が含まれる
         assert any("\u3040" <= c <= "\u9fff" for c in content)
@@ -67,6 +96,14 @@ class TestGenerateSampleDataJa:
         assert target.is_dir()
 
 
+    def test_writes_resource_bytes_verbatim(self, tmp_path: Path):
+        """本文ファイルの内容がそのまま書き出される。"""
+        generate_sample_data(tmp_path, "ja")
+        for sample in _SAMPLES:
+            written = (tmp_path / sample.filename).read_bytes()
+            assert written == _read_sample(sample, "ja")
+
+
 # ────────────────────────────────────────────
 # generate_sample_data — 英語
 # ────────────────────────────────────────────
@@ -80,12 +117,25 @@ class TestGenerateSampleDataEn:
     def test_content_is_english(self, tmp_path: Path):
         """生成されたファイルに英語テキストが含まれる。"""
         generate_sample_data(tmp_path, "en")
-        first_file = tmp_path / _SAMPLES[0]["filename"]
+        first_file = tmp_path / _SAMPLES[0].filename
         content = first_file.read_text(encoding="utf-8")
         # 英語のアルファベットが含まれ、日本語文字を含まない
         assert any(c.isascii() and c.isalpha() for c in content)
 
 
+# ────────────────────────────────────────────
+# generate_sample_data_async
+# ────────────────────────────────────────────
+
+class TestGenerateSampleDataAsync:
+    async def test_returns_paths_in_definition_order(self, tmp_path: Path):
+        """並行生成しても戻り値は _SAMPLES の定義順になる。"""
+        (tmp_path / _SAMPLES[1].filename).write_text("keep", encoding="utf-8")
+        created = await generate_sample_data_async(tmp_path, "en")
+        expected = [tmp_path / s.filename for i, s in enumerate(_SAMPLES) if i != 1]
+        assert created == expected
+
+
 # ────────────────────────────────────────────
 # generate_sample_data — スキップ動作
 # ────────────────────────────────────────────
@@ -93,7 +143,7 @@ class TestGenerateSampleDataEn:
 class TestGenerateSampleDataSkip:
     def test_skips_existing_files(self, tmp_path: Path):
         """既存ファイルはスキップし、上書きしない。"""
-        first_filename = str(_SAMPLES[0]["filename"])
+        first_filename = _SAMPLES[0].filename
         existing = tmp_path / first_filename
         existing.write_text("original content", encoding="utf-8")
 
@@ -118,7 +168,7 @@ class TestGenerateSampleDataFallback:
         """未対応言語は ja にフォールバックして生成される。"""
         created = generate_sample_data(tmp_path, "fr")
         assert len(created) == 10
-        first_file = tmp_path / _SAMPLES[0]["filename"]
+        first_file = tmp_path / _SAMPLES[0].filename
         content = first_file.read_text(encoding="utf-8")
         # ja コンテンツが書き込まれていることを確認
         assert any("\u3040" <= c <= "\u9fff" for c in content)
@@ -4,13 +4,18 @@
 曜日パース、スリープ復帰監視等をテストする。
 """
 
+import threading
 import time
 from datetime import datetime
+from functools import partial
 from unittest.mock import MagicMock, patch
 
+from apscheduler.schedulers.base import STATE_RUNNING, STATE_STOPPED
+
 from app.config import AppConfig, ScheduleConfig, ScheduleEntry
 from app.scheduler import (
     Scheduler,
+    _DEFER_SECONDS,
     _WATCHDOG_INTERVAL,
     _WATCHDOG_TOLERANCE,
     _parse_day_of_week_set,
@@ -167,6 +172,108 @@ class TestCreateTrigger:
         trigger = scheduler._create_trigger(entry)
         assert str(trigger.fields[6]) == "30"
 
+    def test_same_entry_reuses_trigger(self):
+        """同じ設定のエントリでは CronTrigger が再利用される。"""
+        scheduler = Scheduler()
+        first = scheduler._create_trigger(
+            ScheduleEntry(day_of_week="mon-fri", hour="9", minute="30"),
+        )
+        second = scheduler._create_trigger(
+            ScheduleEntry(day_of_week="mon-fri", hour="9", minute="30"),
+        )
+        other = scheduler._create_trigger(
+            ScheduleEntry(day_of_week="mon-fri", hour="9", minute="45"),
+        )
+        assert first is second
+        assert other is not first
+
+
+# ────────────────────────────────────────────
+# Scheduler.update_schedule
+# ────────────────────────────────────────────
+
+
+class TestUpdateSchedule:
+    """スケジュール更新時のジョブ差し替えのテスト。"""
+
+    def test_replaces_registered_jobs(self):
+        """登録済みジョブを削除し、新しい設定のジョブだけが残る。"""
+        scheduler = Scheduler()
+        config = AppConfig(
+            schedule=ScheduleConfig(
+                feature_a=[
+                    ScheduleEntry(day_of_week="mon", hour="9", minute="0"),
+                    ScheduleEntry(day_of_week="tue", hour="9", minute="0"),
+                ],
+                feature_b=[ScheduleEntry(day_of_week="mon", hour="15", minute="0")],
+            )
+        )
+        scheduler.start(config=config, on_job_a=MagicMock(), on_job_b=MagicMock())
+
+        try:
+            scheduler._scheduler.add_job(MagicMock(), "interval", hours=1, id="other")
+            new_config = AppConfig(
+                schedule=ScheduleConfig(
+                    feature_a=[ScheduleEntry(day_of_week="wed", hour="10", minute="0")],
+                    feature_b=[],
+                    feature_c=[],
+                    feature_d=[],
+                )
+            )
+            scheduler.update_schedule(new_config)
+
+            job_ids = {j.id for j in scheduler._scheduler.get_jobs()}
+            assert job_ids == {"job_a_0", "other"}
+        finally:
+            scheduler.stop()
+
+    def test_wakes_scheduler_once(self):
+        """ジョブ数に関わらずスケジューラの起床は 1 回にまとめられる。"""
+        scheduler = Scheduler()
+        entries = [
+            ScheduleEntry(day_of_week="mon", hour=str(h), minute="0") for h in range(8, 12)
+        ]
+        config = AppConfig(schedule=ScheduleConfig(feature_a=entries, feature_b=entries))
+        scheduler.start(config=config, on_job_a=MagicMock(), on_job_b=MagicMock())
+
+        try:
+            with patch.object(scheduler._scheduler, "wakeup") as mock_wakeup:
+                scheduler.update_schedule(config)
+            mock_wakeup.assert_called_once()
+            assert scheduler._scheduler.state == STATE_RUNNING
+        finally:
+            scheduler.stop()
+
+    def test_before_start_does_not_pause(self):
+        """開始前の更新ではスケジューラを一時停止しない。"""
+        scheduler = Scheduler()
+        scheduler.update_schedule(AppConfig())
+        assert scheduler._scheduler.state == STATE_STOPPED
+
+    def test_removes_deferred_jobs(self):
+        """遅延実行ジョブもスケジュール更新で削除される。"""
+        scheduler = Scheduler()
+        config = AppConfig(
+            schedule=ScheduleConfig(
+                feature_a=[ScheduleEntry(day_of_week="mon", hour="9", minute="0")],
+                feature_b=[],
+                feature_c=[],
+                feature_d=[],
+            )
+        )
+        scheduler.start(config=config, on_job_a=MagicMock(), on_job_b=MagicMock())
+
+        try:
+            scheduler._execute("b", partial(scheduler._on_trigger, "a"))
+            assert scheduler._scheduler.get_job("job_a_deferred") is not None
+
+            scheduler.update_schedule(config)
+
+            job_ids = {j.id for j in scheduler._scheduler.get_jobs()}
+            assert job_ids == {"job_a_0"}
+        finally:
+            scheduler.stop()
+
 
 # ────────────────────────────────────────────
 # Scheduler.check_and_run_missed_jobs
@@ -396,3 +503,121 @@ class TestWatchdog:
                         mock_wakeup.assert_not_called()
         finally:
             scheduler.stop()
+
+
+# ────────────────────────────────────────────
+# Scheduler 排他制御
+# ────────────────────────────────────────────
+
+
+class TestJobInterlock:
+    """ジョブ実行中の排他・避譲のテスト。"""
+
+    def test_reentry_is_skipped_while_running(self):
+        """実行中の機能を再度実行しようとするとスキップされる。"""
+        scheduler = Scheduler()
+        inner = MagicMock()
+
+        def outer():
+            scheduler._execute("a", inner)
+
+        scheduler._execute("a", outer)
+        inner.assert_not_called()
+        assert not scheduler._locks["a"].locked()
+
+    def test_lock_released_after_error(self):
+        """コールバックが例外を送出してもロックは解放される。"""
+        scheduler = Scheduler()
+        scheduler._execute("b", MagicMock(side_effect=RuntimeError("boom")))
+        assert not scheduler._locks["b"].locked()
+
+    def test_trigger_b_deferred_while_a_running(self):
+        """機能 A 実行中に機能 B がトリガーされると遅延ジョブが登録される。"""
+        scheduler = Scheduler()
+        on_b = MagicMock()
+        scheduler._callbacks["b"] = on_b
+
+        with patch.object(scheduler._scheduler, "add_job") as mock_add:
+            scheduler._execute("a", partial(scheduler._on_trigger, "b"))
+
+        on_b.assert_not_called()
+        assert mock_add.call_args.kwargs["id"] == "job_b_deferred"
+
+    def test_defer_run_date(self):
+        """遅延実行日時はタイムゾーン付きで約 3 分後、時刻文字列はその時刻を表す。"""
+        scheduler = Scheduler()
+        before = time.time()
+        run_date, hhmmss = scheduler._defer_run_date()
+
+        assert run_date.tzinfo is not None
+        assert before + _DEFER_SECONDS <= run_date.timestamp() <= time.time() + _DEFER_SECONDS
+        assert hhmmss == run_date.astimezone().strftime("%H:%M:%S")
+
+    def test_trigger_d_deferred_while_c_running(self):
+        """機能 C 実行中に機能 D がトリガーされると遅延ジョブが登録される。"""
+        scheduler = Scheduler()
+        on_d = MagicMock()
+        scheduler._callbacks["d"] = on_d
+
+        with patch.object(scheduler._scheduler, "add_job") as mock_add:
+            scheduler._execute("c", partial(scheduler._on_trigger, "d"))
+
+        on_d.assert_not_called()
+        assert mock_add.call_args.kwargs["id"] == "job_d_deferred"
+        assert mock_add.call_args.kwargs["args"] == ("d",)
+
+    def test_trigger_c_runs_while_d_running(self):
+        """機能 C は機能 D の実行中でも遅延しない。"""
+        scheduler = Scheduler()
+        on_c = MagicMock()
+        scheduler._callbacks["c"] = on_c
+
+        scheduler._execute("d", partial(scheduler._on_trigger, "c"))
+
+        on_c.assert_called_once()
+
+    def test_run_manual_order(self):
+        """手動実行は A → B → C → D の順で、指定された機能だけを実行する。"""
+        scheduler = Scheduler()
+        calls = []
+        scheduler.run_manual(
+            ["d", "a", "c"],
+            on_job_a=lambda: calls.append("a"),
+            on_job_b=lambda: calls.append("b"),
+            on_job_c=lambda: calls.append("c"),
+            on_job_d=lambda: calls.append("d"),
+        )
+        assert calls == ["a", "c", "d"]
+
+    def test_simultaneous_a_and_b_run_only_one(self):
+        """A と B が同時にトリガーされても片方だけが実行され、もう片方は遅延される。"""
+        for _ in range(20):
+            scheduler = Scheduler()
+            release = threading.Event()
+            ran = []
+
+            def job(name):
+                ran.append(name)
+                release.wait(timeout=5)
+
+            scheduler._callbacks["a"] = partial(job, "a")
+            scheduler._callbacks["b"] = partial(job, "b")
+            barrier = threading.Barrier(2)
+
+            def fire(feature):
+                barrier.wait()
+                scheduler._on_trigger(feature)
+
+            with patch.object(scheduler._scheduler, "add_job") as mock_add:
+                threads = [threading.Thread(target=fire, args=(f,)) for f in ("a", "b")]
+                for thread in threads:
+                    thread.start()
+                deadline = time.time() + 5
+                while not (ran and mock_add.called) and time.time() < deadline:
+                    time.sleep(0.001)
+                release.set()
+                for thread in threads:
+                    thread.join()
+
+            assert len(ran) == 1
+            assert mock_add.call_count == 1
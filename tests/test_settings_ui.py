@@ -0,0 +1,205 @@
+"""settings_ui モジュールのユニットテスト（GUI を使わないヘルパーのみ）。"""
+
+import logging
+
+from app.config import AppConfig, MonitoredPage, ScheduleEntry
+from app.settings_ui import (
+    _DAY_BIT,
+    _HOURS_RE,
+    _days_to_string,
+    _is_valid_hours_input,
+    _log_setting_changes,
+    _pages_snapshot,
+    _parse_day_mask,
+    _parse_day_of_week,
+    _rebuild_schedule,
+    _schedule_snapshot,
+)
+
+
+# ────────────────────────────────────────────
+# _parse_day_of_week
+# ────────────────────────────────────────────
+
+class TestParseDayOfWeek:
+    def test_range(self):
+        assert _parse_day_of_week("mon-fri") == ["mon", "tue", "wed", "thu", "fri"]
+
+    def test_comma_separated(self):
+        assert _parse_day_of_week("mon, wed,fri") == ["mon", "wed", "fri"]
+
+    def test_wrap_around_range(self):
+        assert _parse_day_of_week("fri-mon") == ["fri", "sat", "sun", "mon"]
+
+    def test_unknown_day_ignored(self):
+        assert _parse_day_of_week("xyz") == []
+
+
+# ────────────────────────────────────────────
+# _parse_day_mask
+# ────────────────────────────────────────────
+
+class TestParseDayMask:
+    def test_weekdays(self):
+        assert _parse_day_mask("mon-fri") == 0b0011111
+
+    def test_weekend(self):
+        assert _parse_day_mask("sat,sun") == _DAY_BIT["sat"] | _DAY_BIT["sun"]
+
+    def test_wrap_around_range(self):
+        assert _parse_day_mask("fri-mon") == (
+            _DAY_BIT["fri"] | _DAY_BIT["sat"] | _DAY_BIT["sun"] | _DAY_BIT["mon"]
+        )
+
+    def test_union_across_entries(self):
+        mask = _parse_day_mask("mon,tue") | _parse_day_mask("tue-thu")
+        assert mask == 0b0001111
+
+    def test_invalid(self):
+        assert _parse_day_mask("") == 0
+        assert _parse_day_mask("foo-bar") == 0
+
+
+# ────────────────────────────────────────────
+# _days_to_string
+# ────────────────────────────────────────────
+
+class TestDaysToString:
+    def test_joins_days(self):
+        assert _days_to_string(["mon", "wed"]) == "mon,wed"
+
+    def test_empty_defaults_to_weekdays(self):
+        assert _days_to_string([]) == "mon-fri"
+
+
+# ────────────────────────────────────────────
+# _HOURS_RE
+# ────────────────────────────────────────────
+
+class TestHoursPattern:
+    def test_comma_separated_with_spaces(self):
+        assert _HOURS_RE.findall(" 9, 13 ,18 ") == ["9", "13", "18"]
+
+    def test_empty_items_skipped(self):
+        assert _HOURS_RE.findall("9,,  ,12,") == ["9", "12"]
+
+    def test_empty(self):
+        assert _HOURS_RE.findall("") == []
+
+
+# ────────────────────────────────────────────
+# _is_valid_hours_input
+# ────────────────────────────────────────────
+
+class TestIsValidHoursInput:
+    def test_digits_commas_spaces(self):
+        assert _is_valid_hours_input("9, 13,18 ")
+
+    def test_empty_allowed(self):
+        assert _is_valid_hours_input("")
+
+    def test_rejects_other_characters(self):
+        assert not _is_valid_hours_input("9a")
+        assert not _is_valid_hours_input("9-17")
+        assert not _is_valid_hours_input("*/2")
+
+
+# ────────────────────────────────────────────
+# _log_setting_changes
+# ────────────────────────────────────────────
+
+def _log_changes(config: AppConfig, **overrides):
+    """config と同じ値を旧値として _log_setting_changes を呼ぶ（overrides で上書き）。"""
+    kwargs = {"old_language": config.language}
+    for feature in ("a", "b", "c", "d"):
+        snapshot = _schedule_snapshot(getattr(config.schedule, f"feature_{feature}"))
+        kwargs[f"old_schedule_{feature}"] = snapshot
+        kwargs[f"new_schedule_{feature}"] = snapshot
+    kwargs.update({
+        "old_page_monitor_enabled": config.page_monitor.enabled,
+        "old_pages": _pages_snapshot(config.page_monitor.pages),
+        "old_feature_d_enabled": config.feature_d.enabled,
+        "old_folders": list(config.input_folders),
+        "old_notif_enabled": config.notification.enabled,
+        "old_notif_click": config.notification.open_file_on_click,
+        "old_run_at_startup": config.run_at_startup,
+    })
+    kwargs.update(overrides)
+    return _log_setting_changes(config, **kwargs)
+
+
+class TestLogSettingChanges:
+    def test_no_changes(self, caplog):
+        with caplog.at_level(logging.INFO, logger="app.settings_ui"):
+            assert _log_changes(AppConfig()) is False
+        assert "Settings saved (no changes)" in caplog.text
+
+    def test_schedule_change(self, caplog):
+        config = AppConfig()
+        old = _schedule_snapshot([ScheduleEntry(day_of_week="mon", hour="7")])
+        with caplog.at_level(logging.INFO, logger="app.settings_ui"):
+            assert _log_changes(config, old_schedule_a=old) is True
+        assert "schedule.feature_a" in caplog.text
+        assert "schedule.feature_b" not in caplog.text
+
+    def test_language_change(self, caplog):
+        config = AppConfig()
+        config.language = "en"
+        with caplog.at_level(logging.INFO, logger="app.settings_ui"):
+            _log_changes(config, old_language="ja")
+        assert "language: ja -> en" in caplog.text
+
+    def test_schedule_d_change_detected(self):
+        old = _schedule_snapshot([ScheduleEntry(day_of_week="sat", hour="10")])
+        assert _log_changes(AppConfig(), old_schedule_d=old) is True
+
+    def test_minute_change_detected(self):
+        config = AppConfig()
+        config.schedule.feature_c = [ScheduleEntry(day_of_week="mon", hour="8", minute="0")]
+        old = _schedule_snapshot([ScheduleEntry(day_of_week="mon", hour="8", minute="30")])
+        assert _log_changes(config, old_schedule_c=old) is True
+
+    def test_page_toggle_detected(self):
+        config = AppConfig()
+        config.page_monitor.pages = [MonitoredPage(url="https://example.com", enabled=False)]
+        old = (("https://example.com", True),)
+        assert _log_changes(config, old_pages=old) is True
+
+    def test_feature_d_enabled_detected(self):
+        config = AppConfig()
+        assert _log_changes(config, old_feature_d_enabled=not config.feature_d.enabled) is True
+
+    def test_change_detected_when_info_disabled(self, caplog):
+        config = AppConfig()
+        config.run_at_startup = not config.run_at_startup
+        with caplog.at_level(logging.WARNING, logger="app.settings_ui"):
+            assert _log_changes(config, old_run_at_startup=not config.run_at_startup) is True
+        assert caplog.text == ""
+
+
+class TestScheduleSnapshot:
+    def test_snapshot(self):
+        entries = [ScheduleEntry(day_of_week="mon-fri", hour="9", minute="30")]
+        assert _schedule_snapshot(entries) == (("mon-fri", "9", "30"),)
+
+
+class TestRebuildSchedule:
+    def test_unchanged_returns_same_list(self):
+        entries = [ScheduleEntry(day_of_week="mon,wed", hour="9"),
+                   ScheduleEntry(day_of_week="mon,wed", hour="13")]
+        assert _rebuild_schedule(entries, "mon,wed", ["9", "13"], "9") is entries
+
+    def test_changed_hours_rebuilds(self):
+        entries = [ScheduleEntry(day_of_week="mon", hour="9")]
+        result = _rebuild_schedule(entries, "mon", ["10"], "9")
+        assert result is not entries
+        assert _schedule_snapshot(result) == (("mon", "10", "0"),)
+
+    def test_custom_minute_rebuilds(self):
+        entries = [ScheduleEntry(day_of_week="mon", hour="9", minute="30")]
+        result = _rebuild_schedule(entries, "mon", ["9"], "9")
+        assert _schedule_snapshot(result) == (("mon", "9", "0"),)
+
+    def test_empty_hours_uses_default(self):
+        result = _rebuild_schedule([], "sat", [], "8")
+        assert _schedule_snapshot(result) == (("sat", "8", "0"),)
@@ -0,0 +1,301 @@
+"""setup_wizard モジュールのユニットテスト（GUI を使わないチェック処理のみ）。"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app import setup_wizard
+from app.config import AppConfig
+from app.state_manager import AppState, StateManager
+
+
+@pytest.fixture(autouse=True)
+def clear_check_cache():
+    """テストごとにチェック結果のキャッシュを空にする。"""
+    setup_wizard._check_cache.clear()
+    yield
+    setup_wizard._check_cache.clear()
+
+
+# ────────────────────────────────────────────
+# _cached_check
+# ────────────────────────────────────────────
+
+
+def _run_cached(name, ttl, check):
+    """_cached_check をイベントループ上で実行する。"""
+    return asyncio.run(setup_wizard._cached_check(name, ttl, check))
+
+
+class TestCachedCheck:
+    def test_success_reused_within_ttl(self):
+        calls = []
+
+        async def check() -> tuple[bool, str]:
+            calls.append(1)
+            return True, "ok"
+
+        assert _run_cached("gh", 60.0, check) == (True, "ok")
+        assert _run_cached("gh", 60.0, check) == (True, "ok")
+        assert len(calls) == 1
+
+    def test_failure_not_cached(self):
+        calls = []
+
+        async def check() -> tuple[bool, str]:
+            calls.append(1)
+            return False, "ng"
+
+        _run_cached("auth", 60.0, check)
+        _run_cached("auth", 60.0, check)
+        assert len(calls) == 2
+
+    def test_expired_entry_rechecked(self, monkeypatch: pytest.MonkeyPatch):
+        now = [1000.0]
+        monkeypatch.setattr(setup_wizard.time, "monotonic", lambda: now[0])
+        calls = []
+
+        async def check() -> tuple[bool, str]:
+            calls.append(1)
+            return True, "ok"
+
+        _run_cached("license", 300.0, check)
+        now[0] += 301.0
+        _run_cached("license", 300.0, check)
+        assert len(calls) == 2
+
+    def test_cached_result_returned(self):
+        async def check() -> tuple[bool, str]:
+            return True, "msg"
+
+        _run_cached("license", 60.0, check)
+        assert _run_cached("license", 60.0, check) == (True, "msg")
+
+
+# ────────────────────────────────────────────
+# _run_checks_async
+# ────────────────────────────────────────────
+
+
+class TestRunChecks:
+    @pytest.fixture
+    def stub_checks(self, monkeypatch: pytest.MonkeyPatch):
+        """外部コマンドを呼ぶチェックを差し替え、呼び出しを記録する。"""
+        calls: list[str] = []
+
+        def stub(name: str, result: tuple[bool, str]):
+            def check(*_args) -> tuple[bool, str]:
+                calls.append(name)
+                return result
+            return check
+
+        def astub(name: str, result: tuple[bool, str]):
+            async def check(*_args) -> tuple[bool, str]:
+                calls.append(name)
+                return result
+            return check
+
+        def install(gh: bool = True, auth: bool = True) -> list[str]:
+            monkeypatch.setattr(setup_wizard, "_check_gh_cli", stub("gh", (gh, "gh")))
+            monkeypatch.setattr(setup_wizard, "_check_gh_auth", stub("auth", (auth, "auth")))
+            monkeypatch.setattr(
+                setup_wizard, "_check_copilot_license_standalone_async", astub("license", (True, "license")),
+            )
+            return calls
+
+        return install
+
+    def test_results_in_check_order(self, stub_checks):
+        stub_checks()
+        config = AppConfig(input_folders=[])
+        results = asyncio.run(setup_wizard._run_checks_async(config, None))
+        assert [msg for _, msg in results[:3]] == ["gh", "auth", "license"]
+        assert results[3][0] is False
+
+    def test_license_skipped_when_auth_fails(self, stub_checks):
+        calls = stub_checks(auth=False)
+        results = asyncio.run(setup_wizard._run_checks_async(AppConfig(), None))
+        assert "license" not in calls
+        assert results[2][0] is False
+
+    def test_folders_checked(self, stub_checks, tmp_path):
+        stub_checks()
+        results = asyncio.run(
+            setup_wizard._run_checks_async(AppConfig(input_folders=[str(tmp_path)]), None),
+        )
+        assert results[3][0] is True
+
+    def test_recheck_ignores_cached_success(self, stub_checks):
+        calls = stub_checks()
+        asyncio.run(setup_wizard._run_checks_async(AppConfig(), None))
+        asyncio.run(setup_wizard._run_checks_async(AppConfig(), None))
+        assert calls.count("gh") == 1
+
+        asyncio.run(setup_wizard._recheck_async(AppConfig(), None))
+        assert calls.count("gh") == 2
+        assert calls.count("auth") == 2
+        assert calls.count("license") == 2
+
+
+# ────────────────────────────────────────────
+# _load_icon_data
+# ────────────────────────────────────────────
+
+
+class TestLoadIconData:
+    def test_missing_file_returns_none(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(setup_wizard, "_ICON_PATH", tmp_path / "missing.png")
+        setup_wizard._load_icon_data.cache_clear()
+        try:
+            assert setup_wizard._load_icon_data() is None
+        finally:
+            setup_wizard._load_icon_data.cache_clear()
+
+    def test_file_read_once(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        icon = tmp_path / "icon.png"
+        icon.write_bytes(b"png")
+        monkeypatch.setattr(setup_wizard, "_ICON_PATH", icon)
+        setup_wizard._load_icon_data.cache_clear()
+        try:
+            assert setup_wizard._load_icon_data() == "cG5n"
+            icon.unlink()
+            assert setup_wizard._load_icon_data() == "cG5n"
+        finally:
+            setup_wizard._load_icon_data.cache_clear()
+
+
+# ────────────────────────────────────────────
+# ライセンス確認結果の再利用（state.json）
+# ────────────────────────────────────────────
+
+
+def _make_state_manager(last_license_ok_at: str = "") -> StateManager:
+    """保存先を持たない StateManager を作る（save は何もしない）。"""
+    sm = StateManager.__new__(StateManager)
+    sm._state = AppState(last_license_ok_at=last_license_ok_at)
+    sm._path = None  # type: ignore[assignment]
+    sm.save = lambda: None  # type: ignore[method-assign]
+    return sm
+
+
+class TestSavedLicenseResult:
+    def test_within_ttl(self):
+        sm = _make_state_manager("2026-01-01T09:00:00")
+        result = setup_wizard._saved_license_result(sm, 24, now=datetime(2026, 1, 1, 20, 0))
+        assert result is not None
+        assert result[0] is True
+        assert "2026-01-01 09:00" in result[1]
+
+    def test_expired(self):
+        sm = _make_state_manager("2026-01-01T09:00:00")
+        assert setup_wizard._saved_license_result(sm, 24, now=datetime(2026, 1, 2, 9, 0)) is None
+
+    def test_disabled_or_missing(self):
+        assert setup_wizard._saved_license_result(_make_state_manager("2026-01-01T09:00:00"), 0) is None
+        assert setup_wizard._saved_license_result(_make_state_manager(), 24) is None
+
+    def test_invalid_or_future_timestamp(self):
+        now = datetime(2026, 1, 1, 9, 0)
+        assert setup_wizard._saved_license_result(_make_state_manager("broken"), 24, now=now) is None
+        assert setup_wizard._saved_license_result(
+            _make_state_manager("2026-01-02T09:00:00"), 24, now=now,
+        ) is None
+
+
+class TestRunChecksWithSavedLicense:
+    @pytest.fixture(autouse=True)
+    def stub_gh(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(setup_wizard, "_check_gh_cli", lambda: (True, "gh"))
+        monkeypatch.setattr(setup_wizard, "_check_gh_auth", lambda: (True, "auth"))
+
+    def _stub_license(self, monkeypatch: pytest.MonkeyPatch, ok: bool = True) -> list[int]:
+        calls: list[int] = []
+
+        async def check(_sdk_config) -> tuple[bool, str]:
+            calls.append(1)
+            return ok, "license"
+
+        monkeypatch.setattr(setup_wizard, "_check_copilot_license_standalone_async", check)
+        return calls
+
+    def test_recent_success_skips_client(self, monkeypatch: pytest.MonkeyPatch):
+        calls = self._stub_license(monkeypatch)
+        sm = _make_state_manager(datetime.now().isoformat(timespec="seconds"))
+        results = asyncio.run(
+            setup_wizard._run_checks_async(AppConfig(), None, sm, use_saved_license=True),
+        )
+        assert results[2][0] is True
+        assert calls == []
+
+    def test_recheck_ignores_saved_success(self, monkeypatch: pytest.MonkeyPatch):
+        calls = self._stub_license(monkeypatch)
+        sm = _make_state_manager(datetime.now().isoformat(timespec="seconds"))
+        asyncio.run(setup_wizard._run_checks_async(AppConfig(), None, sm))
+        assert calls == [1]
+
+    def test_success_recorded(self, monkeypatch: pytest.MonkeyPatch):
+        self._stub_license(monkeypatch)
+        sm = _make_state_manager()
+        asyncio.run(setup_wizard._run_checks_async(AppConfig(), None, sm, use_saved_license=True))
+        assert sm.state.last_license_ok_at != ""
+
+    def test_failure_not_recorded(self, monkeypatch: pytest.MonkeyPatch):
+        self._stub_license(monkeypatch, ok=False)
+        sm = _make_state_manager()
+        asyncio.run(setup_wizard._run_checks_async(AppConfig(), None, sm, use_saved_license=True))
+        assert sm.state.last_license_ok_at == ""
+
+
+# ────────────────────────────────────────────
+# _check_gh_cli / _check_gh_auth
+# ────────────────────────────────────────────
+
+
+class TestCheckGhCli:
+    @pytest.fixture
+    def gh_exe(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        """PATH 上の gh を tmp_path のファイルに見せかける。"""
+        exe = tmp_path / "gh"
+        exe.write_text("")
+        monkeypatch.setattr(setup_wizard.shutil, "which", lambda _name: str(exe))
+        monkeypatch.setattr(setup_wizard, "_gh_version_cache", {})
+        return exe
+
+    @pytest.fixture
+    def runs(self, monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+        """subprocess.run を差し替え、実行されたコマンドを記録する。"""
+        calls: list[list[str]] = []
+
+        def fake_run(args, **_kwargs):
+            calls.append(args)
+            return SimpleNamespace(returncode=0, stdout="gh version 2.60.0 (2024-10-01)\nhttps://x\n")
+
+        monkeypatch.setattr(setup_wizard.subprocess, "run", fake_run)
+        return calls
+
+    def test_not_installed_skips_subprocess(self, monkeypatch: pytest.MonkeyPatch, runs):
+        monkeypatch.setattr(setup_wizard.shutil, "which", lambda _name: None)
+        ok, _ = setup_wizard._check_gh_cli()
+        assert ok is False
+        assert runs == []
+
+    def test_version_cached_until_binary_changes(self, gh_exe, runs):
+        assert setup_wizard._check_gh_cli() == (True, "GitHub CLI: gh version 2.60.0 (2024-10-01)")
+        setup_wizard._check_gh_cli()
+        assert len(runs) == 1
+
+        stat = gh_exe.stat()
+        os.utime(gh_exe, (stat.st_atime, stat.st_mtime + 10))
+        setup_wizard._check_gh_cli()
+        assert len(runs) == 2
+
+    def test_auth_skipped_when_not_installed(self, monkeypatch: pytest.MonkeyPatch, runs):
+        monkeypatch.setattr(setup_wizard.shutil, "which", lambda _name: None)
+        ok, _ = setup_wizard._check_gh_auth()
+        assert ok is False
+        assert runs == []
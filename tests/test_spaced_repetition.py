@@ -38,6 +38,10 @@ class TestCalculateNextLevel:
         assert calculate_next_level(True, "good", 5, max_level=5) == 5
         assert calculate_next_level(True, "good", 2, max_level=3) == 3
 
+    def test_unknown_q2_evaluation(self):
+        assert calculate_next_level(True, "unknown", 3) == 3
+        assert calculate_next_level(False, "unknown", 3) == 0
+
     def test_custom_max_level(self):
         assert calculate_next_level(True, "good", 9, max_level=10) == 10
 
@@ -121,6 +125,16 @@ class TestGetDueTopics:
         sm = _make_state_manager_with_history({})
         assert get_due_topics(sm, today="2026-01-01") == []
 
+    def test_key_removed_outside_state_manager(self):
+        sm = _make_state_manager_with_history({
+            "topic_a": QuizHistoryEntry(next_quiz_at="2026-01-01"),
+            "topic_b": QuizHistoryEntry(next_quiz_at="2026-01-02"),
+        })
+        get_due_topics(sm, today="2026-06-01")
+        del sm.state.quiz_history["topic_a"]
+        due = get_due_topics(sm, today="2026-06-01")
+        assert [d["topic_key"] for d in due] == ["topic_b"]
+
 
 class TestBuildQuizScheduleInfo:
     def test_no_due_returns_message(self):
@@ -138,6 +152,17 @@ class TestBuildQuizScheduleInfo:
         assert "topic_a" in info
         assert "Level 2" in info
 
+    def test_last_result_formatted(self):
+        sm = _make_state_manager_with_history({
+            "topic_a": QuizHistoryEntry(
+                next_quiz_at="2026-01-01", level=1, interval_days=3,
+                results=[QuizResult(date="2025-12-29", q1_correct=False, q2_evaluation="partial")],
+            ),
+        })
+        info = build_quiz_schedule_info(sm, today="2026-06-01")
+        assert "間隔 3日" in info
+        assert "前回: Q1=不正解, Q2=partial" in info
+
 
 # ────────────────────────────────────────────
 # update_after_scoring
@@ -138,6 +138,34 @@ class TestStateManagerMutations:
         assert entry.next_quiz_at == "2026-01-08"
         assert len(entry.results) == 1
 
+    def test_get_due_quiz_keys_sorted_by_date(self):
+        sm = self._make_sm()
+        sm.state.quiz_history.update({
+            "late": QuizHistoryEntry(next_quiz_at="2026-03-01"),
+            "early": QuizHistoryEntry(next_quiz_at="2026-01-01"),
+            "future": QuizHistoryEntry(next_quiz_at="2026-12-31"),
+            "never": QuizHistoryEntry(next_quiz_at=""),
+        })
+        assert sm.get_due_quiz_keys("2026-03-01") == ["early", "late"]
+
+    def test_get_due_quiz_keys_follows_update(self):
+        sm = self._make_sm()
+        result = QuizResult(date="2026-01-01", q1_correct=True, q2_evaluation="good")
+        sm.update_quiz_history("topic1", result, new_level=0, new_interval_days=1, next_quiz_at="2026-01-02")
+        assert sm.get_due_quiz_keys("2026-01-02") == ["topic1"]
+
+        sm.update_quiz_history("topic1", result, new_level=1, new_interval_days=3, next_quiz_at="2026-01-05")
+        assert sm.get_due_quiz_keys("2026-01-02") == []
+        assert sm.get_due_quiz_keys("2026-01-05") == ["topic1"]
+
+    def test_get_due_quiz_keys_rebuilt_after_state_replaced(self):
+        sm = self._make_sm()
+        sm.state.quiz_history["old"] = QuizHistoryEntry(next_quiz_at="2026-01-01")
+        assert sm.get_due_quiz_keys("2026-01-01") == ["old"]
+
+        sm._state = AppState(quiz_history={"new": QuizHistoryEntry(next_quiz_at="2026-01-01")})
+        assert sm.get_due_quiz_keys("2026-01-01") == ["new"]
+
     def test_get_quiz_history_missing(self):
         sm = self._make_sm()
         assert sm.get_quiz_history("nonexistent") is None
@@ -2,7 +2,14 @@
 
 from pathlib import Path
 
-from app.utils import atomic_write, estimate_tokens, extract_topic_keys, safe_read_with_fallback
+from app.utils import (
+    append_text,
+    atomic_write,
+    atomic_write_bytes,
+    estimate_tokens,
+    extract_topic_keys,
+    safe_read_with_fallback,
+)
 
 
 # ────────────────────────────────────────────
@@ -73,6 +80,44 @@ class TestAtomicWrite:
         assert not tmp_file.exists()
 
 
+class TestAtomicWriteBytes:
+    def test_writes_bytes_verbatim(self, tmp_path: Path):
+        f = tmp_path / "test.md"
+        atomic_write_bytes(f, b"line1\r\nline2\n")
+        assert f.read_bytes() == b"line1\r\nline2\n"
+
+    def test_backup_created(self, tmp_path: Path):
+        f = tmp_path / "test.md"
+        f.write_bytes(b"old")
+        atomic_write_bytes(f, b"new")
+        assert (tmp_path / "test.md.bak").read_bytes() == b"old"
+        assert not (tmp_path / "test.md.tmp").exists()
+
+
+# ────────────────────────────────────────────
+# append_text
+# ────────────────────────────────────────────
+
+class TestAppendText:
+    def test_trims_trailing_newlines(self, tmp_path: Path):
+        f = tmp_path / "test.md"
+        f.write_bytes(b"# Title\n\n\n")
+        append_text(f, "\n## Added\n\n")
+        assert f.read_text(encoding="utf-8") == "# Title\n\n## Added\n"
+
+    def test_long_newline_tail(self, tmp_path: Path):
+        f = tmp_path / "test.md"
+        f.write_bytes(b"body" + b"\n" * 1000)
+        append_text(f, "tail")
+        assert f.read_text(encoding="utf-8") == "body\n\ntail\n"
+
+    def test_empty_file(self, tmp_path: Path):
+        f = tmp_path / "test.md"
+        f.write_bytes(b"")
+        append_text(f, "tail")
+        assert f.read_text(encoding="utf-8") == "\n\ntail\n"
+
+
 # ────────────────────────────────────────────
 # safe_read_with_fallback
 # ────────────────────────────────────────────